@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from .models import User, AuditLog
+from .models import User, AuditLog, TaskRun
 
 class UserAdmin(BaseUserAdmin):
     readonly_fields = ('created_at',)
@@ -46,3 +46,10 @@ class AuditLogAdmin(admin.ModelAdmin):
     
     def has_delete_permission(self, request, obj=None):
         return False
+
+
+@admin.register(TaskRun)
+class TaskRunAdmin(admin.ModelAdmin):
+    list_display = ('task_name', 'state', 'queue', 'runtime_ms', 'queue_wait_ms', 'db_queries', 'items', 'started_at')
+    list_filter = ('task_name', 'state', 'queue')
+    date_hierarchy = 'started_at'
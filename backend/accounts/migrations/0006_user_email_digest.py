@@ -0,0 +1,18 @@
+# Generated by Django 4.2.28 on 2026-10-19 15:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_alter_auditlog_action'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='email_digest',
+            field=models.CharField(choices=[('immediate', 'Immediate'), ('hourly', 'Hourly'), ('daily', 'Daily')], default='immediate', help_text='How often workflow notification emails are bundled and sent', max_length=10),
+        ),
+    ]
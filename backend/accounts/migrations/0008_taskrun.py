@@ -0,0 +1,33 @@
+# Generated by Django 4.2.28 on 2026-10-19 16:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_auditlog_report_reset'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('task_name', models.CharField(max_length=200)),
+                ('task_id', models.CharField(max_length=255)),
+                ('queue', models.CharField(blank=True, max_length=100)),
+                ('state', models.CharField(max_length=20)),
+                ('started_at', models.DateTimeField()),
+                ('queue_wait_ms', models.FloatField(blank=True, null=True)),
+                ('runtime_ms', models.FloatField()),
+                ('db_queries', models.PositiveIntegerField(default=0)),
+                ('db_ms', models.FloatField(default=0)),
+                ('items', models.PositiveIntegerField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ['-started_at'],
+                'indexes': [models.Index(fields=['task_name', '-started_at'], name='accounts_ta_task_na_5001fe_idx'), models.Index(fields=['started_at'], name='accounts_ta_started_5321ca_idx')],
+            },
+        ),
+    ]
@@ -24,6 +24,11 @@ class User(AbstractBaseUser, PermissionsMixin):
         SUPERVISOR = 'supervisor', 'Supervisor'
         ADMIN = 'admin', 'Admin'
 
+    class EmailDigest(models.TextChoices):
+        IMMEDIATE = 'immediate', 'Immediate'
+        HOURLY = 'hourly', 'Hourly'
+        DAILY = 'daily', 'Daily'
+
     email = models.EmailField(unique=True)
     full_name = models.CharField(max_length=255)
     role = models.CharField(max_length=20, choices=Role.choices)
@@ -66,7 +71,17 @@ class User(AbstractBaseUser, PermissionsMixin):
         default=True,
         help_text="Receive deadline approaching notifications"
     )
+    email_digest = models.CharField(
+        max_length=10,
+        choices=EmailDigest.choices,
+        default=EmailDigest.IMMEDIATE,
+        help_text="How often workflow notification emails are bundled and sent"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="Timestamp of the last save; part of report list ETags, which show the name"
+    )
 
     objects = UserManager()
 
@@ -91,6 +106,10 @@ class AuditLog(models.Model):
         REPORT_PERIOD_CLOSE = 'report_period_close', 'Reporting Period Closed'
         REPORT_PERIOD_REOPEN = 'report_period_reopen', 'Reporting Period Reopened'
         REPORT_REVISION_REQUESTED = 'report_revision_requested', 'Report Revision Requested'
+        REPORT_RESET = 'report_reset', 'Report Reset to Draft'
+        WEEKLY_REMINDER = 'weekly_reminder', 'Weekly Reminders Sent'
+        DEADLINE_APPROACHING = 'deadline_approaching', 'Deadline Notices Sent'
+        OVERDUE_SUMMARY = 'overdue_summary', 'Overdue Summaries Sent'
     
     actor = models.ForeignKey(
         'accounts.User',
@@ -146,4 +165,33 @@ class AuditLog(models.Model):
             target_model=target_model,
             target_id=target_id,
             metadata=metadata
-        )    
\ No newline at end of file
+        )    
+
+class TaskRun(models.Model):
+    """
+    One Celery task invocation, written by config.task_telemetry when the
+    task finishes. A rolling window: rows older than
+    TASK_TELEMETRY_RETENTION_DAYS are pruned nightly.
+    """
+    task_name = models.CharField(max_length=200)
+    task_id = models.CharField(max_length=255)
+    queue = models.CharField(max_length=100, blank=True)
+    state = models.CharField(max_length=20)
+    started_at = models.DateTimeField()
+    # Publish (or ETA) to start; null when the message carried no publish time
+    queue_wait_ms = models.FloatField(null=True, blank=True)
+    runtime_ms = models.FloatField()
+    db_queries = models.PositiveIntegerField(default=0)
+    db_ms = models.FloatField(default=0)
+    # Rows/recipients handled, as reported by the task via record_items()
+    items = models.PositiveIntegerField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-started_at']
+        indexes = [
+            models.Index(fields=['task_name', '-started_at']),
+            models.Index(fields=['started_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.task_name} {self.state} in {self.runtime_ms:.0f} ms at {self.started_at}"
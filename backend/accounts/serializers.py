@@ -56,6 +56,7 @@ class UserProfileSerializer(serializers.ModelSerializer):
             'notify_on_report_reviewed',
             'notify_on_weekly_reminder',
             'notify_on_deadline_approaching',
+            'email_digest',
             'password_reset_required'
         ]
         read_only_fields = [
@@ -101,7 +102,8 @@ class UserProfileSerializer(serializers.ModelSerializer):
             'notify_on_comment_added',
             'notify_on_report_reviewed',
             'notify_on_weekly_reminder',
-            'notify_on_deadline_approaching'
+            'notify_on_deadline_approaching',
+            'email_digest'
         ]
         for field in notification_fields:
             if field in validated_data:
@@ -205,4 +207,5 @@ class BulkUserImportResultSerializer(serializers.Serializer):
     """Serializer for bulk import results"""
     success_count = serializers.IntegerField()
     error_count = serializers.IntegerField()
-    errors = serializers.ListField(child=serializers.CharField())     
\ No newline at end of file
+    errors = serializers.ListField(child=serializers.CharField())
+    rows = serializers.ListField(child=serializers.DictField(), required=False)    
\ No newline at end of file
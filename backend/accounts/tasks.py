@@ -0,0 +1,79 @@
+import io
+from datetime import timedelta
+from celery import chord, shared_task
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.utils import timezone
+from config.task_telemetry import record_items
+from .models import TaskRun, User
+from .utils import create_imported_users, hash_passwords, header_error_result, validate_import
+
+# Passwords per hashing task of a queued import; each takes a fraction of a
+# second to hash, so a chunk is a few seconds of work for one worker
+IMPORT_HASH_CHUNK_SIZE = 50
+
+
+@shared_task(bind=True)
+def import_users_csv(self, upload_name, actor_id=None):
+    """
+    PRD section 5.4 - Admin Panel
+    Runs a large bulk user import outside the request cycle, from the
+    upload the view saved to default_storage (already checked to be UTF-8).
+    Once the rows are validated the task replaces itself with a chord: the
+    passwords are hashed in chunks across the workers, then
+    finish_user_import writes the users. Its per-row result report is
+    stored as the result of this task's id.
+    """
+    try:
+        with default_storage.open(upload_name, 'rb') as upload:
+            stream = io.TextIOWrapper(upload, encoding='utf-8-sig', newline='')
+            rows, header_error = validate_import(stream)
+    finally:
+        default_storage.delete(upload_name)
+    if header_error:
+        return header_error_result(header_error)
+
+    # Raw passwords only go to the hashing tasks, not the final write
+    passwords = [row.pop('password') for row in rows if not row['errors']]
+    for row in rows:
+        row.pop('password', None)
+    record_items(len(rows))
+    if not passwords:
+        # Nothing to write, only row errors to report
+        return create_imported_users(rows, [])
+    return self.replace(chord(
+        [
+            hash_password_chunk.s(passwords[start:start + IMPORT_HASH_CHUNK_SIZE])
+            for start in range(0, len(passwords), IMPORT_HASH_CHUNK_SIZE)
+        ],
+        finish_user_import.s(rows, actor_id)
+    ))
+
+
+@shared_task
+def hash_password_chunk(passwords):
+    """Hash one chunk of a queued import's passwords"""
+    record_items(len(passwords))
+    return hash_passwords(passwords)
+
+
+@shared_task
+def finish_user_import(hash_chunks, rows, actor_id=None):
+    """
+    Last step of import_users_csv: re-checks the validated rows against
+    the database and writes them with the hashes from hash_password_chunk
+    """
+    actor = User.objects.filter(id=actor_id).first() if actor_id else None
+    hashes = [password_hash for chunk in hash_chunks for password_hash in chunk]
+    result = create_imported_users(rows, hashes, actor=actor, recheck=True)
+    record_items(result['success_count'])
+    return result
+
+
+@shared_task
+def prune_task_runs():
+    """Deletes task telemetry older than TASK_TELEMETRY_RETENTION_DAYS"""
+    cutoff = timezone.now() - timedelta(days=settings.TASK_TELEMETRY_RETENTION_DAYS)
+    deleted = TaskRun.objects.filter(started_at__lt=cutoff).delete()[0]
+    record_items(deleted)
+    return f"Deleted {deleted} task runs"
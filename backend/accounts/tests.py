@@ -1,7 +1,17 @@
-from django.test import TestCase
+import tempfile
+import time
+import uuid
+from datetime import timedelta
+from unittest import mock
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.utils import timezone
 from rest_framework.test import APIClient
 from rest_framework import status
-from accounts.models import User
+from accounts.models import User, AuditLog, TaskRun
+from accounts.tasks import finish_user_import, import_users_csv
+from config.throttling import LoginRateThrottle
 
 
 class AuthenticationTests(TestCase):
@@ -217,3 +227,358 @@ class InitialPasswordResetTests(TestCase):
             'password': 'newpassword456'
         })
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class LoginThrottleTests(TestCase):
+    """Test cases for the sliding-window login throttle"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+            full_name='Test User',
+            role=User.Role.EMPLOYEE
+        )
+
+    def test_login_throttled_after_limit(self):
+        """Test login attempts beyond the rate are rejected with 429"""
+        with mock.patch.dict(LoginRateThrottle.THROTTLE_RATES, {'login': '3/minute'}):
+            for _ in range(3):
+                response = self.client.post('/api/v1/auth/login/', {
+                    'email': 'test@example.com',
+                    'password': 'wrongpassword'
+                })
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+            response = self.client.post('/api/v1/auth/login/', {
+                'email': 'test@example.com',
+                'password': 'testpass123'
+            })
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response.data['code'], 'THROTTLED')
+
+    def test_previous_window_is_weighted(self):
+        """Test requests from the previous window count toward the limit"""
+        with mock.patch.dict(LoginRateThrottle.THROTTLE_RATES, {'login': '4/minute'}):
+            with mock.patch.object(LoginRateThrottle, 'timer', return_value=90.0):
+                for _ in range(4):
+                    self.client.post('/api/v1/auth/login/', {
+                        'email': 'test@example.com',
+                        'password': 'wrongpassword'
+                    })
+
+            # 15s into the next window 75% of the previous window (3 requests)
+            # still counts, so only one more request is allowed.
+            with mock.patch.object(LoginRateThrottle, 'timer', return_value=135.0):
+                first = self.client.post('/api/v1/auth/login/', {
+                    'email': 'test@example.com',
+                    'password': 'testpass123'
+                })
+                second = self.client.post('/api/v1/auth/login/', {
+                    'email': 'test@example.com',
+                    'password': 'testpass123'
+                })
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+
+class BulkUserImportTests(TestCase):
+    """Test cases for bulk CSV user import"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = User.objects.create_user(
+            email='admin@example.com',
+            password='adminpass123',
+            full_name='Admin User',
+            role=User.Role.ADMIN
+        )
+        self.supervisor = User.objects.create_user(
+            email='supervisor@example.com',
+            password='supervisorpass123',
+            full_name='Supervisor User',
+            role=User.Role.SUPERVISOR
+        )
+
+    def authenticate(self, user):
+        """Helper to authenticate as a user"""
+        response = self.client.post('/api/v1/auth/login/', {
+            'email': user.email,
+            'password': f'{user.email.split("@")[0]}pass123'
+        })
+        if response.status_code == 200:
+            self.client.credentials(
+                HTTP_AUTHORIZATION=f"Bearer {response.data['access']}"
+            )
+
+    def memory_result_backend(self):
+        """Queued imports run as a chord, which registers its results with the backend even when eager"""
+        from celery.backends.cache import CacheBackend
+        from config.celery import app
+        return mock.patch.object(
+            type(app), 'backend', new_callable=mock.PropertyMock,
+            return_value=CacheBackend(app=app, backend='memory')
+        )
+
+    def upload(self, content):
+        return self.client.post(
+            '/api/v1/auth/bulk-import/',
+            {'csv_file': SimpleUploadedFile('users.csv', content.encode(), content_type='text/csv')},
+            format='multipart'
+        )
+
+    def test_import_creates_valid_rows_and_reports_errors(self):
+        """Test valid rows are created and invalid rows are reported per row"""
+        self.authenticate(self.admin)
+
+        response = self.upload(
+            "email,full_name,role,supervisor_email,password\n"
+            "ann@example.com,Ann,employee,mid@example.com,Str0ng!Pass\n"
+            "mid@example.com,Mid Lead,supervisor,lead@example.com,Str0ng!Pass\n"
+            "lead@example.com,Team Lead,supervisor,,Str0ng!Pass\n"
+            "bob@example.com,Bob,employee,supervisor@example.com,Str0ng!Pass\n"
+            "not-an-email,Bad,employee,,Str0ng!Pass\n"
+            "carl@example.com,Carl,manager,,Str0ng!Pass\n"
+            "dee@example.com,Dee,employee,nobody@example.com,Str0ng!Pass\n"
+            "supervisor@example.com,Dup,employee,,Str0ng!Pass\n"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['success_count'], 4)
+        self.assertEqual(response.data['error_count'], 4)
+        self.assertEqual(
+            [row['status'] for row in response.data['rows']],
+            ['created', 'created', 'created', 'created', 'error', 'error', 'error', 'error']
+        )
+
+        lead = User.objects.get(email='lead@example.com')
+        mid = User.objects.get(email='mid@example.com')
+        ann = User.objects.get(email='ann@example.com')
+        self.assertEqual(mid.supervisor, lead)
+        self.assertEqual(ann.supervisor, mid)
+        self.assertEqual(User.objects.get(email='bob@example.com').supervisor, self.supervisor)
+        self.assertTrue(ann.check_password('Str0ng!Pass'))
+        self.assertTrue(ann.password_reset_required)
+        self.assertEqual(
+            AuditLog.objects.filter(action=AuditLog.Action.USER_CREATE).count(), 4
+        )
+
+    def test_missing_columns_rejected(self):
+        """Test a CSV without the required columns imports nothing"""
+        self.authenticate(self.admin)
+
+        response = self.upload("email,full_name\nann@example.com,Ann\n")
+
+        self.assertEqual(response.data['success_count'], 0)
+        self.assertFalse(User.objects.filter(email='ann@example.com').exists())
+
+    def test_non_admin_cannot_import(self):
+        """Test only admins can import users"""
+        self.authenticate(self.supervisor)
+
+        response = self.upload("email,full_name,role,password\n")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(BULK_IMPORT_SYNC_MAX_BYTES=10, MEDIA_ROOT=tempfile.mkdtemp(), CACHES=LOCMEM_CACHE)
+    def test_large_file_is_queued(self):
+        """Test files above the inline limit are stored and handed to Celery by name"""
+        from django.core.files.storage import default_storage
+        self.authenticate(self.admin)
+        content = "email,full_name,role,password\nann@example.com,Ann,employee,Str0ng!Pass\n"
+
+        with mock.patch('accounts.views.import_users_csv.delay') as delay:
+            delay.return_value.id = 'task-123'
+            response = self.upload(content)
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data['task_id'], 'task-123')
+        upload_name, actor_id = delay.call_args.args
+        self.assertEqual(actor_id, self.admin.id)
+        with default_storage.open(upload_name) as upload:
+            self.assertEqual(upload.read().decode(), content)
+
+        # The worker imports the stored file and removes it
+        with self.memory_result_backend():
+            result = import_users_csv.apply(args=(upload_name, actor_id)).get()
+        self.assertEqual(result['success_count'], 1)
+        self.assertTrue(User.objects.filter(email='ann@example.com').exists())
+        self.assertFalse(default_storage.exists(upload_name))
+
+    @override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+    def test_queued_import_hashes_in_chunks(self):
+        """Test a queued import hashes its passwords in separate tasks before writing the users"""
+        from django.core.files.base import ContentFile
+        from django.core.files.storage import default_storage
+        from accounts.utils import hash_passwords
+        upload_name = default_storage.save('bulk-imports/users.csv', ContentFile(
+            "email,full_name,role,supervisor_email,password\n"
+            "ann@example.com,Ann,employee,lead@example.com,Str0ng!Pass\n"
+            "lead@example.com,Team Lead,supervisor,,An0ther!Pass\n"
+            "bob@example.com,Bob,employee,,weak\n"
+            "cat@example.com,Cat,employee,supervisor@example.com,Th1rd!Pass\n"
+        ))
+
+        with mock.patch('accounts.tasks.IMPORT_HASH_CHUNK_SIZE', 2), \
+                mock.patch('accounts.tasks.hash_passwords', wraps=hash_passwords) as hashed, \
+                self.memory_result_backend():
+            result = import_users_csv.apply(args=(upload_name, self.admin.id)).get()
+
+        self.assertEqual([len(call.args[0]) for call in hashed.call_args_list], [2, 1])
+        self.assertEqual(result['success_count'], 3)
+        self.assertEqual([row['status'] for row in result['rows']], ['created', 'created', 'error', 'created'])
+        ann = User.objects.get(email='ann@example.com')
+        self.assertEqual(ann.supervisor, User.objects.get(email='lead@example.com'))
+        self.assertTrue(ann.check_password('Str0ng!Pass'))
+        self.assertTrue(User.objects.get(email='cat@example.com').check_password('Th1rd!Pass'))
+        self.assertFalse(default_storage.exists(upload_name))
+
+    def test_queued_import_rechecks_rows_before_writing(self):
+        """Test rows whose email was taken while the passwords were hashed are reported, not inserted"""
+        rows = [
+            {'row': 2, 'email': 'ann@example.com', 'full_name': 'Ann', 'role': 'supervisor',
+             'supervisor_email': '', 'supervisor_id': None, 'errors': []},
+            {'row': 3, 'email': 'bob@example.com', 'full_name': 'Bob', 'role': 'employee',
+             'supervisor_email': 'ann@example.com', 'supervisor_id': None, 'errors': [], 'supervisor_in_file': True},
+        ]
+        User.objects.create_user(email='ann@example.com', password='x', full_name='Ann', role=User.Role.EMPLOYEE)
+
+        result = finish_user_import([['hash-ann', 'hash-bob']], rows, self.admin.id)
+
+        self.assertEqual(result['success_count'], 0)
+        self.assertEqual(result['errors'], [
+            'Row 2: email: A user with this email already exists',
+            'Row 3: supervisor_email: ann@example.com is not a supervisor',
+        ])
+        self.assertFalse(User.objects.filter(email='bob@example.com').exists())
+
+    @override_settings(BULK_IMPORT_SYNC_MAX_BYTES=10, MEDIA_ROOT=tempfile.mkdtemp())
+    def test_large_non_utf8_file_rejected(self):
+        """Test a queued upload that is not UTF-8 gets the same 400 as an inline one"""
+        self.authenticate(self.admin)
+
+        with mock.patch('accounts.views.import_users_csv.delay') as delay:
+            response = self.client.post(
+                '/api/v1/auth/bulk-import/',
+                {'csv_file': SimpleUploadedFile(
+                    'users.csv', "email,full_name\nrené@example.com,René\n".encode('latin-1'), content_type='text/csv'
+                )},
+                format='multipart'
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], 'CSV file must be UTF-8 encoded')
+        delay.assert_not_called()
+
+    @override_settings(BULK_IMPORT_SYNC_MAX_BYTES=10, MEDIA_ROOT=tempfile.mkdtemp(), CACHES=LOCMEM_CACHE)
+    def test_status_only_for_own_imports(self):
+        """Test an admin can only poll the imports they queued"""
+        other_admin = User.objects.create_user(
+            email='other@example.com', password='otherpass123', full_name='Other Admin', role=User.Role.ADMIN
+        )
+        self.authenticate(self.admin)
+        with mock.patch('accounts.views.import_users_csv.delay') as delay:
+            delay.return_value.id = 'task-123'
+            self.upload("email,full_name,role,password\nann@example.com,Ann,employee,Str0ng!Pass\n")
+
+        with mock.patch('accounts.views.import_users_csv.AsyncResult') as async_result:
+            async_result.return_value.ready.return_value = False
+            async_result.return_value.state = 'PENDING'
+            own = self.client.get('/api/v1/auth/bulk-import/task-123/')
+            unknown = self.client.get('/api/v1/auth/bulk-import/task-999/')
+            self.authenticate(other_admin)
+            others = self.client.get('/api/v1/auth/bulk-import/task-123/')
+
+        self.assertEqual(own.status_code, status.HTTP_200_OK)
+        self.assertEqual(own.data['status'], 'pending')
+        self.assertEqual(unknown.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(others.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TaskTelemetryTests(TestCase):
+    """Test cases for Celery task telemetry and the task stats endpoint"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = User.objects.create_user(
+            email='admin@example.com', password='x', full_name='Admin User', role=User.Role.ADMIN
+        )
+
+    def run_on_worker(self, task, published_seconds_ago=5, is_eager=False):
+        """Run a task the way a worker does: request context plus pre/postrun signals"""
+        from celery.signals import task_postrun, task_prerun
+        from config.task_telemetry import PUBLISHED_AT_HEADER
+
+        task_id = str(uuid.uuid4())
+        task.push_request(
+            id=task_id, is_eager=is_eager, delivery_info={'routing_key': 'periodic'},
+            **{PUBLISHED_AT_HEADER: time.time() - published_seconds_ago}
+        )
+        try:
+            task_prerun.send(sender=task, task_id=task_id, task=task, args=(), kwargs={})
+            retval = task.run()
+            task_postrun.send(
+                sender=task, task_id=task_id, task=task, args=(), kwargs={}, retval=retval, state='SUCCESS'
+            )
+        finally:
+            task.pop_request()
+        return TaskRun.objects.filter(task_id=task_id).first()
+
+    def old_run(self):
+        return TaskRun.objects.create(
+            task_name='accounts.tasks.prune_task_runs', task_id=str(uuid.uuid4()), state='SUCCESS',
+            started_at=timezone.now() - timedelta(days=30), runtime_ms=1
+        )
+
+    def test_task_run_is_recorded(self):
+        """Test queue wait, runtime, queries and items are stored per invocation"""
+        from accounts.tasks import prune_task_runs
+
+        self.old_run()
+        self.old_run()
+        run = self.run_on_worker(prune_task_runs)
+
+        self.assertEqual(run.state, 'SUCCESS')
+        self.assertEqual(run.queue, 'periodic')
+        self.assertEqual(run.items, 2)
+        self.assertGreaterEqual(run.db_queries, 1)
+        self.assertGreaterEqual(run.queue_wait_ms, 5000)
+        self.assertFalse(TaskRun.objects.filter(started_at__lt=timezone.now() - timedelta(days=1)).exists())
+
+    @override_settings(TASK_TELEMETRY_BUDGETS={'accounts.tasks.prune_task_runs': 0})
+    def test_over_budget_run_is_flagged(self):
+        """Test a run over its budget is logged and counted by the stats endpoint"""
+        from accounts.tasks import prune_task_runs
+
+        with self.assertLogs('config.perf', level='WARNING'):
+            self.run_on_worker(prune_task_runs)
+
+        self.client.force_authenticate(self.admin)
+        response = self.client.get('/api/v1/auth/task-stats/', {'task': 'accounts.tasks.prune_task_runs'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        stats = response.data['tasks'][0]
+        self.assertEqual(stats['runs'], 1)
+        self.assertEqual(stats['over_budget'], 1)
+        self.assertEqual(stats['budget_ms'], 0)
+        self.assertEqual(len(response.data['recent']), 1)
+
+    def test_eager_tasks_are_not_recorded(self):
+        """Test tasks run in-process (no queue) leave no telemetry"""
+        from accounts.tasks import prune_task_runs
+
+        self.assertIsNone(self.run_on_worker(prune_task_runs, is_eager=True))
+
+    def test_task_stats_requires_admin(self):
+        """Test non-admins cannot read task statistics"""
+        supervisor = User.objects.create_user(
+            email='supervisor@example.com', password='x', full_name='Supervisor User', role=User.Role.SUPERVISOR
+        )
+        self.client.force_authenticate(supervisor)
+        response = self.client.get('/api/v1/auth/task-stats/')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -12,5 +12,9 @@ urlpatterns = [
     path('logout/', views.LogoutView.as_view(), name='logout'),
     path('me/', views.UserProfileView.as_view(), name='user_profile'),
     path('initial-password-reset/', views.InitialPasswordResetView.as_view(), name='initial_password_reset'),
+    path('bulk-import/', views.BulkUserImportView.as_view(), name='bulk_user_import'),
+    path('bulk-import/<str:task_id>/', views.BulkUserImportStatusView.as_view(), name='bulk_user_import_status'),
+    path('task-stats/', views.TaskStatsView.as_view(), name='task_stats'),
+    path('profiles/<str:profile_id>/', views.ProfileDownloadView.as_view(), name='profile_download'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
@@ -0,0 +1,332 @@
+"""
+Utility functions for the accounts app.
+"""
+import codecs
+import csv
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+from rest_framework import serializers
+
+from reports import dashboard_cache
+from reports.provisioning import provision_employee_reports
+
+from .models import User, AuditLog
+
+# Rows per validation query and per INSERT
+IMPORT_BATCH_SIZE = 500
+
+# Queued imports: the upload is kept in default_storage under this directory
+# until the worker has read it, and the task id is remembered for the admin
+# who queued it, so only they can fetch the result
+IMPORT_UPLOAD_DIR = 'bulk-imports'
+IMPORT_TASK_KEY = 'bulk-import:{}'
+IMPORT_TASK_TTL = 24 * 60 * 60
+
+# Below this many passwords a thread pool costs more than it saves
+HASH_POOL_MIN_SIZE = 4
+
+REQUIRED_COLUMNS = ('email', 'full_name', 'role')
+
+
+def hash_passwords(passwords):
+    """
+    Hash a list of raw passwords. PBKDF2 is deliberately slow, so hashing
+    dominates a bulk import: hashlib runs it without holding the GIL, so a
+    thread pool spreads it across CPU cores without forking the web or
+    worker process. Queued imports also split it across Celery workers
+    (accounts.tasks.import_users_csv).
+    """
+    if len(passwords) < HASH_POOL_MIN_SIZE:
+        return [make_password(p) for p in passwords]
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+        return list(pool.map(make_password, passwords))
+
+
+def _check_password(value):
+    """Apply the same password rules as admin user creation"""
+    from .serializers import UserCreationSerializer
+    try:
+        UserCreationSerializer().validate_password(value)
+    except serializers.ValidationError as e:
+        return [str(msg) for msg in e.detail]
+    return []
+
+
+def is_utf8(upload):
+    """Whether an uploaded file decodes as UTF-8, checked chunk by chunk"""
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    try:
+        for chunk in upload.chunks():
+            decoder.decode(chunk)
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError:
+        return False
+    finally:
+        upload.seek(0)
+    return True
+
+
+def _parse_rows(stream):
+    """
+    Read the CSV row by row and run the checks that need no database access.
+    Returns (rows, header_error).
+    """
+    reader = csv.DictReader(stream)
+    if reader.fieldnames is None:
+        return [], "CSV file is empty"
+    reader.fieldnames = [(name or '').strip().lower() for name in reader.fieldnames]
+    missing = [col for col in REQUIRED_COLUMNS + ('password',) if col not in reader.fieldnames]
+    if missing:
+        return [], f"Missing required columns: {', '.join(missing)}"
+
+    valid_roles = set(User.Role.values)
+    seen = set()
+    rows = []
+    for line, raw in enumerate(reader, start=2):
+        email = User.objects.normalize_email((raw.get('email') or '').strip())
+        row = {
+            'row': line,
+            'email': email,
+            'full_name': (raw.get('full_name') or '').strip(),
+            'role': (raw.get('role') or '').strip().lower(),
+            'supervisor_email': User.objects.normalize_email((raw.get('supervisor_email') or '').strip()),
+            'password': raw.get('password') or '',
+            'supervisor_id': None,
+            'errors': [],
+        }
+        errors = row['errors']
+
+        try:
+            validate_email(email)
+        except DjangoValidationError:
+            errors.append(f"email: Enter a valid email address ({email or 'blank'})")
+        if email.lower() in seen:
+            errors.append("email: Duplicate email in file")
+        seen.add(email.lower())
+
+        if not row['full_name']:
+            errors.append("full_name: This field is required")
+        elif len(row['full_name']) > 255:
+            errors.append("full_name: Ensure this field has no more than 255 characters")
+
+        if row['role'] not in valid_roles:
+            errors.append(f"role: Must be one of {', '.join(sorted(valid_roles))}")
+
+        if row['supervisor_email'] and row['supervisor_email'].lower() == email.lower():
+            errors.append("supervisor_email: A user cannot supervise themselves")
+
+        if not row['password']:
+            errors.append("password: This field is required")
+        else:
+            errors.extend(f"password: {msg}" for msg in _check_password(row['password']))
+
+        rows.append(row)
+    return rows, None
+
+
+def _validate_against_database(rows):
+    """
+    Check email uniqueness and resolve supervisor references with one query
+    per batch of rows. Existing users take precedence; references to
+    supervisors defined in the same file are checked once every row has
+    been validated.
+    """
+    in_file = {r['email'].lower(): r for r in rows}
+
+    for start in range(0, len(rows), IMPORT_BATCH_SIZE):
+        batch = rows[start:start + IMPORT_BATCH_SIZE]
+        lookup = {r['email'] for r in batch}
+        lookup.update(r['supervisor_email'] for r in batch if r['supervisor_email'])
+        existing = {
+            email.lower(): (pk, role)
+            for email, pk, role in User.objects.filter(email__in=lookup).values_list('email', 'id', 'role')
+        }
+
+        for r in batch:
+            if r['email'].lower() in existing:
+                r['errors'].append("email: A user with this email already exists")
+
+            sup = r['supervisor_email'].lower()
+            if not sup:
+                continue
+            if sup in existing:
+                if existing[sup][1] != User.Role.SUPERVISOR:
+                    r['errors'].append(f"supervisor_email: {r['supervisor_email']} is not a supervisor")
+                else:
+                    r['supervisor_id'] = existing[sup][0]
+            elif sup in in_file:
+                r['supervisor_in_file'] = True
+            else:
+                r['errors'].append(f"supervisor_email: No user with email {r['supervisor_email']}")
+
+    for r in rows:
+        if r.get('supervisor_in_file') and _has_supervisor_cycle(r, in_file):
+            r['errors'].append("supervisor_email: Circular supervisor reference")
+
+    # An invalid supervisor row invalidates its reports, transitively
+    changed = True
+    while changed:
+        changed = False
+        for r in rows:
+            if not r.get('supervisor_in_file') or r['errors']:
+                continue
+            sup_row = in_file[r['supervisor_email'].lower()]
+            if sup_row['role'] != User.Role.SUPERVISOR:
+                r['errors'].append(f"supervisor_email: {r['supervisor_email']} is not a supervisor")
+                changed = True
+            elif sup_row['errors']:
+                r['errors'].append(f"supervisor_email: Row {sup_row['row']} for {r['supervisor_email']} is invalid")
+                changed = True
+
+
+def _has_supervisor_cycle(row, in_file):
+    current = row
+    for _ in range(len(in_file)):
+        if not current.get('supervisor_in_file'):
+            return False
+        current = in_file[current['supervisor_email'].lower()]
+        if current is row:
+            return True
+    return True
+
+
+def _build_user(row, password_hash, supervisor_id=None):
+    return User(
+        email=row['email'],
+        full_name=row['full_name'],
+        role=row['role'],
+        password=password_hash,
+        supervisor_id=supervisor_id or row['supervisor_id'],
+        is_active=True,
+        password_reset_required=True,  # Force password change on first login
+    )
+
+
+def _fetch_ids(emails):
+    ids = {}
+    emails = list(emails)
+    for start in range(0, len(emails), IMPORT_BATCH_SIZE):
+        chunk = emails[start:start + IMPORT_BATCH_SIZE]
+        ids.update(
+            (email.lower(), pk)
+            for email, pk in User.objects.filter(email__in=chunk).values_list('email', 'id')
+        )
+    return ids
+
+
+def validate_import(stream):
+    """
+    Parse a CSV text stream and validate every row, against the database
+    too. Returns (rows, header_error); rows with problems carry them in
+    row['errors'].
+    """
+    rows, header_error = _parse_rows(stream)
+    if not header_error:
+        _validate_against_database(rows)
+    return rows, header_error
+
+
+def header_error_result(error):
+    """The import result for a file rejected as a whole"""
+    return {'success_count': 0, 'error_count': 1, 'errors': [error], 'rows': []}
+
+
+def import_users_from_csv(stream, actor=None):
+    """
+    PRD section 5.4 - Admin Panel
+    Bulk-create users from a CSV text stream with the columns
+    email, full_name, role, password and optional supervisor_email.
+
+    Every row is validated before anything is written; rows with errors are
+    skipped and reported, the rest are inserted with bulk_create. Returns a
+    dict matching BulkUserImportResultSerializer.
+    """
+    rows, header_error = validate_import(stream)
+    if header_error:
+        return header_error_result(header_error)
+    hashes = hash_passwords([r['password'] for r in rows if not r['errors']])
+    return create_imported_users(rows, hashes, actor=actor)
+
+
+def create_imported_users(rows, hashes, actor=None, recheck=False):
+    """
+    Insert the rows that passed validate_import(), `hashes` holding their
+    password hashes in order, and return a dict matching
+    BulkUserImportResultSerializer. `recheck` repeats the database checks
+    first, for rows validated a while before they are written (an email
+    taken or a supervisor changed in the meantime).
+    """
+    valid = [r for r in rows if not r['errors']]
+    hash_by_row = dict(zip((r['row'] for r in valid), hashes))
+    if recheck:
+        for r in valid:
+            r['supervisor_id'] = None
+            r.pop('supervisor_in_file', None)
+        _validate_against_database(valid)
+        valid = [r for r in valid if not r['errors']]
+
+    # Users whose supervisor is created by this import are inserted after it,
+    # one hierarchy level per round, so its id can be looked up first.
+    pending = [(r, hash_by_row[r['row']]) for r in valid]
+    supervisor_ids = {}
+    with transaction.atomic():
+        while pending:
+            level = [
+                (r, h) for r, h in pending
+                if not r.get('supervisor_in_file') or r['supervisor_email'].lower() in supervisor_ids
+            ]
+            if not level:
+                break  # Unreachable: cycles are rejected during validation
+            pending = [
+                (r, h) for r, h in pending
+                if r.get('supervisor_in_file') and r['supervisor_email'].lower() not in supervisor_ids
+            ]
+            User.objects.bulk_create(
+                [_build_user(r, h, supervisor_ids.get(r['supervisor_email'].lower())) for r, h in level],
+                batch_size=IMPORT_BATCH_SIZE
+            )
+            needed = {r['supervisor_email'].lower() for r, _ in pending}
+            supervisor_ids.update(_fetch_ids(r['email'] for r, _ in level if r['email'].lower() in needed))
+
+        # bulk_create does not return primary keys on MySQL
+        created_ids = _fetch_ids(r['email'] for r in valid)
+        AuditLog.objects.bulk_create(
+            [
+                AuditLog(
+                    actor=actor,
+                    action=AuditLog.Action.USER_CREATE,
+                    target_model='user',
+                    target_id=str(created_ids[r['email'].lower()]),
+                    metadata={"message": "User created by bulk CSV import", "row": r['row']}
+                )
+                for r in valid
+            ],
+            batch_size=IMPORT_BATCH_SIZE
+        )
+        if valid:
+            provision_employee_reports(created_ids.values())
+            dashboard_cache.invalidate_all()
+
+    errors = [
+        f"Row {r['row']}: {msg}"
+        for r in rows for msg in r['errors']
+    ]
+    return {
+        'success_count': len(valid),
+        'error_count': len(rows) - len(valid),
+        'errors': errors,
+        'rows': [
+            {
+                'row': r['row'],
+                'email': r['email'],
+                'status': 'error' if r['errors'] else 'created',
+                'errors': r['errors'],
+            }
+            for r in rows
+        ],
+    }
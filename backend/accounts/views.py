@@ -3,19 +3,34 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.decorators import action
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.parsers import MultiPartParser
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.permissions import AllowAny, IsAuthenticated, IsAdminUser
 from django.contrib.auth import authenticate
 from functools import wraps
 import logging
 from .serializers import LoginSerializer, PasswordResetSerializer, UserProfileSerializer, UserCreationSerializer, BulkUserImportSerializer, BulkUserImportResultSerializer
-from .models import User, AuditLog
+from .models import User, AuditLog, TaskRun
 from rest_framework_simplejwt.views import TokenRefreshView
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework_simplejwt.token_blacklist.models import OutstandingToken, BlacklistedToken
 import csv
 import io
+import uuid
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.http import HttpResponse
 from django.db import transaction
+from django.db.models import Avg, Count, Max, Q, Sum
+from django.utils import timezone
+from datetime import timedelta
+from config.profiling import PROFILE_CACHE_KEY
+from config.throttling import LoginRateThrottle
+from reports import dashboard_cache
+from reports.provisioning import provision_employee_reports
+from .tasks import import_users_csv
+from .utils import IMPORT_TASK_KEY, IMPORT_TASK_TTL, IMPORT_UPLOAD_DIR, import_users_from_csv, is_utf8
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +63,7 @@ class LoginView(APIView):
     Returns JWT tokens upon successful authentication
     """
     permission_classes = [AllowAny]
+    throttle_classes = [LoginRateThrottle]
     
     def post(self, request):
         serializer = LoginSerializer(data=request.data)
@@ -198,6 +214,203 @@ class InitialPasswordResetView(APIView):
         return Response({"message": "Password successfully reset"})
 
 
+class BulkUserImportView(APIView):
+    """
+    PRD section 5.4 - Admin Panel
+    Imports users from an uploaded CSV (email, full_name, role, password,
+    supervisor_email). Small files are imported inline; larger files are
+    queued and their result is fetched from BulkUserImportStatusView.
+    """
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request):
+        if request.user.role != User.Role.ADMIN:
+            return Response(
+                {"error": "Only admins can import users"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        serializer = BulkUserImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        csv_file = serializer.validated_data['csv_file']
+
+        if csv_file.size > settings.BULK_IMPORT_SYNC_MAX_BYTES:
+            if not is_utf8(csv_file):
+                return Response(
+                    {"error": "CSV file must be UTF-8 encoded"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            # The broker only carries the storage name, not the file
+            upload_name = default_storage.save(f'{IMPORT_UPLOAD_DIR}/{uuid.uuid4().hex}.csv', csv_file)
+            task = import_users_csv.delay(upload_name, request.user.id)
+            cache.set(IMPORT_TASK_KEY.format(task.id), request.user.id, IMPORT_TASK_TTL)
+            return Response(
+                {"task_id": task.id, "status": "queued"},
+                status=status.HTTP_202_ACCEPTED
+            )
+
+        # Decode the upload incrementally instead of reading it into memory
+        stream = io.TextIOWrapper(csv_file.file, encoding='utf-8-sig', newline='')
+        try:
+            result = import_users_from_csv(stream, actor=request.user)
+        except UnicodeDecodeError:
+            return Response(
+                {"error": "CSV file must be UTF-8 encoded"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        finally:
+            stream.detach()
+
+        logger.info(f"Bulk import by {request.user.email}: {result['success_count']} created, {result['error_count']} failed")
+        return Response(BulkUserImportResultSerializer(result).data)
+
+
+class BulkUserImportStatusView(APIView):
+    """
+    PRD section 5.4 - Admin Panel
+    Returns the state of a queued bulk import and its per-row report once done
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, task_id):
+        if request.user.role != User.Role.ADMIN:
+            return Response(
+                {"error": "Only admins can import users"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        if cache.get(IMPORT_TASK_KEY.format(task_id)) != request.user.id:
+            return Response({"error": "Import not found or expired"}, status=status.HTTP_404_NOT_FOUND)
+
+        result = import_users_csv.AsyncResult(task_id)
+        if not result.ready():
+            return Response({"task_id": task_id, "status": result.state.lower()})
+        if result.failed():
+            return Response(
+                {"task_id": task_id, "status": "failed", "error": str(result.result)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        return Response({
+            "task_id": task_id,
+            "status": "completed",
+            "result": BulkUserImportResultSerializer(result.result).data
+        })
+
+
+class TaskStatsView(APIView):
+    """
+    Admin-only Celery task telemetry (config/task_telemetry.py) for the last
+    ?hours= (default 24): per task, run and failure counts, runtime and queue
+    wait, DB cost, items processed, and how many runs went over the task's
+    TASK_TELEMETRY_BUDGETS entry. ?task=<name> adds that task's latest runs.
+    """
+    permission_classes = [IsAuthenticated]
+    RECENT_RUNS = 50
+
+    def get(self, request):
+        if request.user.role != User.Role.ADMIN:
+            return Response(
+                {"error": "Only admins can view task statistics"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        try:
+            hours = int(request.query_params.get('hours', 24))
+        except ValueError:
+            return Response({"error": "hours must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+
+        runs = TaskRun.objects.filter(started_at__gte=timezone.now() - timedelta(hours=hours))
+        task_name = request.query_params.get('task')
+        if task_name:
+            runs = runs.filter(task_name=task_name)
+
+        budgets = settings.TASK_TELEMETRY_BUDGETS
+        over_budget = Q(pk__in=[])
+        for name, seconds in budgets.items():
+            over_budget |= Q(task_name=name, runtime_ms__gt=seconds * 1000)
+        stats = (
+            runs.values('task_name')
+            .annotate(
+                runs=Count('id'),
+                failures=Count('id', filter=~Q(state='SUCCESS')),
+                over_budget=Count('id', filter=over_budget),
+                runtime_avg=Avg('runtime_ms'),
+                runtime_max=Max('runtime_ms'),
+                queue_wait_avg=Avg('queue_wait_ms'),
+                queue_wait_max=Max('queue_wait_ms'),
+                db_queries_max=Max('db_queries'),
+                db_ms_avg=Avg('db_ms'),
+                items=Sum('items'),
+                last_run=Max('started_at'),
+            )
+            .order_by('task_name')
+        )
+
+        # Percentiles aren't portable SQL; runtimes arrive sorted per task
+        runtimes = {}
+        for name, runtime in runs.order_by('task_name', 'runtime_ms').values_list('task_name', 'runtime_ms'):
+            runtimes.setdefault(name, []).append(runtime)
+
+        def percentile(values, fraction):
+            return values[max(0, int(len(values) * fraction + 0.5) - 1)]
+
+        tasks = []
+        for row in stats:
+            name = row['task_name']
+            budget = budgets.get(name)
+            tasks.append({
+                'task': name,
+                'runs': row['runs'],
+                'failures': row['failures'],
+                'runtime_ms': {
+                    'avg': row['runtime_avg'],
+                    'p50': percentile(runtimes[name], 0.5),
+                    'p95': percentile(runtimes[name], 0.95),
+                    'max': row['runtime_max'],
+                },
+                'queue_wait_ms': {'avg': row['queue_wait_avg'], 'max': row['queue_wait_max']},
+                'db_queries_max': row['db_queries_max'],
+                'db_ms_avg': row['db_ms_avg'],
+                'items': row['items'],
+                'budget_ms': budget * 1000 if budget is not None else None,
+                'over_budget': row['over_budget'],
+                'last_run': row['last_run'],
+            })
+
+        data = {'hours': hours, 'tasks': tasks}
+        if task_name:
+            data['recent'] = list(runs.values(
+                'task_id', 'queue', 'state', 'started_at', 'queue_wait_ms',
+                'runtime_ms', 'db_queries', 'db_ms', 'items'
+            )[:self.RECENT_RUNS])
+        return Response(data)
+
+
+class ProfileDownloadView(APIView):
+    """
+    Admin-only download of a request profile captured by
+    config.profiling.ProfilingMiddleware, as collapsed stacks for
+    flamegraph.pl or speedscope
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, profile_id):
+        if request.user.role != User.Role.ADMIN:
+            return Response(
+                {"error": "Only admins can download profiles"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        profile = cache.get(PROFILE_CACHE_KEY.format(profile_id))
+        if profile is None:
+            return Response({"error": "Profile not found or expired"}, status=status.HTTP_404_NOT_FOUND)
+
+        response = HttpResponse(profile['collapsed'], content_type='text/plain; charset=utf-8')
+        response['Content-Disposition'] = f'attachment; filename="profile-{profile_id}.folded"'
+        response['X-Profile-Path'] = profile['path']
+        response['X-Profile-Samples'] = profile['samples']
+        return response
+
+
 class UserViewSet(viewsets.ModelViewSet):
     """
     PRD section 5.1 & 9.3
@@ -220,7 +433,19 @@ class UserViewSet(viewsets.ModelViewSet):
             return User.objects.all()
         return User.objects.filter(id=user.id)
 
-
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            user = serializer.save()
+            # Employees added mid-period still owe this period's report
+            provision_employee_reports([user.pk])
+            # Org headcount and the supervisor's team appear on dashboards
+            dashboard_cache.invalidate([user.pk], [user.supervisor_id])
+
+    def perform_destroy(self, instance):
+        user_id, supervisor_id = instance.pk, instance.supervisor_id
+        with transaction.atomic():
+            instance.delete()
+            dashboard_cache.invalidate([user_id], [supervisor_id, user_id])
 
     def perform_update(self, serializer):
         """
@@ -259,7 +484,16 @@ class UserViewSet(viewsets.ModelViewSet):
                 if old_val != new_val:
                     diff[field] = {'from': old_val, 'to': new_val}
             
+            if 'is_active' in diff or 'role' in diff:
+                # A reactivated or newly made employee owes the open period's report
+                provision_employee_reports([new_user.pk])
+
             if diff:
+                # Team membership, names and org headcount appear on dashboards
+                dashboard_cache.invalidate(
+                    [new_user.pk], [old_data['supervisor'], new_user.supervisor_id, new_user.pk]
+                )
+
                 action = AuditLog.Action.USER_UPDATE
                 if 'is_active' in diff:
                     action = AuditLog.Action.USER_DEACTIVATE if not new_user.is_active else AuditLog.Action.USER_UPDATE
@@ -317,25 +551,29 @@ class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
         if action_filter:
             qs = qs.filter(action=action_filter)
 
-        return qs.order_by('-timestamp')
+        return qs.select_related('actor').order_by('-timestamp')
+
+    @staticmethod
+    def serialize_log(log):
+        return {
+            'id': log.id,
+            'timestamp': log.timestamp,
+            'user_name': log.actor.full_name if log.actor else 'System',
+            'action': log.get_action_display(),
+            'target': f"{log.target_model} #{log.target_id}" if log.target_model else None,
+            'ip_address': log.metadata.get('ip_address') if isinstance(log.metadata, dict) else None,
+            'details': log.metadata,
+        }
 
     def list(self, request, *args, **kwargs):
         queryset = self.get_queryset()
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(queryset, request)
 
-        def serialize_log(log):
-            return {
-                'id': log.id,
-                'timestamp': log.timestamp,
-                'user_name': log.actor.full_name if log.actor else 'System',
-                'action': log.get_action_display(),
-                'target': str(log.target) if log.target else None,
-                'ip_address': log.metadata.get('ip_address') if isinstance(log.metadata, dict) else None,
-                'details': log.metadata,
-            }
-
         if page is not None:
-            return paginator.get_paginated_response([serialize_log(l) for l in page])
+            return paginator.get_paginated_response([self.serialize_log(l) for l in page])
+
+        return Response([self.serialize_log(l) for l in queryset[:100]])
 
-        return Response([serialize_log(l) for l in queryset[:100]])
+    def retrieve(self, request, *args, **kwargs):
+        return Response(self.serialize_log(self.get_object()))
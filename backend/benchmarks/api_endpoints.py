@@ -0,0 +1,141 @@
+"""
+Benchmark: latency and query counts of the hot API endpoints.
+
+Runs each case through the full Django/DRF stack in-process (APIClient with
+forced authentication, so JWT decoding is not measured) against whatever
+database is configured, and reports latency percentiles and the number of
+SQL queries per request. Seed a throwaway database first:
+
+Usage (from backend/):
+    export DB_ENGINE=django.db.backends.sqlite3 DB_NAME=/tmp/gridlog-bench.sqlite3
+    python manage.py migrate
+    python manage.py seed_large_org --employees 1000 --supervisors 50
+    python benchmarks/api_endpoints.py --iterations 30
+
+Throttle counters and dashboard payloads live in a per-process local-memory
+cache so repeated runs don't trip the daily user rate limit. The cached
+dashboard endpoints (reports/dashboard_cache.py) are reported twice: `cold`
+invalidates the cache before every request, so each one computes the
+payload; `warm` serves it from the cache.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+os.environ.setdefault('CACHE_BACKEND', 'locmem')
+
+import django
+
+django.setup()
+
+from django.db import connection
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from reports import dashboard_cache
+
+# (name, role, path)
+CASES = [
+    ('dashboard-stats employee', User.Role.EMPLOYEE, '/api/v1/reports/dashboard-stats/'),
+    ('dashboard-stats supervisor', User.Role.SUPERVISOR, '/api/v1/reports/dashboard-stats/'),
+    ('dashboard-stats admin', User.Role.ADMIN, '/api/v1/reports/dashboard-stats/'),
+    ('team-oversight', User.Role.SUPERVISOR, '/api/v1/reports/team-oversight/'),
+    ('organization-stats', User.Role.ADMIN, '/api/v1/reports/organization-stats/'),
+    ('notification list', User.Role.EMPLOYEE, '/api/v1/notifications/'),
+    ('export-csv', User.Role.ADMIN, '/api/v1/reports/export-csv/'),
+]
+
+
+def pick_users(domain):
+    """One seeded user per role; the supervisor with the largest team"""
+    seeded = User.objects.filter(email__endswith=f'@{domain}', is_active=True)
+    supervisor = (
+        seeded.filter(role=User.Role.SUPERVISOR)
+        .annotate(team=Count('team_members')).order_by('-team', 'id').first()
+    )
+    users = {
+        User.Role.SUPERVISOR: supervisor,
+        User.Role.EMPLOYEE: seeded.filter(role=User.Role.EMPLOYEE).order_by('id').first(),
+        User.Role.ADMIN: seeded.filter(role=User.Role.ADMIN).order_by('id').first(),
+    }
+    missing = [role for role, user in users.items() if user is None]
+    if missing:
+        sys.exit(f"No seeded {', '.join(missing)} users @{domain}; run manage.py seed_large_org first")
+    return users
+
+
+def percentile(values, fraction):
+    return values[max(0, int(len(values) * fraction + 0.5) - 1)]
+
+
+def is_cached(path):
+    return path.rstrip('/').rsplit('/', 1)[-1] in dashboard_cache.ENDPOINTS
+
+
+def run_case(client, path, iterations, warmup, cold=False):
+    for _ in range(warmup):
+        if cold:
+            dashboard_cache.invalidate_all()
+        client.get(path)
+
+    latencies = []
+    queries = []
+    status = None
+    for _ in range(iterations):
+        if cold:
+            # Outside a transaction the new generation is written immediately
+            dashboard_cache.invalidate_all()
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            response = client.get(path)
+            latencies.append(time.perf_counter() - started)
+        queries.append(len(captured))
+        status = response.status_code
+
+    latencies.sort()
+    return {
+        'status': status,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'queries': max(queries),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=30, help='timed requests per case')
+    parser.add_argument('--warmup', type=int, default=3, help='untimed requests per case')
+    parser.add_argument('--domain', default='bench.gridlog.test', help='email domain used by seed_large_org')
+    parser.add_argument('--case', action='append', help='only run cases whose name contains this (repeatable)')
+    args = parser.parse_args()
+
+    users = pick_users(args.domain)
+    clients = {}
+    for role, user in users.items():
+        clients[role] = APIClient(SERVER_NAME='localhost')
+        clients[role].force_authenticate(user)
+
+    team = users[User.Role.SUPERVISOR].team_members.count()
+    print(f"{connection.vendor}, {User.objects.count()} users, supervisor team of {team}, "
+          f"{args.iterations} iterations")
+    print(f"{'case':<34} {'status':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'queries':>8}")
+    for name, role, path in CASES:
+        if args.case and not any(part in name for part in args.case):
+            continue
+        runs = [(f'{name} cold', True), (f'{name} warm', False)] if is_cached(path) else [(name, False)]
+        for label, cold in runs:
+            r = run_case(clients[role], path, args.iterations, args.warmup, cold)
+            print(f"{label:<34} {r['status']:>6} {r['p50_ms']:>9.1f} {r['p95_ms']:>9.1f} "
+                  f"{r['p99_ms']:>9.1f} {r['queries']:>8}")
+
+
+if __name__ == '__main__':
+    main()
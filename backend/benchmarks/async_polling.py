@@ -0,0 +1,190 @@
+"""
+Load test: many clients polling a read endpoint over keep-alive connections.
+
+Starts uvicorn in a subprocess on the project's ASGI application (the
+async views of config/async_api.py) or, for comparison, on the WSGI
+application (sync views on uvicorn's WSGI thread pool). Then --clients
+concurrent connections, each authenticated as a different seeded
+employee, send GET --path every --interval seconds for --duration
+seconds. It reports throughput, latency percentiles and errors, and
+samples the server's thread count and RSS from /proc.
+
+The client is plain asyncio streams, so thousands of connections cost
+the load generator almost nothing. Throttle counters live in the
+server's local-memory cache, and each client is a different user, so
+the daily user rate limit is not reached.
+
+Usage (from backend/, against a seed_large_org database):
+    export DB_ENGINE=django.db.backends.sqlite3 DB_NAME=/tmp/gridlog-bench.sqlite3
+    python benchmarks/async_polling.py --clients 1000 --duration 20
+    python benchmarks/async_polling.py --interface wsgi --clients 1000
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django
+
+django.setup()
+
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.models import User
+
+# --interface -> (application, uvicorn --interface)
+APPLICATIONS = {'asgi': ('config.asgi:application', 'asgi3'), 'wsgi': ('config.wsgi:application', 'wsgi')}
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(interface, port, keep_alive):
+    env = dict(os.environ, CACHE_BACKEND='locmem', PERF_LOG_LEVEL='ERROR')
+    application, uvicorn_interface = APPLICATIONS[interface]
+    command = [
+        sys.executable, '-m', 'uvicorn', application, '--interface', uvicorn_interface,
+        '--port', str(port), '--log-level', 'warning', '--no-access-log', '--backlog', '4096',
+        '--timeout-keep-alive', str(keep_alive),
+    ]
+    return subprocess.Popen(command, cwd=BACKEND, env=env)
+
+
+async def wait_until_listening(port, server, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            sys.exit(f"uvicorn exited with {server.returncode}")
+        try:
+            _, writer = await asyncio.open_connection('127.0.0.1', port)
+        except OSError:
+            await asyncio.sleep(0.1)
+            continue
+        writer.close()
+        return
+    sys.exit("uvicorn did not start listening")
+
+
+def proc_status(pid):
+    """(threads, RSS in MB) of a running process"""
+    threads, rss_kb = 0, 0
+    with open(f'/proc/{pid}/status') as f:
+        for line in f:
+            if line.startswith('Threads:'):
+                threads = int(line.split()[1])
+            elif line.startswith('VmRSS:'):
+                rss_kb = int(line.split()[1])
+    return threads, rss_kb / 1024
+
+
+async def read_response(reader):
+    head = await reader.readuntil(b'\r\n\r\n')
+    status = int(head.split(b' ', 2)[1])
+    length = 0
+    for line in head.split(b'\r\n'):
+        if line.lower().startswith(b'content-length:'):
+            length = int(line.split(b':', 1)[1])
+    await reader.readexactly(length)
+    return status
+
+
+async def poll(port, path, token, interval, stop_at, latencies, errors):
+    request = (
+        f'GET {path} HTTP/1.1\r\nHost: localhost\r\nAuthorization: Bearer {token}\r\n\r\n'
+    ).encode()
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    # Clients' polls are spread over the interval, like browser tabs opened at different times
+    await asyncio.sleep(random.uniform(0, interval))
+    try:
+        while time.monotonic() < stop_at:
+            started = time.perf_counter()
+            writer.write(request)
+            status = await read_response(reader)
+            if status == 200:
+                latencies.append(time.perf_counter() - started)
+            else:
+                errors[status] = errors.get(status, 0) + 1
+            await asyncio.sleep(interval)
+    except (OSError, asyncio.IncompleteReadError) as exc:
+        errors[type(exc).__name__] = errors.get(type(exc).__name__, 0) + 1
+    finally:
+        writer.close()
+
+
+async def sample_server(pid, stop_at, samples):
+    while time.monotonic() < stop_at:
+        samples.append(proc_status(pid))
+        await asyncio.sleep(0.25)
+
+
+async def run(args, tokens):
+    port = free_port()
+    # Idle connections must outlive the poll interval
+    server = start_server(args.interface, port, int(args.interval) + 5)
+    try:
+        await wait_until_listening(port, server)
+        latencies, errors, samples = [], {}, []
+        stop_at = time.monotonic() + args.duration
+        started = time.perf_counter()
+        await asyncio.gather(
+            sample_server(server.pid, stop_at, samples),
+            *(poll(port, args.path, token, args.interval, stop_at, latencies, errors) for token in tokens),
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        server.terminate()
+        server.wait()
+    return latencies, errors, samples, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--interface', choices=APPLICATIONS, default='asgi')
+    parser.add_argument('--path', default='/api/v1/notifications/unread-count/')
+    parser.add_argument('--clients', type=int, default=500, help='concurrent connections, one seeded employee each')
+    parser.add_argument('--interval', type=float, default=1.0, help='seconds between one client\'s polls')
+    parser.add_argument('--duration', type=float, default=20.0)
+    parser.add_argument('--domain', default='bench.gridlog.test', help='email domain used by seed_large_org')
+    args = parser.parse_args()
+
+    users = list(
+        User.objects.filter(email__endswith=f'@{args.domain}', role=User.Role.EMPLOYEE, is_active=True)
+        .order_by('id')[:args.clients]
+    )
+    if len(users) < args.clients:
+        sys.exit(f"Only {len(users)} seeded employees @{args.domain}; seed more or lower --clients")
+    tokens = [str(AccessToken.for_user(user)) for user in users]
+
+    latencies, errors, samples, elapsed = asyncio.run(run(args, tokens))
+    latencies = sorted(ms * 1000 for ms in latencies)
+    if not latencies:
+        sys.exit(f"No successful responses; errors: {errors}")
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+
+    print(f"{args.interface} GET {args.path}: {args.clients} clients every {args.interval:g} s for {elapsed:.1f} s")
+    print(f"{'requests/s':<16} {len(latencies) / elapsed:>9.1f}")
+    print(f"{'p50 ms':<16} {statistics.median(latencies):>9.1f}")
+    print(f"{'p95 ms':<16} {percentile(0.95):>9.1f}")
+    print(f"{'p99 ms':<16} {percentile(0.99):>9.1f}")
+    print(f"{'errors':<16} {sum(errors.values()):>9}  {errors or ''}")
+    print(f"{'server threads':<16} {max(t for t, _ in samples):>9}")
+    print(f"{'server RSS MB':<16} {max(r for _, r in samples):>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+"""
+Load test: interactive notification latency during a bulk periodic run.
+
+Runs real Celery workers on the in-memory broker (solo workers, one per
+unit of concurrency, since the threads pool stalls on the memory
+transport), in a fresh process per layout: once with every task on one
+shared queue (the old setup) and once with
+settings.CELERY_TASK_ROUTES and the documented worker layout (a periodic
+worker plus an interactive/default worker, same total concurrency). A
+burst of bulk tasks routed like the reminder/period jobs is queued, then
+notification tasks are sent at a steady rate while the burst drains; the
+time from send to start of each notification is reported.
+
+Tasks are stand-ins (sleep instead of DB/email work) routed exactly like
+the real task names, so this measures queueing, not task bodies.
+
+Usage (from backend/):
+    python benchmarks/celery_queues.py --bulk 400 --bulk-ms 25 --interactive 50
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django
+
+django.setup()
+
+from celery import Celery
+from celery.contrib.testing.worker import start_worker
+from django.conf import settings
+
+from config.celery import app as project_app
+
+BULK_TASKS = [
+    'notifications.tasks.send_weekly_reminders',
+    'notifications.tasks.send_deadline_approaching',
+    'reports.tasks.auto_close_reporting_periods',
+    'accounts.tasks.import_users_csv',
+]
+# Single submit/review/comment notifications are written in the request and
+# queue no task; batch review notifications are the interactive queue's work
+INTERACTIVE_TASK = 'notifications.tasks.send_batch_workflow_notifications'
+
+
+def bench_name(name):
+    # Shared tasks attach themselves to every app under their real names,
+    # so the stand-ins need names of their own
+    return f'bench.{name}'
+
+
+def project_routes():
+    """The project's routing for each real task name, keyed by stand-in name"""
+    routes = {}
+    for name in BULK_TASKS + [INTERACTIVE_TASK]:
+        route = project_app.amqp.router.route({}, name)
+        routes[bench_name(name)] = {'queue': route['queue'].name, 'priority': route.get('priority')}
+    return routes
+
+
+# (queues, concurrency) per worker; both layouts get the same total
+LAYOUTS = {
+    'shared queue': {'routes': {}, 'workers': [(['default'], 4)]},
+    'routed queues': {
+        'routes': project_routes(),
+        'workers': [(['periodic'], 2), (['interactive', 'default'], 2)],
+    },
+}
+
+
+def build_app(routes, bulk_ms, latencies, lock):
+    app = Celery('queue-bench', broker='memory://', backend='cache+memory://')
+    app.conf.update(
+        task_default_queue=settings.CELERY_TASK_DEFAULT_QUEUE,
+        task_routes=routes,
+        worker_prefetch_multiplier=settings.CELERY_WORKER_PREFETCH_MULTIPLIER,
+        broker_transport_options={'polling_interval': 0.005},
+        task_ignore_result=True,
+    )
+
+    def bulk_task():
+        time.sleep(bulk_ms / 1000)
+
+    def interactive_task(sent_at):
+        with lock:
+            latencies.append(time.perf_counter() - sent_at)
+
+    for name in BULK_TASKS:
+        app.task(name=bench_name(name))(bulk_task)
+    app.task(name=bench_name(INTERACTIVE_TASK))(interactive_task)
+    return app
+
+
+def run(name, bulk, bulk_ms, interactive, interval_ms):
+    logging.getLogger('celery').setLevel(logging.ERROR)
+    layout = LAYOUTS[name]
+    latencies = []
+    lock = threading.Lock()
+    app = build_app(layout['routes'], bulk_ms, latencies, lock)
+
+    workers = [
+        start_worker(app, pool='solo', queues=queues, perform_ping_check=False, loglevel='ERROR')
+        for queues, concurrency in layout['workers']
+        for _ in range(concurrency)
+    ]
+    for worker in workers:
+        worker.__enter__()
+    try:
+        for i in range(bulk):
+            app.send_task(bench_name(BULK_TASKS[i % len(BULK_TASKS)]))
+        for _ in range(interactive):
+            app.send_task(bench_name(INTERACTIVE_TASK), args=[time.perf_counter()])
+            time.sleep(interval_ms / 1000)
+
+        deadline = time.monotonic() + 120
+        while len(latencies) < interactive and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        for worker in reversed(workers):
+            worker.__exit__(None, None, None)
+
+    latencies.sort()
+    return {
+        'done': len(latencies),
+        'p50_ms': statistics.median(latencies) * 1000 if latencies else float('nan'),
+        'p95_ms': latencies[max(0, int(len(latencies) * 0.95) - 1)] * 1000 if latencies else float('nan'),
+        'max_ms': latencies[-1] * 1000 if latencies else float('nan'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--bulk', type=int, default=400, help='bulk tasks queued up front')
+    parser.add_argument('--bulk-ms', type=int, default=25, help='duration of each bulk task')
+    parser.add_argument('--interactive', type=int, default=50, help='notification tasks sent during the run')
+    parser.add_argument('--interval-ms', type=int, default=20, help='gap between notification tasks')
+    args = parser.parse_args()
+
+    print(f"{args.bulk} bulk tasks x {args.bulk_ms} ms, {args.interactive} notifications every {args.interval_ms} ms")
+    print(f"{'layout':<15} {'done':>6} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    # The memory transport's queues are process-global, so each layout gets
+    # a fresh process rather than inheriting the previous run's broker state
+    context = multiprocessing.get_context('spawn')
+    for name in LAYOUTS:
+        with context.Pool(1) as pool:
+            r = pool.apply(run, (name, args.bulk, args.bulk_ms, args.interactive, args.interval_ms))
+        print(f"{name:<15} {r['done']:>6} {r['p50_ms']:>9.1f} {r['p95_ms']:>9.1f} {r['max_ms']:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
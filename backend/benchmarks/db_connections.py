@@ -0,0 +1,99 @@
+"""
+Benchmark: per-request connection setup vs. persistent connections.
+
+Simulates N concurrent worker threads each serving M requests. Every
+"request" runs the same lifecycle Django's handlers do (close_old_connections
+on start and finish) around a small query, once with CONN_MAX_AGE=0 and once
+with persistent connections, and reports throughput, latency and how many
+connections were opened.
+
+Usage (from backend/):
+    python benchmarks/db_connections.py --threads 16 --requests 200
+
+Against SQLite the handshake is nearly free; point DB_ENGINE/DB_HOST at the
+MySQL server to see the real difference.
+"""
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django
+
+django.setup()
+
+from django.db import close_old_connections, connection, connections
+from django.db.backends.signals import connection_created
+
+
+def run(threads, requests, conn_max_age):
+    connections.settings['default']['CONN_MAX_AGE'] = conn_max_age
+    connections.close_all()
+
+    opened = []
+    lock = threading.Lock()
+
+    def on_connect(sender, connection, **kwargs):
+        with lock:
+            opened.append(connection.alias)
+
+    connection_created.connect(on_connect, weak=False)
+    latencies = []
+
+    def worker():
+        local = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            close_old_connections()
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+                cursor.fetchone()
+            close_old_connections()
+            local.append(time.perf_counter() - started)
+        connection.close()
+        with lock:
+            latencies.extend(local)
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    started = time.perf_counter()
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - started
+    connection_created.disconnect(on_connect)
+
+    latencies.sort()
+    return {
+        'conn_max_age': conn_max_age,
+        'requests': len(latencies),
+        'connections': len(opened),
+        'rps': len(latencies) / elapsed,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p95_ms': latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=200, help='requests per thread')
+    parser.add_argument('--max-age', type=int, default=60, help='CONN_MAX_AGE for the persistent run')
+    args = parser.parse_args()
+
+    print(f"{connection.vendor}: {args.threads} threads x {args.requests} requests")
+    print(f"{'CONN_MAX_AGE':>12} {'requests':>9} {'connects':>9} {'req/s':>10} {'p50 ms':>8} {'p95 ms':>8}")
+    for max_age in (0, args.max_age):
+        r = run(args.threads, args.requests, max_age)
+        print(f"{r['conn_max_age']:>12} {r['requests']:>9} {r['connections']:>9} "
+              f"{r['rps']:>10.0f} {r['p50_ms']:>8.3f} {r['p95_ms']:>8.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark: serialize and render time of a 100-row API page.
+
+Loads one page of reports (ReportSerializer, as the report list returns
+it) and one page of audit logs (raw dicts with datetimes, as the audit
+log list returns them) from the configured database, then times
+producing the page data and rendering it with DRF's JSONRenderer, the
+orjson renderer and the MessagePack renderer. The JSON renderers are
+checked to produce identical bytes first (neither page holds floats, the
+one type they write differently).
+
+Usage (from backend/, against a seed_large_org database):
+    export DB_ENGINE=django.db.backends.sqlite3 DB_NAME=/tmp/gridlog-bench.sqlite3
+    python benchmarks/renderers.py --iterations 200
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django
+
+django.setup()
+
+from rest_framework.renderers import JSONRenderer
+
+from accounts.models import AuditLog
+from accounts.views import AuditLogViewSet
+from config.renderers import MessagePackRenderer, ORJSONRenderer
+from reports.models import Report
+from reports.serializers import ReportSerializer
+
+RENDERERS = [
+    ('DRF JSONRenderer', JSONRenderer()),
+    ('ORJSONRenderer', ORJSONRenderer()),
+    ('MessagePackRenderer', MessagePackRenderer()),
+]
+
+
+def report_page(size):
+    reports = list(Report.objects.select_related('period', 'employee').order_by('-period__start_date', 'id')[:size])
+    return lambda: ReportSerializer(reports, many=True).data
+
+
+def audit_log_page(size):
+    logs = list(AuditLog.objects.select_related('actor').order_by('-timestamp')[:size])
+    return lambda: [AuditLogViewSet.serialize_log(log) for log in logs]
+
+
+def timed_ms(func, iterations):
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'page':<16} {'step':<22} {'median ms':>10} {'bytes':>8}")
+    for name, build in [('reports', report_page), ('audit logs', audit_log_page)]:
+        page = build(args.page_size)
+        data = page()
+        if len(data) < args.page_size:
+            sys.exit(f"Only {len(data)} {name} in the database; run seed_large_org first")
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+        print(f"{name:<16} {'serialize':<22} {timed_ms(page, args.iterations):>10.2f}")
+        for label, renderer in RENDERERS:
+            body = renderer.render(data)
+            elapsed = timed_ms(lambda: renderer.render(data), args.iterations)
+            print(f"{'':<16} {label:<22} {elapsed:>10.2f} {len(body):>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark: rows per second of the report list serializers.
+
+Compares ReportSerializer(many=True) on a select_related queryset, as
+the report list endpoints used to run it, with the read-only fast path
+(report_list_rows + report_list_data) they use now, including the query
+in both cases. The two outputs are checked to render to identical JSON
+first.
+
+Usage (from backend/, against a seed_large_org database):
+    export DB_ENGINE=django.db.backends.sqlite3 DB_NAME=/tmp/gridlog-bench.sqlite3
+    python benchmarks/report_list.py --rows 500 --iterations 20
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django
+
+django.setup()
+
+from config.renderers import ORJSONRenderer
+from reports.models import Report
+from reports.serializers import ReportSerializer, report_list_data, report_list_rows
+
+
+def timed_s(func, iterations):
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=500)
+    parser.add_argument('--iterations', type=int, default=20)
+    args = parser.parse_args()
+
+    def reports():
+        return Report.objects.select_related('period', 'employee').order_by('-period__start_date', 'id')[:args.rows]
+
+    cases = [
+        ('ReportSerializer', lambda: ReportSerializer(reports(), many=True).data),
+        ('report_list_data', lambda: report_list_data(report_list_rows(reports()))),
+    ]
+    rendered = {ORJSONRenderer().render(build()) for _, build in cases}
+    if len(rendered) != 1:
+        sys.exit("The fast path's JSON differs from ReportSerializer's")
+    rows = len(cases[0][1]())
+    if rows < args.rows:
+        sys.exit(f"Only {rows} reports in the database; run seed_large_org first")
+
+    print(f"{'serializer':<20} {'median ms':>10} {'rows/s':>10} {'speedup':>8}")
+    baseline = None
+    for name, build in cases:
+        elapsed = timed_s(build, args.iterations)
+        baseline = baseline or elapsed
+        print(f"{name:<20} {elapsed * 1000:>10.1f} {rows / elapsed:>10.0f} {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
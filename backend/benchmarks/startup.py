@@ -0,0 +1,106 @@
+"""
+Benchmark: web worker boot time and memory.
+
+Boots Django in fresh interpreters the way a web worker does (settings,
+app registry, then the URLconf, which imports every view module) and
+reports wall time, resident memory and module count after boot, whether
+ReportLab got imported (it should only load on the first PDF export, see
+reports/exports.py), and the top-level packages with the largest
+cumulative import time from `python -X importtime`.
+
+Usage (from backend/):
+    python benchmarks/startup.py --runs 10
+    python benchmarks/startup.py --preload reports.exports   # cost of importing the exports eagerly
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parent.parent
+
+# Runs in the child interpreter; prints one JSON line
+BOOT = """
+import json, os, sys, time
+started = time.perf_counter()
+import django
+django.setup()
+from django.urls import get_resolver
+get_resolver().url_patterns
+for name in {preload!r}:
+    __import__(name)
+booted = time.perf_counter() - started
+rss_kb = 0
+with open('/proc/self/status') as f:
+    for line in f:
+        if line.startswith('VmRSS:'):
+            rss_kb = int(line.split()[1])
+print(json.dumps({{
+    'boot_ms': booted * 1000,
+    'rss_mb': rss_kb / 1024,
+    'modules': len(sys.modules),
+    'reportlab': 'reportlab' in sys.modules,
+}}))
+"""
+
+
+def child_env():
+    env = dict(os.environ)
+    env.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    env.setdefault('DJANGO_SECRET_KEY', 'startup-benchmark')
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(BACKEND), env.get('PYTHONPATH')]))
+    return env
+
+
+def boot(preload, importtime=False):
+    command = [sys.executable] + (['-X', 'importtime'] if importtime else []) + ['-c', BOOT.format(preload=preload)]
+    result = subprocess.run(command, cwd=BACKEND, env=child_env(), capture_output=True, text=True)
+    if result.returncode != 0:
+        sys.exit(result.stderr)
+    return json.loads(result.stdout.strip().splitlines()[-1]), result.stderr
+
+
+def slowest_packages(importtime_output, limit):
+    """[(top-level package, cumulative ms)] from -X importtime output"""
+    totals = defaultdict(float)
+    for line in importtime_output.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Only outermost imports, so nested ones aren't counted twice
+        if cumulative.strip().isdigit() and not name.startswith('  '):
+            totals[name.strip().split('.')[0]] += int(cumulative) / 1000
+    return sorted(totals.items(), key=lambda item: -item[1])[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10, help='fresh interpreters to boot')
+    parser.add_argument('--preload', action='append', default=[], help='extra module to import after boot (repeatable)')
+    parser.add_argument('--top', type=int, default=12, help='packages to list by import time')
+    args = parser.parse_args()
+
+    boot(args.preload)  # warm the filesystem and bytecode caches
+    runs = [boot(args.preload)[0] for _ in range(args.runs)]
+    boot_ms = sorted(r['boot_ms'] for r in runs)
+    rss_mb = [r['rss_mb'] for r in runs]
+
+    print(f"{args.runs} boots{' + ' + ', '.join(args.preload) if args.preload else ''}")
+    print(f"{'boot ms p50':<16} {statistics.median(boot_ms):>8.1f}")
+    print(f"{'boot ms max':<16} {boot_ms[-1]:>8.1f}")
+    print(f"{'RSS MB p50':<16} {statistics.median(rss_mb):>8.1f}")
+    print(f"{'modules':<16} {runs[0]['modules']:>8}")
+    print(f"{'reportlab':<16} {'loaded' if runs[0]['reportlab'] else 'not loaded':>8}")
+
+    _, importtime = boot(args.preload, importtime=True)
+    print(f"\n{'package':<28} {'import ms':>9}")
+    for name, ms in slowest_packages(importtime, args.top):
+        print(f"{name:<28} {ms:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
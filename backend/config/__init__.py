@@ -1,3 +1,8 @@
 import pymysql
 
 pymysql.install_as_MySQLdb()
+
+# Load the Celery app when Django starts so shared_task uses its broker config
+from .celery import app as celery_app
+
+__all__ = ('celery_app',)
@@ -12,5 +12,9 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+# Async views run ORM calls on executor threads that are not tied to a
+# request lifecycle, so persistent connections would never be recycled.
+# Reuse under ASGI should come from a pooling proxy (e.g. ProxySQL) instead.
+os.environ.setdefault('DB_CONN_MAX_AGE', '0')
 
 application = get_asgi_application()
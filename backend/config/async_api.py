@@ -0,0 +1,115 @@
+"""
+Async read-only API views.
+
+DRF 3.16 views are synchronous: under ASGI each request to one holds a
+worker thread for its whole duration. The high-fan-in read endpoints that
+every open tab polls (notification list and unread count, dashboard
+stats, current period) are instead plain Django async views wrapped in
+@async_api_view, which re-creates the parts of the DRF pipeline they rely
+on: JWT authentication, the user rate throttle, JSON rendering (always
+JSON; MessagePack is only negotiated by DRF views), and the
+{"error", "code", "status_code"} error body of config.exceptions.
+
+The view returns data (or an HttpResponse) and should use the async ORM
+(aget, acount, aaggregate, `async for`). Serializers may be used on
+already-fetched rows as long as they don't query.
+
+Django 4.2's async ORM still runs each query on a thread: the ASGI handler
+gives every request its own thread for sync_to_async calls, and so its own
+database connection. An idle keep-alive connection costs neither, but a
+burst of polls would open one connection per request in flight, so at
+most ASYNC_API_CONCURRENCY requests per event loop get past
+authentication at once and the rest wait without a connection.
+"""
+import asyncio
+import weakref
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseBase
+from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from .exceptions import ERROR_CODES
+from .renderers import render_json
+from .throttling import UserRateThrottle
+
+
+def json_response(data, status_code=status.HTTP_200_OK):
+    # Same bytes as the DRF views' default renderer
+    return HttpResponse(render_json(data), status=status_code, content_type='application/json')
+
+
+def error_response(message, status_code):
+    return json_response(
+        {'error': message, 'code': ERROR_CODES.get(status_code, 'ERROR'), 'status_code': status_code},
+        status_code
+    )
+
+
+def _authenticate_and_throttle(request):
+    """
+    Sets request.user, or returns the 401/429 response refusing the request.
+    One function so it costs one sync_to_async hop; honours
+    APIClient.force_authenticate like DRF does.
+    """
+    user = getattr(request, '_force_auth_user', None)
+    if user is None:
+        try:
+            authenticated = JWTAuthentication().authenticate(request)
+        except AuthenticationFailed as exc:
+            detail = exc.detail.get('detail', exc.detail) if isinstance(exc.detail, dict) else exc.detail
+            return _unauthorized(detail)
+        if authenticated is None:
+            return _unauthorized('Authentication credentials were not provided.')
+        user = authenticated[0]
+    request.user = user
+
+    throttle = UserRateThrottle()
+    if throttle.allow_request(request, None):
+        return None
+    wait = throttle.wait()
+    message = 'Request was throttled.'
+    if wait is None:
+        return error_response(message, status.HTTP_429_TOO_MANY_REQUESTS)
+    response = error_response(f'{message} Expected available in {int(wait)} seconds.', status.HTTP_429_TOO_MANY_REQUESTS)
+    response['Retry-After'] = str(int(wait))
+    return response
+
+
+def _unauthorized(message):
+    response = error_response(message, status.HTTP_401_UNAUTHORIZED)
+    response['WWW-Authenticate'] = 'Bearer realm="api"'
+    return response
+
+
+# Event loop -> semaphore bounding the requests being served on it
+_slots = weakref.WeakKeyDictionary()
+
+
+def _request_slot():
+    loop = asyncio.get_running_loop()
+    slot = _slots.get(loop)
+    if slot is None:
+        slot = _slots[loop] = asyncio.Semaphore(settings.ASYNC_API_CONCURRENCY)
+    return slot
+
+
+def async_api_view(view):
+    """Authenticated, throttled GET-only async endpoint; see the module docstring"""
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            response = error_response(f'Method "{request.method}" not allowed.', status.HTTP_405_METHOD_NOT_ALLOWED)
+            response['Allow'] = 'GET, HEAD'
+            return response
+
+        async with _request_slot():
+            refused = await sync_to_async(_authenticate_and_throttle)(request)
+            if refused is not None:
+                return refused
+            result = await view(request, *args, **kwargs)
+        return result if isinstance(result, HttpResponseBase) else json_response(result)
+    return wrapper
@@ -1,6 +1,8 @@
 import os
 from celery import Celery
+from celery.signals import task_prerun, task_postrun
 from django.conf import settings
+from django.db import close_old_connections
 from celery.schedules import crontab
 
 # Set the default Django settings module for the 'celery' program.
@@ -15,6 +17,23 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 # Load task modules from all registered Django app configs.
 app.autodiscover_tasks()
 
+# Connects the per-task telemetry signal handlers
+from . import task_telemetry  # noqa: E402,F401
+
+
+@task_prerun.connect
+@task_postrun.connect
+def recycle_db_connections(sender=None, **kwargs):
+    """
+    Treat each task like a request: drop connections that are past
+    CONN_MAX_AGE or failed, and keep healthy ones for the next task.
+    """
+    if getattr(sender.request, 'is_eager', False):
+        # Eager tasks run inside the caller's connection/transaction
+        return
+    close_old_connections()
+
+
 # Configure Celery Beat schedule for periodic tasks
 app.conf.beat_schedule = {
     # PRD section 6.3: Reporting Period Rules
@@ -41,6 +60,24 @@ app.conf.beat_schedule = {
         'schedule': crontab(day_of_week='fri', hour=18, minute=0),
         'options': {'queue': 'periodic'},
     },
+    # PRD section 7: Notification System - coalesced email digests
+    'send-pending-emails': {
+        'task': 'notifications.tasks.send_pending_emails',
+        'schedule': 60.0,  # Every minute; emails wait out NOTIFICATION_COALESCE_WINDOW first
+        'options': {'queue': 'periodic'},
+    },
+    # PRD section 7: Notification System - retention
+    'compact-notifications': {
+        'task': 'notifications.tasks.compact_notifications',
+        'schedule': crontab(hour=3, minute=30),
+        'options': {'queue': 'periodic'},
+    },
+    # Rolling window of task telemetry
+    'prune-task-runs': {
+        'task': 'accounts.tasks.prune_task_runs',
+        'schedule': crontab(hour=3, minute=45),
+        'options': {'queue': 'periodic'},
+    },
     'auto-close-reporting-periods': {
         'task': 'reports.tasks.auto_close_reporting_periods',
         'schedule': crontab(minute='*/15'),  # Run every 15 minutes
@@ -2,6 +2,17 @@ from rest_framework.views import exception_handler
 from rest_framework.response import Response
 from rest_framework import status
 
+ERROR_CODES = {
+    400: 'VALIDATION_ERROR',
+    401: 'AUTHENTICATION_FAILED',
+    403: 'PERMISSION_DENIED',
+    404: 'NOT_FOUND',
+    405: 'METHOD_NOT_ALLOWED',
+    409: 'CONFLICT',
+    429: 'THROTTLED',
+    500: 'INTERNAL_ERROR',
+}
+
 def custom_exception_handler(exc, context):
     """
     Custom exception handler that standardizes error response format.
@@ -23,19 +34,9 @@ def custom_exception_handler(exc, context):
 
         # Standardize response format
         status_code = response.status_code
-        code_map = {
-            400: 'VALIDATION_ERROR',
-            401: 'AUTHENTICATION_FAILED',
-            403: 'PERMISSION_DENIED',
-            404: 'NOT_FOUND',
-            405: 'METHOD_NOT_ALLOWED',
-            409: 'CONFLICT',
-            429: 'THROTTLED',
-            500: 'INTERNAL_ERROR',
-        }
         response.data = {
             'error': error_message,
-            'code': code_map.get(status_code, 'ERROR'),
+            'code': ERROR_CODES.get(status_code, 'ERROR'),
             'status_code': status_code
         }
 
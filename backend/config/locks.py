@@ -0,0 +1,32 @@
+"""
+Best-effort mutual exclusion for periodic tasks, backed by the shared cache.
+
+cache.add() is atomic on Redis (SET NX) and memcached, so only one worker
+acquires a given key; the timeout frees it if the holder dies. This only
+keeps overlapping runs from contending; correctness still has to come from
+the database (conditional updates, row locks).
+"""
+import uuid
+from contextlib import contextmanager
+
+from django.core.cache import cache
+
+
+@contextmanager
+def cache_lock(name, timeout=300):
+    """
+    Yield True if the lock `name` was acquired, False if another run holds it.
+
+        with cache_lock('reports:auto-close') as acquired:
+            if not acquired:
+                return "Skipped: another run in progress"
+    """
+    key = f'lock:{name}'
+    token = uuid.uuid4().hex
+    acquired = cache.add(key, token, timeout)
+    try:
+        yield acquired
+    finally:
+        # Don't release a lock that expired and was taken by another run
+        if acquired and cache.get(key) == token:
+            cache.delete(key)
@@ -0,0 +1,187 @@
+"""
+Per-request performance instrumentation.
+
+RequestInstrumentationMiddleware records, for every request, the wall time,
+the number and total duration of SQL queries on the default database, the
+time spent serializing the response, and the response size. It adds a
+Server-Timing header (visible in the browser's network panel) and logs one
+JSON line to the `config.perf` logger. Requests slower than
+PERF_SLOW_REQUEST_MS are logged at WARNING with the SQL they ran.
+
+Serializer time is counted by code that opts in with serializer_timed: the
+project's renderers (config/renderers.py) and response builders that skip
+DRF serializers, such as report_list_data. Spans nested in another timed
+span are not counted again.
+
+Overhead is a perf_counter() pair per query and per timed span plus one log
+call per request, so it is meant to stay on in production;
+PERF_INSTRUMENTATION_ENABLED=False removes it from the request path.
+"""
+import contextvars
+import json
+import logging
+import time
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS, connection
+from django.db.backends.signals import connection_created
+from django.utils.functional import SimpleLazyObject
+
+logger = logging.getLogger('config.perf')
+
+# Timings of the request being handled by this thread/task, or None outside one
+_current = contextvars.ContextVar('request_timings', default=None)
+
+# Longest SQL statement kept in a slow-request log entry
+SLOW_SQL_MAX_LENGTH = 2000
+
+
+class RequestTimings:
+    """Counters for one request, filled in by the database and serializer hooks"""
+
+    __slots__ = ('queries', 'db_seconds', 'serializer_seconds', 'serializing', 'sql', 'capture_sql')
+
+    def __init__(self, capture_sql):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.serializer_seconds = 0.0
+        self.serializing = False
+        self.sql = []
+        self.capture_sql = capture_sql
+
+    def __call__(self, execute, sql, params, many, context):
+        """connection.execute_wrapper hook"""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.queries += 1
+            self.db_seconds += elapsed
+            if self.capture_sql:
+                self.sql.append((sql, elapsed))
+
+
+def _timed_execute(execute, sql, params, many, context):
+    """
+    Execute wrapper installed on every default-database connection. The
+    request's timings are found through the context rather than installed
+    per request, since under ASGI the queries of async views run on
+    sync_to_async threads, each with its own connection.
+    """
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    return timings(execute, sql, params, many, context)
+
+
+def _install_execute_wrapper(connection, **kwargs):
+    if connection.alias == DEFAULT_DB_ALIAS and _timed_execute not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_timed_execute)
+
+
+def serializer_timed(func):
+    """
+    Count the time spent in `func` as serializer time of the current
+    request. Only the outermost timed call is counted, so a timed function
+    calling another is not counted twice
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        timings = _current.get()
+        if timings is None or timings.serializing:
+            return func(*args, **kwargs)
+        timings.serializing = True
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            timings.serializer_seconds += time.perf_counter() - started
+            timings.serializing = False
+    return wrapper
+
+
+def _user_id(request):
+    """The authenticated user's id, without resolving a lazy session user (a query) just to log it"""
+    user = request.__dict__.get('user')
+    if user is None or isinstance(user, SimpleLazyObject):
+        return None
+    return user.pk
+
+
+class RequestInstrumentationMiddleware:
+    """Outermost middleware; see the module docstring"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.PERF_INSTRUMENTATION_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.slow_seconds = settings.PERF_SLOW_REQUEST_MS / 1000
+        self.capture_sql = settings.PERF_SLOW_REQUEST_MS > 0
+        connection_created.connect(_install_execute_wrapper, dispatch_uid='request-instrumentation')
+        # This thread's connection may already be open
+        _install_execute_wrapper(connection)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timings, token, started = self.begin()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, timings, time.perf_counter() - started)
+
+    async def __acall__(self, request):
+        # Under ASGI, so async views (config/async_api.py) run without a thread hop
+        timings, token, started = self.begin()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, timings, time.perf_counter() - started)
+
+    def begin(self):
+        timings = RequestTimings(self.capture_sql)
+        return timings, _current.set(timings), time.perf_counter()
+
+    def finish(self, request, response, timings, elapsed):
+        size = None if response.streaming else len(response.content)
+        response['Server-Timing'] = ', '.join([
+            f'db;dur={timings.db_seconds * 1000:.1f};desc="{timings.queries} queries"',
+            f'serialize;dur={timings.serializer_seconds * 1000:.1f}',
+            f'total;dur={elapsed * 1000:.1f}',
+        ])
+
+        slow = self.capture_sql and elapsed >= self.slow_seconds
+        level = logging.WARNING if slow else logging.INFO
+        if not logger.isEnabledFor(level):
+            return response
+
+        entry = {
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'user_id': _user_id(request),
+            'duration_ms': round(elapsed * 1000, 1),
+            'db_queries': timings.queries,
+            'db_ms': round(timings.db_seconds * 1000, 1),
+            'serializer_ms': round(timings.serializer_seconds * 1000, 1),
+            'response_bytes': size,
+        }
+        if slow:
+            entry['slow'] = True
+            entry['sql'] = [
+                {'ms': round(seconds * 1000, 2), 'sql': sql[:SLOW_SQL_MAX_LENGTH]}
+                for sql, seconds in timings.sql
+            ]
+        logger.log(level, json.dumps(entry, default=str))
+        return response
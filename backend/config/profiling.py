@@ -0,0 +1,169 @@
+"""
+On-demand request profiling.
+
+StackSampler is a pure-Python sampling profiler: a background thread reads
+the profiled thread's stack every PROFILING_SAMPLE_INTERVAL_MS and counts
+identical stacks. Its output is the collapsed ("folded") format used by
+flamegraph.pl and speedscope, one `outer;inner;leaf count` line per stack.
+
+With PROFILING_ENABLED, ProfilingMiddleware samples any request an admin
+sends with an `X-Profile: 1` header or `?profile=1`. The result is kept in
+the cache for PROFILING_TTL seconds under the id returned in the
+X-Profile-Id response header, and downloaded from
+/api/v1/auth/profiles/<id>/. Under ASGI unflagged requests pass straight
+through; a flagged one is handed to a thread, which is sampled while it
+runs the rest of the chain (sync views run on it; async views' own frames
+are not captured). `manage.py profile_endpoint` profiles a path in-process
+against seeded data.
+"""
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+
+from asgiref.sync import async_to_sync, iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+PROFILE_CACHE_KEY = 'profile:{}'
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    module = frame.f_globals.get('__name__', '?')
+    return f"{module}:{getattr(code, 'co_qualname', code.co_name)}:{code.co_firstlineno}"
+
+
+class StackSampler:
+    """
+    Samples the stack of the thread that calls start() until stop():
+
+        sampler = StackSampler(interval=0.001)
+        sampler.start()
+        ...
+        sampler.stop()
+        print(sampler.collapsed())
+
+    Several start()/stop() rounds accumulate into the same counts.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self.elapsed = 0.0
+
+    def start(self):
+        self._target = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._started = time.perf_counter()
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.elapsed += time.perf_counter() - self._started
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                if frame.f_code in _SAMPLER_CODE:
+                    # The profiled thread is starting or joining this sampler
+                    break
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            else:
+                self.stacks[';'.join(reversed(stack))] += 1
+                self.samples += 1
+
+    def collapsed(self):
+        """Folded stacks, most sampled first"""
+        return ''.join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def top_leaves(self, limit=20):
+        """[(frame, samples)] for the frames most often on top of the stack"""
+        leaves = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(';', 1)[-1]] += count
+        return leaves.most_common(limit)
+
+
+_SAMPLER_CODE = (StackSampler.start.__code__, StackSampler.stop.__code__)
+
+
+def _flagged(request):
+    flag = request.headers.get('X-Profile') or request.GET.get('profile')
+    return bool(flag) and flag != '0'
+
+
+def _admin_user(request):
+    """The admin sending a JWT with this request, if any; DRF authenticates only later, in the view"""
+    try:
+        authenticated = JWTAuthentication().authenticate(request)
+    except (AuthenticationFailed, InvalidToken):
+        return None
+    if authenticated is None:
+        return None
+    user = authenticated[0]
+    return user if user.role == user.Role.ADMIN else None
+
+
+class ProfilingMiddleware:
+    """Samples requests flagged by an admin; see the module docstring"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        user = _admin_user(request) if _flagged(request) else None
+        if user is None:
+            return self.get_response(request)
+        return self.profile(request, user, self.get_response)
+
+    async def __acall__(self, request):
+        # Unflagged requests keep async views (config/async_api.py) off threads
+        if not _flagged(request):
+            return await self.get_response(request)
+        user = await sync_to_async(_admin_user)(request)
+        if user is None:
+            return await self.get_response(request)
+        return await sync_to_async(self.profile)(request, user, async_to_sync(self.get_response))
+
+    def profile(self, request, user, get_response):
+        sampler = StackSampler(settings.PROFILING_SAMPLE_INTERVAL_MS / 1000)
+        sampler.start()
+        try:
+            response = get_response(request)
+        finally:
+            sampler.stop()
+
+        profile_id = uuid.uuid4().hex
+        cache.set(PROFILE_CACHE_KEY.format(profile_id), {
+            'method': request.method,
+            'path': request.get_full_path(),
+            'user_id': user.pk,
+            'duration_ms': round(sampler.elapsed * 1000, 1),
+            'samples': sampler.samples,
+            'collapsed': sampler.collapsed(),
+        }, settings.PROFILING_TTL)
+        response['X-Profile-Id'] = profile_id
+        return response
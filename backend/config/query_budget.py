@@ -0,0 +1,53 @@
+"""
+Query-count budgets for API tests.
+
+An endpoint that runs one query per row (an N+1) passes functional tests on
+the handful of rows a test creates and only hurts in production. These
+helpers run a request at two data sizes and fail if it needs more queries
+at the larger size, or more than its fixed budget at either.
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# Rows added before the first and second measurement
+QUERY_BUDGET_SIZES = (2, 6)
+
+
+class QueryBudgetMixin:
+    """
+    TestCase mixin. `grow(n)` adds n more of whatever the endpoint iterates
+    over (team reports, comments, notifications...) and may return an
+    argument for `request`, e.g. a fresh report for a state-changing action:
+
+        self.assertQueryBudget(
+            6,
+            grow=lambda n: self.make_team_reports(n),
+            request=lambda _: self.client.get('/api/v1/reports/team-reports/'),
+        )
+    """
+
+    def assertQueryBudget(self, budget, grow, request, sizes=QUERY_BUDGET_SIZES):
+        counts = []
+        grown = 0
+        for size in sizes:
+            target = grow(size - grown)
+            grown = size
+            with CaptureQueriesContext(connection) as captured:
+                response = request(target)
+            self.assertLess(
+                response.status_code, 400,
+                f"Query budget request failed with {response.status_code}: {getattr(response, 'data', '')}"
+            )
+            counts.append(len(captured))
+
+        queries = '\n'.join(f"  {q['sql']}" for q in captured.captured_queries)
+        self.assertLessEqual(
+            max(counts), budget,
+            f"{max(counts)} queries exceed the budget of {budget}:\n{queries}"
+        )
+        self.assertEqual(
+            counts[0], counts[-1],
+            f"Query count grows with the data ({counts[0]} queries at {sizes[0]} rows, "
+            f"{counts[-1]} at {sizes[-1]}):\n{queries}"
+        )
+        return counts
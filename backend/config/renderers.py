@@ -0,0 +1,70 @@
+"""
+Response renderers (REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES']).
+
+ORJSONRenderer matches DRF's JSONRenderer with its defaults (compact,
+UTF-8, DRF's date/time/Decimal encoding) using orjson, which serializes
+large report and audit-log pages several times faster. Values orjson can't
+encode itself go through DRF's JSONEncoder.default; anything it rejects
+outright (integers beyond 64 bits) and indented output for the browsable
+API fall back to JSONRenderer.
+
+The bytes are the same except for floats: orjson writes small magnitudes
+without a zero-padded exponent or as plain decimals (1e-7, 0.000025 where
+JSONRenderer writes 1e-07, 2.5e-05), which parse to the same values, and
+writes NaN and Infinity as null where JSONRenderer raises.
+
+MessagePackRenderer is served to clients that send
+`Accept: application/msgpack` (or `?format=msgpack`): the same structure
+as the JSON body, in a smaller binary encoding.
+
+Both count their rendering as the request's serializer time (the
+`serialize` entry of the Server-Timing header, config/middleware.py).
+"""
+import msgpack
+import orjson
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from config.middleware import serializer_timed
+
+# datetime, date, time, Decimal, lazy strings, querysets... as DRF encodes them
+_encode_default = JSONEncoder().default
+
+# Dates are passed to _encode_default: DRF writes UTC as 'Z' and keeps
+# milliseconds, orjson would write '+00:00' and microseconds
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def render_json(data):
+    """`data` as compact UTF-8 JSON, as DRF's JSONRenderer writes it (floats aside)"""
+    rendered = orjson.dumps(data, default=_encode_default, option=ORJSON_OPTIONS)
+    if b'\xe2\x80\xa8' in rendered or b'\xe2\x80\xa9' in rendered:
+        # JSONRenderer escapes U+2028/U+2029 so the output is valid JavaScript
+        rendered = rendered.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+    return rendered
+
+
+class ORJSONRenderer(JSONRenderer):
+    @serializer_timed
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}) is None:
+            try:
+                return render_json(data)
+            except orjson.JSONEncodeError:
+                pass
+        return super().render(data, accepted_media_type, renderer_context)
+
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    @serializer_timed
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=_encode_default, use_bin_type=True)
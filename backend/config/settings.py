@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 import os
+import sys
 from pathlib import Path
 from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
@@ -38,6 +39,9 @@ DEBUG = os.environ.get('DEBUG', 'False').lower() == 'true'
 
 ALLOWED_HOSTS = os.environ.get('ALLOWED_HOSTS', 'localhost,127.0.0.1').split(',')
 
+# True while running `manage.py test`
+TESTING = len(sys.argv) > 1 and sys.argv[1] == 'test'
+
 
 # Application definition
 
@@ -66,6 +70,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'config.middleware.RequestInstrumentationMiddleware',
+    'config.profiling.ProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -89,6 +95,10 @@ SECURE_HSTS_PRELOAD = True
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:9000",
 ]
+# Conditional requests on reports (ETag / If-Match) and the profiling trigger (X-Profile)
+from corsheaders.defaults import default_headers
+CORS_ALLOW_HEADERS = [*default_headers, 'if-match', 'if-none-match', 'if-unmodified-since', 'x-profile']
+CORS_EXPOSE_HEADERS = ['ETag', 'Last-Modified', 'X-Profile-Id']
 
 # Session cookie settings
 SESSION_COOKIE_SECURE = os.environ.get('SECURE_SSL_REDIRECT', 'False').lower() == 'true'
@@ -128,6 +138,13 @@ DATABASES = {
         'PASSWORD': os.environ.get('DB_PASSWORD', ''),
         'HOST': os.environ.get('DB_HOST', 'localhost'),
         'PORT': os.environ.get('DB_PORT', '3306'),
+        # Persistent connections: each web thread and Celery worker process
+        # keeps its connection for DB_CONN_MAX_AGE seconds instead of paying
+        # the TCP/auth handshake on every request or task. 0 disables reuse.
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+        # Ping a reused connection before its first query so a server-side
+        # timeout (MySQL wait_timeout) reconnects instead of erroring.
+        'CONN_HEALTH_CHECKS': os.environ.get('DB_CONN_HEALTH_CHECKS', 'True').lower() == 'true',
     }
 }
 if 'mysql' in DATABASES['default']['ENGINE']:
@@ -136,6 +153,34 @@ if 'mysql' in DATABASES['default']['ENGINE']:
         'charset': 'utf8mb4',
     }
 
+# Cache Configuration
+# Shared across web and Celery workers so throttles and cached values are
+# consistent between processes.
+REDIS_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379/1')
+if TESTING:
+    # Cache state must not leak between test cases; tests that exercise
+    # caching opt into LocMemCache with override_settings.
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+        }
+    }
+elif os.environ.get('CACHE_BACKEND') == 'locmem':
+    # Single-process development without Redis
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'gridlog',
+        }
+    }
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -189,10 +234,16 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.IsAuthenticated',
     ),
     'EXCEPTION_HANDLER': 'config.exceptions.custom_exception_handler',
+    # orjson for JSON; MessagePack for clients sending Accept: application/msgpack
+    'DEFAULT_RENDERER_CLASSES': (
+        'config.renderers.ORJSONRenderer',
+        'config.renderers.MessagePackRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
     # Rate limiting
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle'
+        'config.throttling.AnonRateThrottle',
+        'config.throttling.UserRateThrottle'
     ],
     'DEFAULT_THROTTLE_RATES': {
         'anon': '100/day',
@@ -246,9 +297,42 @@ LOGGING = {
             'level': 'INFO',
             'propagate': False,
         },
+        # One JSON line per request from config.middleware
+        'config.perf': {
+            'handlers': ['console'],
+            'level': os.environ.get('PERF_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
     },
 }
 
+# Request instrumentation (config/middleware.py): Server-Timing header and a
+# structured log line per request; requests slower than PERF_SLOW_REQUEST_MS
+# are logged at WARNING with their SQL (0 disables SQL capture)
+PERF_INSTRUMENTATION_ENABLED = os.environ.get('PERF_INSTRUMENTATION_ENABLED', 'True').lower() == 'true'
+PERF_SLOW_REQUEST_MS = int(os.environ.get('PERF_SLOW_REQUEST_MS', 1000))
+
+# On-demand profiling (config/profiling.py): when enabled, admins can send
+# `X-Profile: 1` (or ?profile=1) to have a request stack-sampled; the
+# collapsed stacks are cached for PROFILING_TTL seconds
+PROFILING_ENABLED = os.environ.get('PROFILING_ENABLED', 'False').lower() == 'true'
+PROFILING_SAMPLE_INTERVAL_MS = float(os.environ.get('PROFILING_SAMPLE_INTERVAL_MS', 1))
+PROFILING_TTL = int(os.environ.get('PROFILING_TTL', 60 * 60))
+
+# Async read endpoints (config/async_api.py): how many requests per ASGI
+# worker may be authenticating or querying at once. Django runs each
+# request's ORM calls on a thread and database connection of its own, so
+# this bounds the connections one worker opens; requests over the limit
+# wait without one
+ASYNC_API_CONCURRENCY = int(os.environ.get('ASYNC_API_CONCURRENCY', 16))
+
+# Dashboard response cache (reports/dashboard_cache.py): entries are
+# invalidated by writes and expire after DASHBOARD_CACHE_TTL seconds in any
+# case; each process adds its hit/miss counts to the shared counters every
+# DASHBOARD_CACHE_STATS_FLUSH_SECONDS
+DASHBOARD_CACHE_TTL = int(os.environ.get('DASHBOARD_CACHE_TTL', 300))
+DASHBOARD_CACHE_STATS_FLUSH_SECONDS = int(os.environ.get('DASHBOARD_CACHE_STATS_FLUSH_SECONDS', 10))
+
 # JWT settings (PRD section 5.1)
 from datetime import timedelta
 
@@ -273,6 +357,76 @@ CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 60
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
 
+# Queue topology (see SETUP.md, "Celery queues and workers"):
+#   interactive - notifications for a user action (batch review / revision requests);
+#                 single submit, review and comment notifications are written on
+#                 commit in the request (notifications/dispatch.py) and queue no task
+#   default     - anything not routed explicitly
+#   periodic    - beat jobs and bulk work (reminder blasts, period rollover, CSV import)
+# so a reminder run can never hold up a submission notification.
+CELERY_TASK_DEFAULT_QUEUE = 'default'
+CELERY_TASK_DEFAULT_PRIORITY = 3
+CELERY_TASK_ROUTES = {
+    'notifications.tasks.send_batch_workflow_notifications': {'queue': 'interactive', 'priority': 1},
+    'notifications.tasks.send_weekly_reminders': {'queue': 'periodic', 'priority': 6},
+    'notifications.tasks.send_deadline_approaching': {'queue': 'periodic', 'priority': 6},
+    'notifications.tasks.send_overdue_summary': {'queue': 'periodic', 'priority': 6},
+    'notifications.tasks.send_pending_emails': {'queue': 'periodic', 'priority': 3},
+    'notifications.tasks.compact_notifications': {'queue': 'periodic', 'priority': 9},
+    'reports.tasks.*': {'queue': 'periodic', 'priority': 3},
+    'accounts.tasks.import_users_csv': {'queue': 'periodic', 'priority': 9},
+    'accounts.tasks.hash_password_chunk': {'queue': 'periodic', 'priority': 9},
+    'accounts.tasks.finish_user_import': {'queue': 'periodic', 'priority': 9},
+    'accounts.tasks.prune_task_runs': {'queue': 'periodic', 'priority': 9},
+}
+# Redis emulates priorities with one list per step; 0 is the highest. A worker
+# consuming several queues drains them in the order given to -Q.
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    'priority_steps': list(range(10)),
+    'sep': ':',
+    'queue_order_strategy': 'priority',
+    # Must exceed CELERY_TASK_TIME_LIMIT or late-acked tasks are redelivered
+    'visibility_timeout': 2 * 60 * 60,
+}
+# Reserve one task per process so a slow job can't sit on queued work
+CELERY_WORKER_PREFETCH_MULTIPLIER = int(os.environ.get('CELERY_WORKER_PREFETCH_MULTIPLIER', 1))
+# Tasks are acknowledged on receipt (at-most-once, so no duplicate emails);
+# the idempotent period tasks opt into acks_late in reports/tasks.py
+# Celery's Django fixup force-closes DB connections around every task unless
+# this is set; config/celery.py recycles them per CONN_MAX_AGE instead, and the
+# fixup only force-closes once every CELERY_DB_REUSE_MAX tasks.
+if DATABASES['default']['CONN_MAX_AGE']:
+    CELERY_DB_REUSE_MAX = int(os.environ.get('CELERY_DB_REUSE_MAX', 1000))
+
+# Task telemetry (config/task_telemetry.py): one accounts.TaskRun row per task
+# run, kept for TASK_TELEMETRY_RETENTION_DAYS. A run longer than its budget
+# (seconds, by task name) is logged at WARNING and counted as over budget
+# by /api/v1/auth/task-stats/.
+TASK_TELEMETRY_ENABLED = os.environ.get('TASK_TELEMETRY_ENABLED', 'True').lower() == 'true'
+TASK_TELEMETRY_RETENTION_DAYS = int(os.environ.get('TASK_TELEMETRY_RETENTION_DAYS', 14))
+TASK_TELEMETRY_BUDGETS = {
+    'notifications.tasks.send_batch_workflow_notifications': 10,
+    'notifications.tasks.send_pending_emails': 30,
+    'notifications.tasks.send_weekly_reminders': 5 * 60,
+    'notifications.tasks.send_deadline_approaching': 5 * 60,
+    'notifications.tasks.send_overdue_summary': 60,
+    'notifications.tasks.compact_notifications': 15 * 60,
+    'reports.tasks.create_new_reporting_period': 5 * 60,
+    'reports.tasks.auto_close_reporting_periods': 60,
+    'accounts.tasks.import_users_csv': 60,
+    'accounts.tasks.hash_password_chunk': 60,
+    'accounts.tasks.finish_user_import': 5 * 60,
+}
+
+# Bulk user import (PRD section 5.4): uploads larger than this run as a Celery task.
+# Every row's password is hashed with PBKDF2 (a fraction of a second each), so
+# the inline limit is kept to roughly a hundred rows
+BULK_IMPORT_SYNC_MAX_BYTES = int(os.environ.get('BULK_IMPORT_SYNC_MAX_BYTES', 8 * 1024))
+
+# Default file storage; queued bulk import uploads wait here for a worker,
+# so web and worker hosts must share it
+MEDIA_ROOT = os.environ.get('MEDIA_ROOT', BASE_DIR / 'media')
+
 # Email configuration
 EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.smtp.EmailBackend')
 EMAIL_HOST = os.environ.get('EMAIL_HOST', 'smtp.gmail.com')
@@ -280,4 +434,15 @@ EMAIL_PORT = int(os.environ.get('EMAIL_PORT', 587))
 EMAIL_USE_TLS = os.environ.get('EMAIL_USE_TLS', 'True').lower() == 'true'
 EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER', '')
 EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD', '')
-DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'Gridlog <noreply@gridlog.com>')
\ No newline at end of file
+DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'Gridlog <noreply@gridlog.com>')
+
+# Notification coalescing (PRD section 7): repeat events on a report within
+# this many seconds share one in-app notification, and a recipient's emails
+# are held this long and sent as one digest
+NOTIFICATION_COALESCE_WINDOW = int(os.environ.get('NOTIFICATION_COALESCE_WINDOW', 120))
+# Local hour (TIME_ZONE) at which users on the daily email digest get theirs
+NOTIFICATION_DAILY_DIGEST_HOUR = int(os.environ.get('NOTIFICATION_DAILY_DIGEST_HOUR', 8))
+# Read notifications older than this many days are deleted by the nightly
+# compact_notifications job, in batches of NOTIFICATION_PURGE_BATCH_SIZE rows
+NOTIFICATION_RETENTION_DAYS = int(os.environ.get('NOTIFICATION_RETENTION_DAYS', 90))
+NOTIFICATION_PURGE_BATCH_SIZE = int(os.environ.get('NOTIFICATION_PURGE_BATCH_SIZE', 1000))
@@ -0,0 +1,135 @@
+"""
+Celery task telemetry.
+
+Signal handlers that record, for every task a worker runs, how long the
+message waited in the broker, how long the task ran, how many SQL queries
+it issued and how long they took, and how many items it processed. Each
+invocation becomes an accounts.TaskRun row, summarised for admins by
+/api/v1/auth/task-stats/. A run slower than its TASK_TELEMETRY_BUDGETS entry
+is also logged at WARNING.
+
+Tasks report their item count with record_items(); the publish time is
+stamped into the message headers by before_task_publish, so queue wait is
+only known for messages sent by code that loaded this module.
+"""
+import logging
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from celery.signals import before_task_publish, task_postrun, task_prerun
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+logger = logging.getLogger('config.perf')
+
+PUBLISHED_AT_HEADER = 'gridlog_published_at'
+
+# task_id -> _Run for tasks between prerun and postrun
+_running = {}
+# The _Run of the task executing on this thread, for record_items()
+_local = threading.local()
+
+
+class QueryCounter:
+    """connection.execute_wrapper hook counting queries and their time"""
+
+    __slots__ = ('queries', 'db_seconds')
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_seconds += time.perf_counter() - started
+
+
+class _Run:
+    __slots__ = ('started_at', 'started', 'queue_wait_ms', 'counter', 'items')
+
+    def __init__(self, started_at, queue_wait_ms):
+        self.started_at = started_at
+        self.started = time.perf_counter()
+        self.queue_wait_ms = queue_wait_ms
+        self.counter = QueryCounter()
+        self.items = None
+
+
+def record_items(count):
+    """Record how many items (recipients, rows, periods...) the running task handled"""
+    run = getattr(_local, 'run', None)
+    if run is not None:
+        run.items = count
+
+
+def _queue_wait_ms(request, started_at):
+    published = getattr(request, PUBLISHED_AT_HEADER, None) or (request.headers or {}).get(PUBLISHED_AT_HEADER)
+    if published is None:
+        return None
+    ready = datetime.fromtimestamp(published, tz=dt_timezone.utc)
+    # A countdown/ETA task isn't waiting on the queue before it is due
+    if request.eta:
+        eta = request.eta if isinstance(request.eta, datetime) else datetime.fromisoformat(request.eta)
+        if timezone.is_naive(eta):
+            eta = timezone.make_aware(eta, dt_timezone.utc)
+        ready = max(ready, eta)
+    return max(0.0, (started_at - ready).total_seconds() * 1000)
+
+
+@before_task_publish.connect
+def stamp_published_at(headers=None, **kwargs):
+    if headers is not None:
+        headers.setdefault(PUBLISHED_AT_HEADER, time.time())
+
+
+@task_prerun.connect
+def start_task_timer(task_id=None, task=None, **kwargs):
+    if not settings.TASK_TELEMETRY_ENABLED or getattr(task.request, 'is_eager', False):
+        return
+    started_at = timezone.now()
+    run = _Run(started_at, _queue_wait_ms(task.request, started_at))
+    connection.execute_wrappers.append(run.counter)
+    _running[task_id] = _local.run = run
+
+
+@task_postrun.connect
+def record_task_run(task_id=None, task=None, state=None, **kwargs):
+    run = _running.pop(task_id, None)
+    if run is None:
+        return
+    _local.run = None
+    runtime_ms = (time.perf_counter() - run.started) * 1000
+    counter = run.counter
+    if counter in connection.execute_wrappers:
+        connection.execute_wrappers.remove(counter)
+
+    budget = settings.TASK_TELEMETRY_BUDGETS.get(task.name)
+    if budget is not None and runtime_ms > budget * 1000:
+        logger.warning(
+            f"Task {task.name} ({task_id}) took {runtime_ms:.0f} ms, over its {budget} s budget; "
+            f"{counter.queries} queries in {counter.db_seconds * 1000:.0f} ms"
+        )
+
+    from accounts.models import TaskRun
+    try:
+        TaskRun.objects.create(
+            task_name=task.name,
+            task_id=task_id,
+            queue=(task.request.delivery_info or {}).get('routing_key') or '',
+            state=state or '',
+            started_at=run.started_at,
+            queue_wait_ms=run.queue_wait_ms,
+            runtime_ms=runtime_ms,
+            db_queries=counter.queries,
+            db_ms=counter.db_seconds * 1000,
+            items=run.items,
+        )
+    except Exception:
+        # Telemetry must never fail the task it describes
+        logger.exception(f"Could not record telemetry for task {task.name} ({task_id})")
@@ -1,8 +1,99 @@
-from rest_framework.throttling import UserRateThrottle, AnonRateThrottle
-from rest_framework.exceptions import ThrottleException
+from rest_framework.throttling import SimpleRateThrottle
+from rest_framework.exceptions import Throttled
 
 
-class LoginRateThrottle(AnonRateThrottle):
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    Sliding-window counter throttle backed by the shared cache.
+
+    DRF's SimpleRateThrottle keeps a list of request timestamps per key and
+    rewrites it on every request, which is O(requests) in memory and racy
+    across workers. Here each key holds two integer counters (the current
+    and previous fixed window) that are bumped with the cache's atomic
+    INCR; the previous window is weighted by how much of it still overlaps
+    the sliding window.
+    """
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        window = int(self.now // self.duration)
+        current_key = f'{self.key}:{window}'
+        previous_key = f'{self.key}:{window - 1}'
+
+        previous = self.cache.get(previous_key, 0)
+        current = self._incr(current_key)
+
+        elapsed = (self.now % self.duration) / self.duration
+        self.estimated = previous * (1 - elapsed) + current
+        if self.estimated > self.num_requests:
+            # Rejected requests should not extend the lockout
+            self._decr(current_key)
+            return self.throttle_failure()
+        return self.throttle_success()
+
+    def _incr(self, key):
+        # add() is SET NX, so only the first request of a window creates the
+        # counter; the TTL covers the window plus the one that follows it.
+        self.cache.add(key, 0, timeout=self.duration * 2)
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            # Key expired between add() and incr()
+            self.cache.set(key, 1, timeout=self.duration * 2)
+            return 1
+
+    def _decr(self, key):
+        try:
+            self.cache.decr(key)
+        except ValueError:
+            pass
+
+    def throttle_success(self):
+        return True
+
+    def wait(self):
+        """Seconds until the current window rolls over"""
+        return self.duration - (self.now % self.duration)
+
+
+class AnonRateThrottle(SlidingWindowRateThrottle):
+    """Default rate limit for unauthenticated requests"""
+    scope = 'anon'
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return None
+
+        return self.cache_format % {
+            'scope': self.scope,
+            'ident': self.get_ident(request)
+        }
+
+
+class UserRateThrottle(SlidingWindowRateThrottle):
+    """Default rate limit for authenticated requests, keyed by user id"""
+    scope = 'user'
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+
+        return self.cache_format % {
+            'scope': self.scope,
+            'ident': ident
+        }
+
+
+class LoginRateThrottle(SlidingWindowRateThrottle):
     """Rate limit for login attempts"""
     scope = 'login'
 
@@ -17,19 +108,12 @@ class LoginRateThrottle(AnonRateThrottle):
         }
 
     def throttle_failure(self):
-        raise ThrottleException({
-            'error': 'Too many login attempts. Please try again later.',
-            'code': 'login_throttle_exceeded'
-        })
+        raise Throttled(
+            wait=self.wait(),
+            detail='Too many login attempts. Please try again later.'
+        )
 
 
 class ReportSubmitRateThrottle(UserRateThrottle):
     """Rate limit for report submissions"""
     scope = 'reports'
-
-    def get_cache_key(self, request, view):
-        ident = self.get_ident(request)
-        return self.cache_format % {
-            'scope': self.scope,
-            'ident': ident
-        }
@@ -1,9 +1,9 @@
 from django.contrib import admin
-from .models import Notification
+from .models import Notification, PendingEmail
 
 @admin.register(Notification)
 class NotificationAdmin(admin.ModelAdmin):
-    list_display = ('recipient', 'type', 'is_read', 'created_at')
+    list_display = ('recipient', 'type', 'is_read', 'event_count', 'created_at')
     list_filter = ('type', 'is_read', 'created_at')
     search_fields = ('recipient__full_name', 'recipient__email', 'message')
     raw_id_fields = ('recipient', 'related_report', 'related_comment')
@@ -18,4 +18,12 @@ class NotificationAdmin(admin.ModelAdmin):
     
     def mark_as_unread(self, request, queryset):
         queryset.update(is_read=False)
-    mark_as_unread.short_description = "Mark selected notifications as unread"
\ No newline at end of file
+    mark_as_unread.short_description = "Mark selected notifications as unread"
+
+
+@admin.register(PendingEmail)
+class PendingEmailAdmin(admin.ModelAdmin):
+    list_display = ('recipient', 'subject', 'send_after', 'created_at')
+    search_fields = ('recipient__full_name', 'recipient__email', 'subject')
+    raw_id_fields = ('recipient',)
+    readonly_fields = ('created_at',)
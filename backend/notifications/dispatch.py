@@ -0,0 +1,199 @@
+"""
+Coalesced notification dispatch (PRD section 7).
+
+In-app notifications are written as soon as the triggering transaction
+commits, but repeated events of one kind on one report within
+NOTIFICATION_COALESCE_WINDOW seconds update a single unread row instead of
+adding another. Emails are staged as PendingEmail rows and sent by the
+send_pending_emails beat task as one digest per recipient when the window
+closes, so a busy comment thread costs no Celery tasks and one email.
+Users on an hourly or daily digest have their window stretched to the next
+hour or to NOTIFICATION_DAILY_DIGEST_HOUR.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from accounts.models import AuditLog, User
+from .models import Notification, PendingEmail
+
+# Message for a notification that stands for several events
+COALESCED_MESSAGES = {
+    Notification.NotificationType.COMMENT_ADDED: "{count} new comments on your report",
+}
+
+
+def coalesce_window():
+    return timedelta(seconds=settings.NOTIFICATION_COALESCE_WINDOW)
+
+
+def notify(recipient, type, message, report=None, comment=None):
+    """
+    Create an in-app notification, or fold this event into the recipient's
+    unread notification of the same type and report from the current window.
+    """
+    since = timezone.now() - coalesce_window()
+    with transaction.atomic():
+        existing = (
+            Notification.objects.select_for_update()
+            .filter(recipient=recipient, type=type, related_report=report, is_read=False, created_at__gte=since)
+            .order_by('-created_at')
+            .first()
+        )
+        if existing is None:
+            return Notification.objects.create(
+                recipient=recipient,
+                type=type,
+                message=message,
+                related_report=report,
+                related_comment=comment
+            )
+
+        count = existing.event_count + 1
+        template = COALESCED_MESSAGES.get(type)
+        Notification.objects.filter(pk=existing.pk).update(
+            event_count=F('event_count') + 1,
+            message=template.format(count=count) if template else message,
+            related_comment=comment or existing.related_comment
+        )
+        existing.refresh_from_db()
+        return existing
+
+
+def digest_send_after(recipient, now=None):
+    """When an email staged now for `recipient` is due, per their email_digest preference"""
+    now = now or timezone.now()
+    if recipient.email_digest == User.EmailDigest.HOURLY:
+        return now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    if recipient.email_digest == User.EmailDigest.DAILY:
+        local = timezone.localtime(now)
+        due = local.replace(hour=settings.NOTIFICATION_DAILY_DIGEST_HOUR, minute=0, second=0, microsecond=0)
+        return due if due > local else due + timedelta(days=1)
+    return now + coalesce_window()
+
+
+def queue_email(recipient, subject, body):
+    """Stage an email for the recipient's next digest; honours the global opt-out"""
+    if not recipient.email_notifications_enabled:
+        return None
+    return PendingEmail.objects.create(
+        recipient=recipient,
+        subject=subject,
+        body=body,
+        send_after=digest_send_after(recipient)
+    )
+
+
+def queue_emails(emails):
+    """queue_email for many (recipient, subject, body) triples, in one INSERT"""
+    now = timezone.now()
+    return PendingEmail.objects.bulk_create([
+        PendingEmail(recipient=recipient, subject=subject, body=body, send_after=digest_send_after(recipient, now))
+        for recipient, subject, body in emails
+        if recipient.email_notifications_enabled
+    ])
+
+
+def notify_report_submitted(report):
+    """Notify the employee's supervisor that a report was submitted"""
+    supervisor = report.employee.supervisor
+    if not supervisor:
+        return "No supervisor assigned"
+
+    # Check supervisor notification preferences
+    if supervisor.email_notifications_enabled and supervisor.notify_on_report_submitted:
+        notify(
+            supervisor,
+            Notification.NotificationType.REPORT_SUBMITTED,
+            f"{report.employee.full_name} submitted their weekly report",
+            report=report
+        )
+        queue_email(
+            supervisor,
+            f"Report Submitted: {report.employee.full_name}",
+            f"{report.employee.full_name} has submitted their weekly report for the period {report.period}. You can review it at your earliest convenience."
+        )
+
+    AuditLog.log(
+        actor=report.employee,
+        action=AuditLog.Action.REPORT_SUBMIT,
+        target=report,
+        metadata={"message": "Notification sent to supervisor"}
+    )
+    return f"Notification sent to supervisor {supervisor.email} about report {report.id}"
+
+
+def notify_comment_added(comment):
+    """Notify the other side of the report (employee or supervisor) about a comment"""
+    report = comment.report
+
+    # Employee commented - notify supervisor; supervisor commented - notify employee
+    if comment.author_id == report.employee_id:
+        recipients = [report.employee.supervisor] if report.employee.supervisor else []
+    else:
+        recipients = [report.employee]
+
+    for recipient in recipients:
+        if not recipient.email_notifications_enabled or not recipient.notify_on_comment_added:
+            continue
+        notify(
+            recipient,
+            Notification.NotificationType.COMMENT_ADDED,
+            "New comment on your report",
+            report=report,
+            comment=comment
+        )
+        queue_email(
+            recipient,
+            "New Comment",
+            f"A new comment has been added to the report for period {report.period} by {comment.author.full_name}.\n\nMessage: \"{comment.body[:200]}...\""
+        )
+
+    AuditLog.log(
+        actor=comment.author,
+        action=AuditLog.Action.COMMENT_ADD,
+        target=report,
+        metadata={
+            "message": "Comment notification sent",
+            "comment_id": str(comment.id)
+        }
+    )
+    return f"Comment notifications sent for comment {comment.id}"
+
+
+def notify_report_reviewed(report):
+    """Notify the employee that their report was reviewed"""
+    employee = report.employee
+    if employee.email_notifications_enabled and employee.notify_on_report_reviewed:
+        notify(
+            employee,
+            Notification.NotificationType.REPORT_REVIEWED,
+            "Your report has been reviewed",
+            report=report
+        )
+        queue_email(
+            employee,
+            "Report Reviewed",
+            f"Your weekly report for the period {report.period} has been marked as REVIEWED by your supervisor."
+        )
+
+    AuditLog.log(
+        actor=employee.supervisor,
+        action=AuditLog.Action.REPORT_REVIEW,
+        target=report,
+        metadata={"message": "Notification sent to employee"}
+    )
+    return f"Notification sent to employee {employee.email} about report {report.id}"
+
+
+def build_digest(recipient, emails):
+    """(subject, message) for one recipient's pending emails, oldest first"""
+    if len(emails) == 1:
+        subject, text = emails[0].subject, emails[0].body
+    else:
+        subject = f"{len(emails)} new notifications"
+        text = "\n\n".join(f"{email.subject}\n{email.body}" for email in emails)
+    return subject, f"Hello {recipient.full_name},\n\n{text}\n\nBest,\nGridlog Team"
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.28 on 2026-10-19 15:46
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('notifications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='event_count',
+            field=models.PositiveIntegerField(default=1, help_text='Number of events coalesced into this notification'),
+        ),
+        migrations.CreateModel(
+            name='PendingEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(help_text='Subject used when this is the only pending email', max_length=255)),
+                ('body', models.TextField(help_text='Message text, without greeting or sign-off')),
+                ('send_after', models.DateTimeField(help_text='When the coalescing window for this email closes')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Timestamp when the email was staged')),
+                ('recipient', models.ForeignKey(help_text='The user the email will be sent to', on_delete=django.db.models.deletion.CASCADE, related_name='pending_emails', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Pending Email',
+                'verbose_name_plural': 'Pending Emails',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['send_after'], name='notificatio_send_af_0522c6_idx')],
+            },
+        ),
+    ]
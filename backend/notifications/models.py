@@ -48,6 +48,10 @@ class Notification(models.Model):
         blank=True,
         help_text="Associated comment, if applicable"
     )
+    event_count = models.PositiveIntegerField(
+        default=1,
+        help_text="Number of events coalesced into this notification"
+    )
     created_at = models.DateTimeField(
         auto_now_add=True,
         help_text="Timestamp when the notification was created"
@@ -59,6 +63,10 @@ class Notification(models.Model):
         verbose_name_plural = "Notifications"
         indexes = [
             models.Index(fields=['recipient', 'is_read']),
+            # Per-user list, newest first
+            models.Index(fields=['recipient', '-created_at']),
+            # Retention sweep over old read rows (compact_notifications)
+            models.Index(fields=['is_read', 'created_at']),
         ]
     
     def __str__(self):
@@ -67,4 +75,43 @@ class Notification(models.Model):
     def mark_as_read(self):
         """Mark notification as read"""
         self.is_read = True
-        self.save()
\ No newline at end of file
+        self.save()
+
+
+class PendingEmail(models.Model):
+    """
+    Notification email staged for the next digest (PRD section 7).
+    Everything pending for a recipient is sent as one email once the
+    earliest row's send_after has passed.
+    """
+    recipient = models.ForeignKey(
+        'accounts.User',
+        on_delete=models.CASCADE,
+        related_name='pending_emails',
+        help_text="The user the email will be sent to"
+    )
+    subject = models.CharField(
+        max_length=255,
+        help_text="Subject used when this is the only pending email"
+    )
+    body = models.TextField(
+        help_text="Message text, without greeting or sign-off"
+    )
+    send_after = models.DateTimeField(
+        help_text="When the coalescing window for this email closes"
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text="Timestamp when the email was staged"
+    )
+
+    class Meta:
+        ordering = ['created_at']
+        verbose_name = "Pending Email"
+        verbose_name_plural = "Pending Emails"
+        indexes = [
+            models.Index(fields=['send_after']),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} for {self.recipient.email}"
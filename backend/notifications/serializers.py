@@ -17,6 +17,7 @@ class NotificationSerializer(serializers.ModelSerializer):
             'message',
             'is_read',
             'related_report',
+            'event_count',
             'created_at'
         ]
         read_only_fields = [
@@ -24,6 +25,7 @@ class NotificationSerializer(serializers.ModelSerializer):
             'type',
             'message',
             'related_report',
+            'event_count',
             'created_at'
         ]
     
@@ -38,7 +40,10 @@ class NotificationSerializer(serializers.ModelSerializer):
         if instance.type == Notification.NotificationType.REPORT_SUBMITTED:
             representation['message'] = f"{instance.related_report.employee.full_name} submitted their weekly report"
         elif instance.type == Notification.NotificationType.COMMENT_ADDED:
-            representation['message'] = "New comment on your report"
+            if instance.event_count > 1:
+                representation['message'] = f"{instance.event_count} new comments on your report"
+            else:
+                representation['message'] = "New comment on your report"
         elif instance.type == Notification.NotificationType.COMMENT_REPLY:
             representation['message'] = "Reply to your comment"
         elif instance.type == Notification.NotificationType.REPORT_REVIEWED:
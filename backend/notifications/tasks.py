@@ -1,33 +1,66 @@
+import logging
 from celery import shared_task
 from django.utils import timezone
 from datetime import timedelta
-from .models import Notification
+from .models import Notification, PendingEmail
+from .dispatch import build_digest, digest_send_after, queue_emails
 from reports.models import ReportingPeriod, Report
 from accounts.models import User, AuditLog
-from reports.models import Comment
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage, get_connection
 from django.conf import settings
+from django.db.models import Count, Exists, OuterRef
+from config.locks import cache_lock
+from config.task_telemetry import record_items
 
-def _send_email(recipient, subject, message):
-    """Internal helper to send email notifications"""
-    if not recipient.email_notifications_enabled:
-        return
-    
-    # Prefix subject with app name
-    full_subject = f"[Gridlog] {subject}"
-    
-    # In dev, we might not have SMTP configured - log it
-    if not getattr(settings, 'EMAIL_HOST', None):
-        print(f"DEBUG: Email to {recipient.email}: {full_subject}")
-        return
-
-    send_mail(
-        subject=full_subject,
-        message=message,
-        from_email=getattr(settings, 'DEFAULT_FROM_EMAIL', 'notifications@gridlog.com'),
-        recipient_list=[recipient.email],
-        fail_silently=True
-    )
+logger = logging.getLogger(__name__)
+
+# A digest run should take seconds; the lock outlives a stuck run by this much
+PENDING_EMAIL_LOCK_TIMEOUT = 5 * 60
+COMPACT_LOCK_TIMEOUT = 60 * 60
+# Unsent digests stay staged; a mail server error retries the run this often
+PENDING_EMAIL_MAX_RETRIES = 3
+PENDING_EMAIL_RETRY_DELAY = 60
+
+# Scheduled notices where only a user's latest one of each type matters
+REMINDER_TYPES = [
+    Notification.NotificationType.WEEKLY_REMINDER,
+    Notification.NotificationType.DEADLINE_APPROACHING,
+    Notification.NotificationType.OVERDUE_SUMMARY,
+]
+
+def _send_digests(by_recipient):
+    """
+    Send each recipient's staged emails as one digest over one SMTP
+    connection, deleting their PendingEmail rows once the server accepted
+    the message. A mail server error propagates and leaves the rows of
+    everyone not yet sent to staged. Returns the number of digests sent.
+    """
+    # In dev, we might not have SMTP configured - log instead
+    smtp_configured = bool(getattr(settings, 'EMAIL_HOST', None))
+    connection = get_connection() if smtp_configured and by_recipient else None
+    sent = 0
+    if connection is not None:
+        connection.open()
+    try:
+        for recipient, emails in by_recipient.items():
+            if recipient.email_notifications_enabled:
+                subject, message = build_digest(recipient, emails)
+                email = EmailMessage(
+                    subject=f"[Gridlog] {subject}",
+                    body=message,
+                    from_email=getattr(settings, 'DEFAULT_FROM_EMAIL', 'notifications@gridlog.com'),
+                    to=[recipient.email]
+                )
+                if connection is None:
+                    logger.info("Email to %s: %s", recipient.email, email.subject)
+                else:
+                    connection.send_messages([email])
+                sent += 1
+            PendingEmail.objects.filter(id__in=[email.id for email in emails]).delete()
+    finally:
+        if connection is not None:
+            connection.close()
+    return sent
 
 @shared_task
 def send_weekly_reminders():
@@ -47,8 +80,9 @@ def send_weekly_reminders():
         reports__status__in=[Report.Status.NOT_STARTED, Report.Status.DRAFT]
     ).distinct()
 
-    # Create notifications
+    # Create notifications; the emails go out with each employee's next digest
     count = 0
+    emails = []
     for employee in employees:
         # Check user preferences (PRD section 7 - users may opt out)
         if not employee.email_notifications_enabled:
@@ -62,12 +96,13 @@ def send_weekly_reminders():
             message="Don't forget to submit your weekly report",
             related_report=employee.reports.filter(period=current_period).first()
         )
-        _send_email(
-            employee, 
-            "Weekly Reminder", 
-            f"Hello {employee.full_name},\n\nYou haven't submitted your weekly report for the period ending {current_period.end_date}. Please log in to Gridlog to complete your submission.\n\nBest,\nGridlog Team"
-        )
+        emails.append((
+            employee,
+            "Weekly Reminder",
+            f"You haven't submitted your weekly report for the period ending {current_period.end_date}. Please log in to Gridlog to complete your submission."
+        ))
         count += 1
+    queue_emails(emails)
 
     # Log the action
     AuditLog.log(
@@ -79,6 +114,7 @@ def send_weekly_reminders():
         }
     )
 
+    record_items(count)
     return f"Weekly reminders sent to {count} employees"
 
 @shared_task
@@ -103,8 +139,9 @@ def send_deadline_approaching():
         reports__status__in=[Report.Status.NOT_STARTED, Report.Status.DRAFT]
     ).distinct()
 
-    # Create notifications
+    # Create notifications; the emails go out with each employee's next digest
     count = 0
+    emails = []
     for employee in employees:
         # Check user preferences (PRD section 7 - users may opt out)
         if not employee.email_notifications_enabled:
@@ -118,12 +155,13 @@ def send_deadline_approaching():
             message="Deadline approaching: Report due tonight",
             related_report=employee.reports.filter(period=current_period).first()
         )
-        _send_email(
+        emails.append((
             employee,
             "Deadline Approaching",
-            f"Hello {employee.full_name},\n\nThe deadline for your weekly report is tonight ({current_period.deadline.date()}). Please ensure your report is submitted on time.\n\nBest,\nGridlog Team"
-        )
+            f"The deadline for your weekly report is tonight ({current_period.deadline.date()}). Please ensure your report is submitted on time."
+        ))
         count += 1
+    queue_emails(emails)
 
     # Log the action
     AuditLog.log(
@@ -135,6 +173,7 @@ def send_deadline_approaching():
         }
     )
 
+    record_items(count)
     return f"Deadline approaching notifications sent to {count} employees"
 
 @shared_task
@@ -148,32 +187,30 @@ def send_overdue_summary():
     if not current_period:
         return "No active reporting period"
     
-    # Find supervisors with team members who haven't submitted reports
-    supervisors = User.objects.filter(
-        role=User.Role.SUPERVISOR,
-        team_members__reports__period=current_period,
-        team_members__reports__status__in=[Report.Status.NOT_STARTED, Report.Status.DRAFT]
-    ).distinct()
-    
-    # Create notifications for each supervisor
-    count = 0
-    for supervisor in supervisors:
-        # Count overdue reports for this supervisor's team
-        overdue_count = Report.objects.filter(
-            employee__supervisor=supervisor,
+    # Overdue reports per supervisor in one grouped query; every active
+    # employee has a (Not Started) report row for the period
+    overdue = dict(
+        Report.objects.filter(
             period=current_period,
-            status__in=[Report.Status.NOT_STARTED, Report.Status.DRAFT]
-        ).count()
-        
-        if overdue_count > 0:
-            Notification.objects.create(
-                recipient=supervisor,
-                type=Notification.NotificationType.OVERDUE_SUMMARY,
-                message=f"{overdue_count} team members haven't submitted reports",
-                # No specific report to link to for summary notifications
-            )
-            count += 1
-    
+            status__in=[Report.Status.NOT_STARTED, Report.Status.DRAFT],
+            employee__supervisor__isnull=False
+        ).values('employee__supervisor').annotate(n=Count('id')).values_list('employee__supervisor', 'n')
+    )
+    supervisors = User.objects.filter(id__in=list(overdue), role=User.Role.SUPERVISOR)
+
+    # Create notifications for each supervisor
+    notifications = [
+        Notification(
+            recipient=supervisor,
+            type=Notification.NotificationType.OVERDUE_SUMMARY,
+            message=f"{overdue[supervisor.id]} team members haven't submitted reports",
+            # No specific report to link to for summary notifications
+        )
+        for supervisor in supervisors
+    ]
+    Notification.objects.bulk_create(notifications)
+    count = len(notifications)
+
     # Log the action
     AuditLog.log(
         actor=None,  # System action
@@ -184,133 +221,136 @@ def send_overdue_summary():
         }
     )
     
+    record_items(count)
     return f"Overdue summaries sent to {count} supervisors"
 
-@shared_task
-def send_report_submitted_notification(report_id):
+@shared_task(bind=True, max_retries=PENDING_EMAIL_MAX_RETRIES)
+def send_pending_emails(self):
     """
     PRD section 7 - Notification System
-    Sends notification to supervisor when employee submits report
+    Digest builder: every recipient with a staged email past its send_after
+    (end of the coalescing window, or their hourly/daily slot) gets one
+    email covering everything staged for them. The rows come from one
+    query and all digests share one SMTP connection. A recipient's rows are
+    only deleted once their digest is sent; if the mail server fails the
+    rest stay staged and the task retries.
     """
-    try:
-        report = Report.objects.get(id=report_id)
-        supervisor = report.employee.supervisor
-
-        if supervisor:
-            # Check supervisor notification preferences
-            if supervisor.email_notifications_enabled and supervisor.notify_on_report_submitted:
-                Notification.objects.create(
-                    recipient=supervisor,
-                    type=Notification.NotificationType.REPORT_SUBMITTED,
-                    message=f"{report.employee.full_name} submitted their weekly report",
-                    related_report=report
-                )
-                _send_email(
-                    supervisor,
-                    f"Report Submitted: {report.employee.full_name}",
-                    f"Hello {supervisor.full_name},\n\n{report.employee.full_name} has submitted their weekly report for the period {report.period}. You can review it at your earliest convenience.\n\nBest,\nGridlog Team"
-                )
+    with cache_lock('notifications:pending-emails', timeout=PENDING_EMAIL_LOCK_TIMEOUT) as acquired:
+        if not acquired:
+            return "Skipped: another run in progress"
 
-            # Log the action
-            AuditLog.log(
-                actor=report.employee,
-                action=AuditLog.Action.REPORT_SUBMIT,
-                target=report,
-                metadata={"message": "Notification sent to supervisor"}
-            )
+        due = PendingEmail.objects.filter(send_after__lte=timezone.now()).values('recipient')
+        pending = list(
+            PendingEmail.objects.filter(recipient__in=due).select_related('recipient').order_by('recipient', 'created_at')
+        )
+        by_recipient = {}
+        for email in pending:
+            by_recipient.setdefault(email.recipient, []).append(email)
 
-            return f"Notification sent to supervisor {supervisor.email} about report {report_id}"
-        return "No supervisor assigned"
-    except Report.DoesNotExist:
-        return f"Report {report_id} does not exist"
+        try:
+            sent = _send_digests(by_recipient)
+        except OSError as exc:  # smtplib.SMTPException included
+            logger.warning("Sending digests failed, unsent emails stay staged: %s", exc)
+            failure = exc
+        else:
+            failure = None
+
+    if failure is not None:
+        raise self.retry(exc=failure, countdown=PENDING_EMAIL_RETRY_DELAY)
+    record_items(len(pending))
+    return f"Sent {sent} digests covering {len(pending)} notifications"
+
+def _delete_in_batches(queryset, batch_size):
+    """Delete the rows of `queryset` a batch of ids at a time; each batch commits on its own"""
+    deleted = 0
+    while True:
+        ids = list(queryset.order_by('id').values_list('id', flat=True)[:batch_size])
+        if not ids:
+            return deleted
+        deleted += Notification.objects.filter(id__in=ids).delete()[0]
 
 @shared_task
-def send_comment_notification(comment_id):
+def compact_notifications():
     """
     PRD section 7 - Notification System
-    Sends notification when a comment is added to a report
+    Keeps per-user notification lists bounded: deletes read notifications
+    older than NOTIFICATION_RETENTION_DAYS, and collapses reminders so each
+    user keeps only their newest notification of each reminder type
     """
-    try:
-        comment = Comment.objects.get(id=comment_id)
-        report = comment.report
-
-        # Determine who to notify
-        recipients = []
-        if comment.author == report.employee:
-            # Employee commented - notify supervisor
-            if report.employee.supervisor:
-                recipients.append(report.employee.supervisor)
-        else:
-            # Supervisor commented - notify employee
-            recipients.append(report.employee)
-
-        # Create notifications based on user preferences
-        for recipient in recipients:
-            # Check notification preferences
-            if not recipient.email_notifications_enabled:
-                continue
-            if not recipient.notify_on_comment_added:
-                continue
-
-            Notification.objects.create(
-                recipient=recipient,
-                type=Notification.NotificationType.COMMENT_ADDED,
-                message="New comment on your report",
-                related_report=report
-            )
-            _send_email(
-                recipient,
-                "New Comment",
-                f"Hello {recipient.full_name},\n\nA new comment has been added to the report for period {report.period} by {comment.author.full_name}.\n\nMessage: \"{comment.content[:200]}...\"\n\nBest,\nGridlog Team"
-            )
-
-        # Log the action
-        AuditLog.log(
-            actor=comment.author,
-            action=AuditLog.Action.COMMENT_ADD,
-            target=report,
-            metadata={
-                "message": "Comment notification sent",
-                "comment_id": str(comment_id)
-            }
+    with cache_lock('notifications:compact', timeout=COMPACT_LOCK_TIMEOUT) as acquired:
+        if not acquired:
+            return "Skipped: another run in progress"
+
+        batch_size = settings.NOTIFICATION_PURGE_BATCH_SIZE
+        cutoff = timezone.now() - timedelta(days=settings.NOTIFICATION_RETENTION_DAYS)
+        expired = _delete_in_batches(
+            Notification.objects.filter(is_read=True, created_at__lt=cutoff), batch_size
+        )
+
+        newer = Notification.objects.filter(
+            recipient=OuterRef('recipient'), type=OuterRef('type'), id__gt=OuterRef('id')
         )
+        superseded = _delete_in_batches(
+            Notification.objects.filter(type__in=REMINDER_TYPES).filter(Exists(newer)), batch_size
+        )
+
+    record_items(expired + superseded)
+    return f"Deleted {expired} expired and {superseded} superseded notifications"
 
-        return f"Comment notifications sent for comment {comment_id}"
-    except Comment.DoesNotExist:
-        return f"Comment {comment_id} does not exist"
+BATCH_EVENTS = {
+    'reviewed': {
+        'preference': 'notify_on_report_reviewed',
+        'type': Notification.NotificationType.REPORT_REVIEWED,
+        'message': "Your report has been reviewed",
+        'subject': "Report Reviewed",
+        'body': "Your weekly report for the period {period} has been marked as REVIEWED by your supervisor.",
+    },
+    'revision_requested': {
+        # Delivered as the system comment the supervisor left on the report
+        'preference': 'notify_on_comment_added',
+        'type': Notification.NotificationType.COMMENT_ADDED,
+        'message': "Your supervisor requested a revision of your report",
+        'subject': "Revision Requested",
+        'body': "Your supervisor requested a revision of your weekly report for the period {period}. Please review their comment and resubmit.",
+    },
+}
 
 @shared_task
-def send_report_reviewed_notification(report_id):
+def send_batch_workflow_notifications(report_ids, event):
     """
     PRD section 7 - Notification System
-    Sends notification to employee when supervisor marks report as reviewed
+    Notifies employees after a supervisor's batch review or revision request,
+    with one task and one insert for the whole batch
     """
-    try:
-        report = Report.objects.get(id=report_id)
+    config = BATCH_EVENTS[event]
+    reports = Report.objects.filter(id__in=report_ids).select_related('employee', 'period')
+
+    recipients = []
+    notifications = []
+    for report in reports:
         employee = report.employee
+        if not employee.email_notifications_enabled or not getattr(employee, config['preference']):
+            continue
+        recipients.append((employee, report))
+        notifications.append(Notification(
+            recipient=employee,
+            type=config['type'],
+            message=config['message'],
+            related_report=report
+        ))
+    Notification.objects.bulk_create(notifications)
 
-        # Check employee notification preferences
-        if employee.email_notifications_enabled and employee.notify_on_report_reviewed:
-            Notification.objects.create(
-                recipient=employee,
-                type=Notification.NotificationType.REPORT_REVIEWED,
-                message="Your report has been reviewed",
-                related_report=report
-            )
-            _send_email(
-                employee,
-                "Report Reviewed",
-                f"Hello {employee.full_name},\n\nYour weekly report for the period {report.period} has been marked as REVIEWED by your supervisor.\n\nBest,\nGridlog Team"
-            )
-
-        # Log the action
-        AuditLog.log(
-            actor=report.employee.supervisor,
-            action=AuditLog.Action.REPORT_REVIEW,
-            target=report,
-            metadata={"message": "Notification sent to employee"}
+    # Joins each employee's next digest rather than mailing right away
+    now = timezone.now()
+    PendingEmail.objects.bulk_create([
+        PendingEmail(
+            recipient=employee,
+            subject=config['subject'],
+            body=config['body'].format(period=report.period),
+            send_after=digest_send_after(employee, now)
         )
+        for employee, report in recipients
+    ])
 
-        return f"Notification sent to employee {report.employee.email} about report {report_id}"
-    except Report.DoesNotExist:
-        return f"Report {report_id} does not exist"
\ No newline at end of file
+    record_items(len(report_ids))
+    return f"{len(notifications)} {event} notifications sent for {len(report_ids)} reports"
@@ -1,9 +1,13 @@
-from django.test import TestCase
+from unittest import mock
+
+from django.core import mail
+from django.test import TestCase, override_settings
 from rest_framework.test import APIClient
 from rest_framework import status
-from accounts.models import User
-from reports.models import Report, ReportingPeriod
-from notifications.models import Notification
+from accounts.models import AuditLog, User
+from reports.models import Comment, Report, ReportingPeriod
+from notifications.models import Notification, PendingEmail
+from config.query_budget import QueryBudgetMixin
 from django.utils import timezone
 from datetime import timedelta
 
@@ -114,6 +118,310 @@ class NotificationTests(TestCase):
         self.assertEqual(unread, 0)
 
 
+class BatchWorkflowNotificationTests(TestCase):
+    """Test cases for the grouped batch workflow notification task"""
+
+    def setUp(self):
+        self.period = ReportingPeriod.objects.create(
+            start_date=timezone.now().date(),
+            end_date=timezone.now().date() + timedelta(days=7),
+            deadline=timezone.now() + timedelta(days=5)
+        )
+        self.reports = []
+        for i, opted_in in enumerate([True, True, False]):
+            employee = User.objects.create_user(
+                email=f'member{i}@example.com',
+                password='x',
+                full_name=f'Member {i}',
+                role=User.Role.EMPLOYEE,
+                notify_on_report_reviewed=opted_in
+            )
+            self.reports.append(Report.objects.create(employee=employee, period=self.period))
+
+    def test_batch_review_notifies_opted_in_employees(self):
+        """Test one task call creates a notification per opted-in employee"""
+        from notifications.tasks import send_batch_workflow_notifications
+
+        send_batch_workflow_notifications([r.id for r in self.reports], 'reviewed')
+
+        notifications = Notification.objects.filter(type=Notification.NotificationType.REPORT_REVIEWED)
+        self.assertEqual(notifications.count(), 2)
+        self.assertFalse(notifications.filter(recipient=self.reports[2].employee).exists())
+
+
+class CoalescedNotificationTests(TestCase):
+    """Test cases for debounced notification dispatch and email digests"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.supervisor = User.objects.create_user(
+            email='supervisor@example.com',
+            password='supervisorpass123',
+            full_name='Supervisor User',
+            role=User.Role.SUPERVISOR
+        )
+        self.employee = User.objects.create_user(
+            email='employee@example.com',
+            password='employeepass123',
+            full_name='Employee User',
+            role=User.Role.EMPLOYEE,
+            supervisor=self.supervisor
+        )
+        self.period = ReportingPeriod.objects.create(
+            start_date=timezone.now().date(),
+            end_date=timezone.now().date() + timedelta(days=7),
+            deadline=timezone.now() + timedelta(days=5)
+        )
+        self.report = Report.objects.create(employee=self.employee, period=self.period)
+
+    def authenticate(self, user):
+        """Helper to authenticate as a user"""
+        response = self.client.post('/api/v1/auth/login/', {
+            'email': user.email,
+            'password': f'{user.email.split("@")[0]}pass123'
+        })
+        if response.status_code == 200:
+            self.client.credentials(
+                HTTP_AUTHORIZATION=f"Bearer {response.data['access']}"
+            )
+
+    def comment(self, body, author=None):
+        from notifications.dispatch import notify_comment_added
+        comment = Comment.objects.create(report=self.report, author=author or self.supervisor, body=body)
+        notify_comment_added(comment)
+
+    def test_comment_burst_shares_one_notification(self):
+        """Test comments within the window update one unread notification"""
+        for i in range(3):
+            self.comment(f'Feedback {i}')
+
+        notification = Notification.objects.get(recipient=self.employee)
+        self.assertEqual(notification.event_count, 3)
+        self.assertEqual(notification.message, '3 new comments on your report')
+        self.assertEqual(PendingEmail.objects.filter(recipient=self.employee).count(), 3)
+
+        self.authenticate(self.employee)
+        response = self.client.get('/api/v1/notifications/')
+        self.assertEqual(response.json()[0]['message'], '3 new comments on your report')
+
+    def test_submit_notifies_without_queuing_a_task(self):
+        """Test submission writes the supervisor's notification on commit instead of queuing a task"""
+        Report.objects.filter(id=self.report.id).update(
+            accomplishments='Done', goals_next_week='More', progress_rating='3'
+        )
+        self.authenticate(self.employee)
+
+        with mock.patch('celery.app.task.Task.apply_async') as publish, \
+                self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f'/api/v1/reports/{self.report.id}/submit/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        publish.assert_not_called()
+        self.assertTrue(Notification.objects.filter(
+            recipient=self.supervisor, type=Notification.NotificationType.REPORT_SUBMITTED
+        ).exists())
+        self.assertEqual(PendingEmail.objects.filter(recipient=self.supervisor).count(), 1)
+
+    def test_read_notification_starts_a_new_one(self):
+        """Test an event after the notification was read is not folded into it"""
+        self.comment('First')
+        Notification.objects.filter(recipient=self.employee).update(is_read=True)
+
+        self.comment('Second')
+
+        self.assertEqual(Notification.objects.filter(recipient=self.employee, is_read=False).count(), 1)
+
+    @override_settings(NOTIFICATION_COALESCE_WINDOW=0)
+    def test_pending_emails_sent_as_one_digest(self):
+        """Test a recipient's staged emails go out as one message once the window closes"""
+        from notifications.tasks import send_pending_emails
+
+        self.comment('First')
+        self.comment('Second')
+
+        send_pending_emails()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].subject, '[Gridlog] 2 new notifications')
+        self.assertEqual(mail.outbox[0].to, [self.employee.email])
+        self.assertIn('Message: "Second', mail.outbox[0].body)
+        self.assertFalse(PendingEmail.objects.exists())
+
+    def test_pending_emails_wait_for_window(self):
+        """Test emails still inside their coalescing window are not sent yet"""
+        from notifications.tasks import send_pending_emails
+
+        self.comment('First')
+
+        send_pending_emails()
+
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(PendingEmail.objects.count(), 1)
+
+
+class EmailDigestTests(TestCase):
+    """Test cases for hourly/daily email digest preferences"""
+
+    def setUp(self):
+        self.users = {
+            digest: User.objects.create_user(
+                email=f'{digest}@example.com',
+                password='x',
+                full_name=f'{digest.title()} User',
+                role=User.Role.EMPLOYEE,
+                email_digest=digest
+            )
+            for digest in User.EmailDigest.values
+        }
+
+    @override_settings(NOTIFICATION_DAILY_DIGEST_HOUR=8)
+    def test_send_after_follows_preference(self):
+        """Test hourly digests are due on the hour and daily ones at the configured hour"""
+        from notifications.dispatch import digest_send_after
+
+        now = timezone.make_aware(timezone.datetime(2026, 3, 4, 9, 20))
+        self.assertEqual(
+            digest_send_after(self.users['hourly'], now), timezone.make_aware(timezone.datetime(2026, 3, 4, 10, 0))
+        )
+        self.assertEqual(
+            digest_send_after(self.users['daily'], now), timezone.make_aware(timezone.datetime(2026, 3, 5, 8, 0))
+        )
+        self.assertLess(digest_send_after(self.users['immediate'], now), now + timedelta(hours=1))
+
+    def test_builder_sends_due_digests_over_one_connection(self):
+        """Test due recipients get one email each through a single connection; later digests wait"""
+        from django.core.mail import get_connection
+        from notifications.tasks import send_pending_emails
+
+        past = timezone.now() - timedelta(minutes=1)
+        for user in [self.users['immediate'], self.users['hourly']]:
+            for i in range(2):
+                PendingEmail.objects.create(recipient=user, subject=f'Event {i}', body='Body', send_after=past)
+        PendingEmail.objects.create(
+            recipient=self.users['daily'], subject='Event', body='Body', send_after=timezone.now() + timedelta(hours=5)
+        )
+
+        with mock.patch('notifications.tasks.get_connection', wraps=get_connection) as connect:
+            send_pending_emails()
+
+        self.assertEqual(connect.call_count, 1)
+        self.assertEqual(sorted(m.to[0] for m in mail.outbox), ['hourly@example.com', 'immediate@example.com'])
+        self.assertTrue(all(m.subject == '[Gridlog] 2 new notifications' for m in mail.outbox))
+        self.assertEqual(list(PendingEmail.objects.values_list('recipient', flat=True)), [self.users['daily'].id])
+
+    def test_failed_send_keeps_unsent_digests_and_retries(self):
+        """Test a mail server error only removes the digests already sent and raises for a retry"""
+        from smtplib import SMTPServerDisconnected
+        from notifications.tasks import send_pending_emails
+
+        past = timezone.now() - timedelta(minutes=1)
+        for user in [self.users['immediate'], self.users['hourly']]:
+            PendingEmail.objects.create(recipient=user, subject='Event', body='Body', send_after=past)
+
+        with mock.patch('notifications.tasks.get_connection') as connect:
+            connect.return_value.send_messages.side_effect = [1, SMTPServerDisconnected('Connection lost')]
+            with self.assertRaises(SMTPServerDisconnected):
+                send_pending_emails()
+
+        self.assertEqual(list(PendingEmail.objects.values_list('recipient', flat=True)), [self.users['hourly'].id])
+
+    def test_reminders_are_staged_for_digests(self):
+        """Test reminder blasts stage emails per digest preference instead of sending one each"""
+        from notifications.dispatch import digest_send_after
+        from notifications.tasks import send_deadline_approaching, send_weekly_reminders
+
+        period = ReportingPeriod.objects.create(
+            start_date=timezone.now().date(),
+            end_date=timezone.now().date() + timedelta(days=6),
+            deadline=timezone.now()
+        )
+        for user in self.users.values():
+            Report.objects.create(employee=user, period=period)
+
+        send_weekly_reminders()
+        send_deadline_approaching()
+
+        self.assertEqual(len(mail.outbox), 0)
+        daily = PendingEmail.objects.filter(recipient=self.users['daily']).order_by('subject')
+        self.assertEqual([email.subject for email in daily], ['Deadline Approaching', 'Weekly Reminder'])
+        self.assertEqual(daily[0].send_after, digest_send_after(self.users['daily'], daily[0].created_at))
+        self.assertEqual(PendingEmail.objects.count(), 6)
+
+
+@override_settings(NOTIFICATION_RETENTION_DAYS=30, NOTIFICATION_PURGE_BATCH_SIZE=2)
+class NotificationCompactionTests(TestCase):
+    """Test cases for the notification retention and compaction job"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='member@example.com',
+            password='x',
+            full_name='Member',
+            role=User.Role.EMPLOYEE
+        )
+
+    def create(self, type, days_old, is_read):
+        notification = Notification.objects.create(recipient=self.user, type=type, message='x', is_read=is_read)
+        Notification.objects.filter(id=notification.id).update(created_at=timezone.now() - timedelta(days=days_old))
+        return notification
+
+    def test_old_read_notifications_are_deleted_in_batches(self):
+        """Test read rows past retention go, unread and recent rows stay"""
+        from notifications.tasks import compact_notifications
+
+        comment = Notification.NotificationType.COMMENT_ADDED
+        expired = [self.create(comment, 40, True) for _ in range(5)]
+        kept = [self.create(comment, 40, False), self.create(comment, 5, True)]
+
+        result = compact_notifications()
+
+        self.assertIn('Deleted 5 expired', result)
+        self.assertFalse(Notification.objects.filter(id__in=[n.id for n in expired]).exists())
+        self.assertEqual(Notification.objects.count(), len(kept))
+
+    def test_reminders_collapse_to_newest_per_type(self):
+        """Test only each user's latest reminder of a type survives"""
+        from notifications.tasks import compact_notifications
+
+        weekly = Notification.NotificationType.WEEKLY_REMINDER
+        deadline = Notification.NotificationType.DEADLINE_APPROACHING
+        for days in [21, 14, 7]:
+            self.create(weekly, days, False)
+        latest_weekly = self.create(weekly, 0, False)
+        latest_deadline = self.create(deadline, 3, False)
+
+        compact_notifications()
+
+        self.assertEqual(
+            set(Notification.objects.values_list('id', flat=True)), {latest_weekly.id, latest_deadline.id}
+        )
+
+
+class TaskRoutingTests(TestCase):
+    """Test cases for Celery queue routing"""
+
+    def route(self, name):
+        from config.celery import app
+        return app.amqp.router.route({}, name)
+
+    def test_user_triggered_notifications_use_interactive_queue(self):
+        """Test notifications a user is waiting on skip the periodic backlog"""
+        route = self.route('notifications.tasks.send_batch_workflow_notifications')
+        self.assertEqual(route['queue'].name, 'interactive')
+        self.assertEqual(route['priority'], 1)
+
+    def test_bulk_work_uses_periodic_queue(self):
+        """Test reminder blasts, period jobs and imports are kept off the interactive queue"""
+        for name in ['notifications.tasks.send_weekly_reminders',
+                     'reports.tasks.auto_close_reporting_periods',
+                     'accounts.tasks.import_users_csv']:
+            self.assertEqual(self.route(name)['queue'].name, 'periodic', name)
+
+    def test_unrouted_tasks_use_default_queue(self):
+        """Test tasks without a route fall back to the default queue"""
+        self.assertEqual(self.route('notifications.tasks.unknown')['queue'].name, 'default')
+
+
 class AuditLogTests(TestCase):
     """Test cases for audit log endpoints"""
 
@@ -159,3 +467,122 @@ class AuditLogTests(TestCase):
         response = self.client.get('/api/v1/auth/audit-logs/')
         # Should return empty or filtered results
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class AsyncNotificationEndpointTests(TestCase):
+    """Test cases for the async notification list and unread count views"""
+
+    def setUp(self):
+        self.employee = User.objects.create_user(
+            email='employee@example.com', password='x', full_name='Employee User', role=User.Role.EMPLOYEE
+        )
+        other = User.objects.create_user(
+            email='other@example.com', password='x', full_name='Other User', role=User.Role.EMPLOYEE
+        )
+        for recipient, is_read in [(self.employee, False), (self.employee, True), (other, False)]:
+            Notification.objects.create(
+                recipient=recipient, type=Notification.NotificationType.REPORT_REVIEWED,
+                message='Reviewed', is_read=is_read
+            )
+        from rest_framework_simplejwt.tokens import AccessToken
+        self.headers = {'Authorization': f'Bearer {AccessToken.for_user(self.employee)}'}
+
+    async def test_list_and_unread_count(self):
+        """Test only the user's own notifications are listed and counted"""
+        response = await self.async_client.get('/api/v1/notifications/', headers=self.headers)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()), 2)
+        self.assertEqual(response.json()[0]['message'], 'Your report has been reviewed')
+
+        response = await self.async_client.get('/api/v1/notifications/unread-count/', headers=self.headers)
+        self.assertEqual(response.json(), {'unread_count': 1})
+
+    async def test_requires_authentication(self):
+        response = await self.async_client.get('/api/v1/notifications/unread-count/')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class NotificationQueryBudgetTests(QueryBudgetMixin, TestCase):
+    """Query budgets for every NotificationViewSet and AuditLogViewSet action"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = User.objects.create_user(
+            email='admin@example.com', password='x', full_name='Admin User', role=User.Role.ADMIN
+        )
+        self.supervisor = User.objects.create_user(
+            email='supervisor@example.com', password='x', full_name='Supervisor User', role=User.Role.SUPERVISOR
+        )
+        self.period = ReportingPeriod.objects.create(
+            start_date=timezone.now().date(),
+            end_date=timezone.now().date() + timedelta(days=6),
+            deadline=timezone.now() + timedelta(days=4)
+        )
+        self.members = 0
+
+    def notifications(self, n):
+        """n submissions, each notifying the supervisor and logged by its author"""
+        created = []
+        for _ in range(n):
+            self.members += 1
+            member = User.objects.create_user(
+                email=f'member{self.members}@example.com', password='x', full_name=f'Member {self.members}',
+                role=User.Role.EMPLOYEE, supervisor=self.supervisor
+            )
+            report = Report.objects.create(employee=member, period=self.period)
+            AuditLog.log(actor=member, action=AuditLog.Action.REPORT_SUBMIT, target=report)
+            created.append(Notification.objects.create(
+                recipient=self.supervisor, type=Notification.NotificationType.REPORT_SUBMITTED,
+                message='Submitted', related_report=report
+            ))
+        return created
+
+    def request(self, user, method, path, data=None):
+        def send(_):
+            # Forced authentication keeps the JWT user lookup out of the counts
+            self.client.force_authenticate(user)
+            return getattr(self.client, method)(path, data, format='json')
+        return send
+
+    def test_notification_list(self):
+        self.assertQueryBudget(1, self.notifications, self.request(self.supervisor, 'get', '/api/v1/notifications/'))
+
+    def test_notification_retrieve(self):
+        def request(created):
+            self.client.force_authenticate(self.supervisor)
+            return self.client.get(f'/api/v1/notifications/{created[0].id}/')
+
+        self.assertQueryBudget(1, self.notifications, request)
+
+    def test_notification_read(self):
+        def request(created):
+            self.client.force_authenticate(self.supervisor)
+            return self.client.post('/api/v1/notifications/read/', {'ids': [n.id for n in created]}, format='json')
+
+        self.assertQueryBudget(1, self.notifications, request)
+
+    def test_notification_mark_all_read(self):
+        self.assertQueryBudget(
+            1, self.notifications, self.request(self.supervisor, 'post', '/api/v1/notifications/mark-all-read/')
+        )
+
+    def test_notification_unread_count(self):
+        self.assertQueryBudget(
+            1, self.notifications, self.request(self.supervisor, 'get', '/api/v1/notifications/unread-count/')
+        )
+
+    def test_audit_log_list(self):
+        for user in [self.admin, self.supervisor]:
+            with self.subTest(role=user.role):
+                self.assertQueryBudget(2, self.notifications, self.request(user, 'get', '/api/v1/auth/audit-logs/'))
+
+    def test_audit_log_retrieve(self):
+        def grow(n):
+            self.notifications(n)
+            return AuditLog.objects.latest('id')
+
+        def request(log):
+            self.client.force_authenticate(self.admin)
+            return self.client.get(f'/api/v1/auth/audit-logs/{log.id}/')
+
+        self.assertQueryBudget(1, grow, request)
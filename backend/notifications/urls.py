@@ -8,8 +8,10 @@ router = DefaultRouter()
 router.register(r'', views.NotificationViewSet, basename='notification')
 
 urlpatterns = [
+    # Async read endpoints; ahead of the router, whose list route would match ''
+    path('', views.notification_list, name='notification-list'),
+    path('unread-count/', views.unread_count, name='notification-unread-count'),
     path('', include(router.urls)),
     path('mark-read/', views.NotificationViewSet.as_view({'post': 'read'}), name='notification-mark-read'),
     path('mark-all-read/', views.NotificationViewSet.as_view({'post': 'mark_all_read'}), name='notification-mark-all-read'),
-    path('unread-count/', views.NotificationViewSet.as_view({'get': 'unread_count'}), name='notification-unread-count'),
 ]
\ No newline at end of file
@@ -2,9 +2,18 @@ from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from config.async_api import async_api_view
 from .models import Notification
 from .serializers import NotificationSerializer
 
+
+def user_notifications(user):
+    """The user's notifications, with what the nested report serializer reads"""
+    return Notification.objects.filter(recipient=user).select_related(
+        'related_report__period', 'related_report__employee'
+    )
+
+
 class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
     """
     PRD section 7 - Notification System and section 9.3 - Key API Endpoints
@@ -16,7 +25,7 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
     
     def get_queryset(self):
         # Return only notifications for the current user
-        return Notification.objects.filter(recipient=self.request.user)
+        return user_notifications(self.request.user)
     
     @action(detail=False, methods=['post'])
     def read(self, request):
@@ -52,14 +61,25 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
         
         return Response({"updated": updated})
     
-    @action(detail=False, methods=['get'], url_path='unread-count')
-    def unread_count(self, request):
-        """
-        Returns the count of unread notifications for the current user
-        """
-        count = Notification.objects.filter(
-            recipient=request.user,
-            is_read=False
-        ).count()
-        
-        return Response({"unread_count": count})
\ No newline at end of file
+
+
+# Polled by every open tab, so served by async views (config/async_api.py)
+# that don't hold a worker thread under ASGI; routed ahead of the viewset
+
+@async_api_view
+async def notification_list(request):
+    """
+    PRD section 7 - Notification System and section 9.3 - Key API Endpoints
+    Lists the current user's notifications, newest first
+    """
+    notifications = [n async for n in user_notifications(request.user)]
+    return NotificationSerializer(notifications, many=True).data
+
+
+@async_api_view
+async def unread_count(request):
+    """
+    Returns the count of unread notifications for the current user
+    """
+    count = await Notification.objects.filter(recipient=request.user, is_read=False).acount()
+    return {"unread_count": count}
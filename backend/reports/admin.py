@@ -24,12 +24,14 @@ class ReportingPeriodAdmin(admin.ModelAdmin):
 
 from django.contrib import admin
 from .models import ReportingPeriod, Report, Comment
+from .search import search_reports
 
 @admin.register(Report)
 class ReportAdmin(admin.ModelAdmin):
     list_display = ('employee', 'period', 'status', 'is_late', 'submitted_at')
     list_filter = ('status', 'is_late', 'period')
-    search_fields = ('employee__full_name', 'employee__email', 'accomplishments', 'goals_next_week')
+    # Report content is matched through the full-text index, see get_search_results
+    search_fields = ('employee__full_name', 'employee__email')
     raw_id_fields = ('employee', 'period')
     date_hierarchy = 'created_at'
     readonly_fields = ('created_at', 'updated_at', 'submitted_at', 'is_late')
@@ -48,6 +50,13 @@ class ReportAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_search_results(self, request, queryset, search_term):
+        name_matches, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        if not search_term:
+            return name_matches, may_have_duplicates
+        content_matches = search_reports(Report.objects.all(), search_term).values('pk')
+        return queryset.filter(pk__in=name_matches.values('pk')) | queryset.filter(pk__in=content_matches), False
+
     def get_readonly_fields(self, request, obj=None):
         if obj and obj.status == Report.Status.SUBMITTED:
             return [f.name for f in self.model._meta.fields if f.name not in ['status']]
@@ -0,0 +1,115 @@
+"""
+Blocker trend detection backed by the BlockerTerm inverted index.
+
+Terms are extracted once, when a report is submitted, so trend queries
+aggregate small index rows instead of re-reading report text.
+"""
+import html
+import re
+from collections import defaultdict
+
+from django.db.models import Count
+
+from accounts.models import User
+from .models import BlockerTerm, ReportingPeriod
+
+INDEXED_FIELDS = ('blockers', 'support_needed')
+
+MIN_TERM_LENGTH = 3
+MAX_TERM_LENGTH = 64
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9'_-]*", re.UNICODE)
+
+# Words that appear in almost every blocker and say nothing about the cause
+STOPWORDS = frozenset("""
+    about after again all also and any are because been before being blocked
+    blocker blockers but can cannot could did does doing done for from get
+    getting had has have having help her him his how into its just more most
+    need needed needs none not now off once only other our out over own same
+    she should some still such than that the their them then there these they
+    this those through too under until very was waiting were what when where
+    which while who why will with would you your week
+""".split())
+
+
+def extract_terms(*texts):
+    """Return the set of normalized terms in the given (possibly HTML) texts"""
+    terms = set()
+    for text in texts:
+        if not text:
+            continue
+        plain = html.unescape(_TAG_RE.sub(' ', text)).lower()
+        for token in _TOKEN_RE.findall(plain):
+            token = token.strip("'_-")
+            if len(token) < MIN_TERM_LENGTH or token in STOPWORDS or token.isdigit():
+                continue
+            terms.add(token[:MAX_TERM_LENGTH])
+    return terms
+
+
+def index_report_blockers(report):
+    """
+    (Re)build the index rows for one report. Called when the report is
+    submitted; a resubmission after a revision replaces the earlier terms.
+    """
+    BlockerTerm.objects.filter(report=report).delete()
+    terms = extract_terms(*(getattr(report, field) for field in INDEXED_FIELDS))
+    BlockerTerm.objects.bulk_create([
+        BlockerTerm(
+            report=report,
+            period_id=report.period_id,
+            supervisor_id=report.employee.supervisor_id,
+            term=term
+        )
+        for term in sorted(terms)
+    ])
+    return len(terms)
+
+
+def top_blockers(periods=4, limit=10, supervisor=None):
+    """
+    Top recurring blocker terms per team over the last `periods` closed
+    reporting periods. Terms are ranked by how many periods they recur in,
+    then by how many reports mention them.
+
+    Returns a list of {'supervisor_id', 'supervisor_name', 'blockers'} dicts,
+    restricted to one team when `supervisor` is given.
+    """
+    period_ids = list(
+        ReportingPeriod.objects.filter(is_closed=True)
+        .order_by('-start_date')
+        .values_list('id', flat=True)[:periods]
+    )
+
+    entries = BlockerTerm.objects.filter(period_id__in=period_ids)
+    if supervisor is not None:
+        entries = entries.filter(supervisor=supervisor)
+
+    rows = (
+        entries.values('supervisor', 'term')
+        .annotate(period_count=Count('period', distinct=True), report_count=Count('id'))
+        .order_by('supervisor', '-period_count', '-report_count', 'term')
+    )
+
+    by_team = defaultdict(list)
+    for row in rows:
+        team = by_team[row['supervisor']]
+        if len(team) < limit:
+            team.append({
+                'term': row['term'],
+                'periods': row['period_count'],
+                'reports': row['report_count'],
+            })
+
+    names = dict(
+        User.objects.filter(id__in=[pk for pk in by_team if pk]).values_list('id', 'full_name')
+    )
+    return [
+        {
+            'supervisor_id': pk,
+            'supervisor_name': names.get(pk, 'Unassigned'),
+            'blockers': blockers,
+        }
+        for pk, blockers in sorted(by_team.items(), key=lambda item: names.get(item[0], ''))
+    ]
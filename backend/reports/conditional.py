@@ -0,0 +1,92 @@
+"""
+HTTP conditional requests for report endpoints.
+
+ETags and Last-Modified are derived from Report.updated_at (and, for lists,
+the newest updated_at and row count in the user's scope) together with the
+period and employee fields the report body shows and the negotiated
+response format (JSON and MessagePack bodies are different representations
+and must not share a strong ETag), so a client can
+revalidate with If-None-Match / If-Modified-Since and get 304 Not Modified,
+or guard a write with If-Match and get 412 if the report changed meanwhile.
+"""
+import hashlib
+
+from django.db.models import Count, Max, Q
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = 'The report was modified since it was fetched. Reload it and try again.'
+    default_code = 'precondition_failed'
+
+
+def make_etag(*parts):
+    digest = hashlib.md5(':'.join(str(p) for p in parts).encode(), usedforsecurity=False)
+    return quote_etag(digest.hexdigest())
+
+
+def _timestamp(value):
+    return int(value.timestamp()) if value else None
+
+
+def response_format(request):
+    """The negotiated renderer's format ('json', 'msgpack'...), to scope ETags by"""
+    renderer = getattr(request, 'accepted_renderer', None)
+    return renderer.format if renderer else ''
+
+
+def report_validators(report, *scope):
+    """(etag, last_modified) for one report; the period and employee must be loaded"""
+    period = report.period
+    etag = make_etag(
+        'report', *scope, report.pk, report.updated_at.isoformat(), report.status,
+        period.is_closed, period.end_date, period.deadline.isoformat(),
+        period.closes_at.isoformat() if period.closes_at else '',
+        report.employee.full_name
+    )
+    return etag, _timestamp(max(report.updated_at, period.updated_at, report.employee.updated_at))
+
+
+def queryset_validators(queryset, *scope):
+    """
+    (etag, last_modified) for a list of reports, from one aggregate query.
+    The row count catches deletions and scope changes, the closed count
+    catches periods closing, and the newest period and employee saves catch
+    edits to their deadlines or names; none of these touch the reports.
+    """
+    stats = queryset.order_by().aggregate(
+        last_updated=Max('updated_at'),
+        total=Count('id'),
+        closed=Count('id', filter=Q(period__is_closed=True)),
+        period_updated=Max('period__updated_at'),
+        employee_updated=Max('employee__updated_at'),
+    )
+    saves = [stats['last_updated'], stats['period_updated'], stats['employee_updated']]
+    etag = make_etag(
+        'reports', *scope, stats['total'], stats['closed'], *(saved.isoformat() if saved else '' for saved in saves)
+    )
+    return etag, _timestamp(max(filter(None, saves), default=None))
+
+
+def conditional_response(request, etag, last_modified):
+    """
+    Evaluate the request's precondition headers. Returns a 304 (safe
+    methods) or 412 (writes) response, or None if the request should proceed.
+    """
+    return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+
+def set_validators(response, etag, last_modified):
+    """Attach ETag/Last-Modified and ask clients to revalidate before reuse"""
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    patch_cache_control(response, private=True, no_cache=True)
+    # The validators identify the report data, which is served as JSON or
+    # MessagePack; a cached copy is only reusable for the same Accept
+    patch_vary_headers(response, ('Accept',))
+    return response
@@ -0,0 +1,162 @@
+"""
+Response cache for the role-scoped dashboard endpoints.
+
+dashboard-stats, team-oversight and organization-stats only change when a
+report changes status, a team changes, or a period opens or closes, so
+their payloads are cached per endpoint, role and user. Entries are never
+deleted; instead every key embeds generation tokens that writes replace:
+
+- the user's scope: `user:<id>` for employees, `team:<id>` for
+  supervisors, `org` for admins;
+- the epoch, shared by all keys, replaced when a period is created,
+  closed or reopened and after bulk changes such as user imports.
+
+A report status change replaces the tokens of its employee, of the
+employee's supervisor and of `org`. Tokens are replaced after the
+transaction commits, so a response computed from pre-commit data is
+stored under a key that is no longer read. DASHBOARD_CACHE_TTL bounds
+the staleness of anything a write path misses.
+
+Hits and misses are counted per process and added to hourly counters
+in the cache every DASHBOARD_CACHE_STATS_FLUSH_SECONDS; admins read the
+hit rate from /api/v1/reports/dashboard-cache-stats/.
+"""
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.models import User
+
+ENDPOINTS = ('dashboard-stats', 'team-oversight', 'organization-stats')
+
+EPOCH_KEY = 'dashboard:gen:epoch'
+SCOPE_KEY = 'dashboard:gen:{}'
+ENTRY_KEY = 'dashboard:{endpoint}:{role}:{user_id}:{epoch}:{scope}'
+STATS_KEY = 'dashboard:stats:{endpoint}:{outcome}:{hour}'
+STATS_RETENTION = timedelta(days=8)
+
+MISSING = object()
+
+_pending = Counter()
+_pending_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+
+def _scope(user):
+    if user.role == User.Role.EMPLOYEE:
+        return f'user:{user.pk}'
+    if user.role == User.Role.SUPERVISOR:
+        return f'team:{user.pk}'
+    return 'org'
+
+
+def _generations(keys):
+    tokens = cache.get_many(keys)
+    for key in keys:
+        if key not in tokens:
+            # Evicted or never set: a fresh token, so no old entry can match
+            cache.add(key, uuid.uuid4().hex, None)
+            tokens[key] = cache.get(key)
+    return tokens
+
+
+def lookup(endpoint, user):
+    """(key, cached payload or MISSING); two cache reads"""
+    scope_key = SCOPE_KEY.format(_scope(user))
+    tokens = _generations([EPOCH_KEY, scope_key])
+    key = ENTRY_KEY.format(
+        endpoint=endpoint, role=user.role, user_id=user.pk, epoch=tokens[EPOCH_KEY], scope=tokens[scope_key]
+    )
+    payload = cache.get(key, MISSING)
+    record(endpoint, payload is not MISSING)
+    return key, payload
+
+
+def store(key, payload):
+    cache.set(key, payload, settings.DASHBOARD_CACHE_TTL)
+
+
+def cached(endpoint, user, compute):
+    """The cached payload for the user, or compute() stored for next time"""
+    key, payload = lookup(endpoint, user)
+    if payload is MISSING:
+        payload = compute()
+        store(key, payload)
+    return payload
+
+
+def _replace(scopes):
+    keys = [EPOCH_KEY if scope is None else SCOPE_KEY.format(scope) for scope in scopes]
+    transaction.on_commit(lambda: cache.set_many({key: uuid.uuid4().hex for key in keys}, None))
+
+
+def invalidate(employee_ids=(), supervisor_ids=()):
+    """
+    After reports of these employees changed status, or these teams changed
+    (membership, or a member's name or email). Admin views are always
+    invalidated.
+    """
+    _replace(
+        [f'user:{pk}' for pk in set(employee_ids)]
+        + [f'team:{pk}' for pk in set(supervisor_ids) if pk is not None]
+        + ['org']
+    )
+
+
+def invalidate_all():
+    """After a period was created, edited, deleted, closed or reopened, or a bulk change"""
+    _replace([None])
+
+
+def record(endpoint, hit):
+    global _last_flush
+    with _pending_lock:
+        _pending[endpoint, 'hits' if hit else 'misses'] += 1
+    if time.monotonic() - _last_flush >= settings.DASHBOARD_CACHE_STATS_FLUSH_SECONDS:
+        flush_stats()
+
+
+def flush_stats():
+    """Add this process's hit and miss counts to the shared hourly counters"""
+    global _last_flush
+    with _pending_lock:
+        counts = dict(_pending)
+        _pending.clear()
+        _last_flush = time.monotonic()
+    hour = timezone.now().strftime('%Y%m%d%H')
+    for (endpoint, outcome), count in counts.items():
+        key = STATS_KEY.format(endpoint=endpoint, outcome=outcome, hour=hour)
+        cache.add(key, 0, STATS_RETENTION.total_seconds())
+        try:
+            cache.incr(key, count)
+        except ValueError:
+            # Expired between add() and incr()
+            cache.set(key, count, STATS_RETENTION.total_seconds())
+
+
+def hit_rates(hours):
+    """{endpoint: {'hits', 'misses', 'hit_rate'}} over the last `hours` hours, including this one"""
+    now = timezone.now()
+    buckets = [(now - timedelta(hours=h)).strftime('%Y%m%d%H') for h in range(hours)]
+    keys = {
+        (endpoint, outcome): [STATS_KEY.format(endpoint=endpoint, outcome=outcome, hour=b) for b in buckets]
+        for endpoint in ENDPOINTS for outcome in ('hits', 'misses')
+    }
+    counts = cache.get_many([key for bucket_keys in keys.values() for key in bucket_keys])
+    rates = {}
+    for endpoint in ENDPOINTS:
+        hits = sum(counts.get(key, 0) for key in keys[endpoint, 'hits'])
+        misses = sum(counts.get(key, 0) for key in keys[endpoint, 'misses'])
+        rates[endpoint] = {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / (hits + misses), 3) if hits + misses else None,
+        }
+    return rates
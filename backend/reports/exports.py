@@ -0,0 +1,107 @@
+"""
+Report exports (PRD section 5.4 - Admin Panel).
+
+ReportLab costs tens of milliseconds and several MB per process to import,
+and only admins exporting reports need it, so reports.views imports this
+module inside the export actions rather than at load time. Keep it that
+way: nothing on the request path should import reports.exports at module
+level (benchmarks/startup.py reports whether reportlab is loaded at boot).
+"""
+import csv
+import io
+from datetime import datetime
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+
+PDF_ROW_LIMIT = 500  # Limit for performance
+CSV_ROW_LIMIT = 1000  # Limit for stability
+
+
+def _truncate(text, length=100):
+    return text[:length] + '...' if len(text) > length else text
+
+
+def reports_csv(queryset):
+    """CSV text for the reports in `queryset` (select_related period and employee)"""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(['Employee', 'Email', 'Reporting Period', 'Status', 'Rating', 'Submitted At', 'Accomplishments', 'Goals Next Week', 'Blockers'])
+
+    for report in queryset[:CSV_ROW_LIMIT]:
+        writer.writerow([
+            report.employee.full_name,
+            report.employee.email,
+            f"{report.period.start_date} to {report.period.end_date}",
+            report.get_status_display(),
+            report.get_progress_rating_display() or 'N/A',
+            report.submitted_at.strftime('%Y-%m-%d %H:%M') if report.submitted_at else 'N/A',
+            _truncate(report.accomplishments),
+            _truncate(report.goals_next_week),
+            _truncate(report.blockers)
+        ])
+    return output.getvalue()
+
+
+def reports_pdf(queryset, start_date=None, end_date=None):
+    """PDF bytes with a summary table of the reports in `queryset`"""
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
+    elements = []
+    styles = getSampleStyleSheet()
+
+    # Custom styles
+    title_style = ParagraphStyle('CustomTitle', parent=styles['Heading1'], fontSize=18, spaceAfter=20)
+    normal_style = styles['Normal']
+
+    # Title
+    elements.append(Paragraph("Gridlog Weekly Reports Export", title_style))
+    elements.append(Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}", normal_style))
+    elements.append(Spacer(1, 20))
+
+    # Filter info
+    filter_info = []
+    if start_date:
+        filter_info.append(f"From: {start_date}")
+    if end_date:
+        filter_info.append(f"To: {end_date}")
+    if filter_info:
+        elements.append(Paragraph(f"Filters: {', '.join(filter_info)}", normal_style))
+        elements.append(Spacer(1, 10))
+
+    elements.append(Paragraph(f"Total Reports: {queryset.count()}", normal_style))
+    elements.append(Spacer(1, 20))
+
+    # Table data
+    table_data = [['Employee', 'Period', 'Status', 'Rating', 'Submitted']]
+
+    for report in queryset[:PDF_ROW_LIMIT]:
+        table_data.append([
+            report.employee.full_name,
+            f"{report.period.start_date} - {report.period.end_date}",
+            report.get_status_display(),
+            report.get_progress_rating_display() or 'N/A',
+            report.submitted_at.strftime('%Y-%m-%d %H:%M') if report.submitted_at else 'Not submitted'
+        ])
+
+    # Create table
+    table = Table(table_data, colWidths=[2*inch, 1.5*inch, 1*inch, 1*inch, 1.2*inch])
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a237e')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
+    ]))
+
+    elements.append(table)
+    doc.build(elements)
+    return buffer.getvalue()
@@ -0,0 +1,79 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from config.profiling import StackSampler
+
+
+class Command(BaseCommand):
+    help = (
+        "Stack-sample GET requests to an API path in-process and write collapsed stacks "
+        "(flamegraph.pl / speedscope). Paths without a leading slash are report actions, "
+        "e.g. `team-oversight`. By default the request is made as the seeded user of --role "
+        "with the largest team (see seed_large_org)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--user', help="Email of the user to make the requests as")
+        parser.add_argument('--role', choices=User.Role.values, default=User.Role.SUPERVISOR)
+        parser.add_argument('--domain', default='bench.gridlog.test', help="Email domain used by seed_large_org")
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument('--warmup', type=int, default=2, help="Unsampled requests first")
+        parser.add_argument('--interval-ms', type=float, default=None, help="Defaults to PROFILING_SAMPLE_INTERVAL_MS")
+        parser.add_argument('--output', help="Collapsed stacks file; defaults to profile-<path>.folded")
+        parser.add_argument('--top', type=int, default=15, help="Hottest frames to print")
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not path.startswith('/'):
+            path = f"/api/v1/reports/{path.strip('/')}/"
+        user = self.pick_user(options)
+
+        client = APIClient(SERVER_NAME='localhost')
+        client.force_authenticate(user)
+        for _ in range(options['warmup']):
+            client.get(path)
+
+        interval = options['interval_ms'] or settings.PROFILING_SAMPLE_INTERVAL_MS
+        sampler = StackSampler(interval / 1000)
+        durations = []
+        for _ in range(options['iterations']):
+            started = time.perf_counter()
+            sampler.start()
+            response = client.get(path)
+            sampler.stop()
+            durations.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                raise CommandError(f"GET {path} returned {response.status_code}")
+
+        output = options['output'] or f"profile-{path.strip('/').replace('/', '-')}.folded"
+        with open(output, 'w') as f:
+            f.write(sampler.collapsed())
+
+        team = user.team_members.count()
+        self.stdout.write(
+            f"GET {path} as {user.email} ({user.role}, team of {team}): {len(durations)} requests, "
+            f"mean {sum(durations) / len(durations) * 1000:.1f} ms, {sampler.samples} samples"
+        )
+        for frame, samples in sampler.top_leaves(options['top']):
+            self.stdout.write(f"{samples * 100 / max(sampler.samples, 1):6.1f}%  {frame}")
+        self.stdout.write(self.style.SUCCESS(f"Wrote {output}"))
+
+    def pick_user(self, options):
+        if options['user']:
+            user = User.objects.filter(email=options['user']).first()
+            if user is None:
+                raise CommandError(f"No user {options['user']}")
+            return user
+        user = (
+            User.objects.filter(email__endswith=f"@{options['domain']}", role=options['role'], is_active=True)
+            .annotate(team=Count('team_members')).order_by('-team', 'id').first()
+        )
+        if user is None:
+            raise CommandError(f"No seeded {options['role']} @{options['domain']}; run seed_large_org first or pass --user")
+        return user
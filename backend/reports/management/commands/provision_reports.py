@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from reports.models import ReportingPeriod
+from reports.provisioning import PROVISION_BATCH_SIZE, provision_period_reports
+
+
+class Command(BaseCommand):
+    help = "Create Not Started reports for active employees missing one in existing reporting periods"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help="Include closed periods (default: open periods only)"
+        )
+        parser.add_argument('--batch-size', type=int, default=PROVISION_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        periods = ReportingPeriod.objects.order_by('start_date')
+        if not options['all']:
+            periods = periods.filter(is_closed=False)
+
+        total = 0
+        for period in periods:
+            created = provision_period_reports(period, batch_size=options['batch_size'])
+            total += created
+            self.stdout.write(f"{period}: {created} reports provisioned")
+
+        self.stdout.write(self.style.SUCCESS(f"Provisioned {total} reports"))
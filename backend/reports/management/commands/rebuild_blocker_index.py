@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from reports.blockers import INDEXED_FIELDS, extract_terms
+from reports.models import Report, BlockerTerm
+
+BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = "Rebuild the blocker term index from all submitted and reviewed reports"
+
+    def handle(self, *args, **options):
+        reports = Report.objects.filter(
+            status__in=[Report.Status.SUBMITTED, Report.Status.REVIEWED]
+        ).values_list('id', 'period_id', 'employee__supervisor_id', *INDEXED_FIELDS)
+
+        indexed = 0
+        pending = []
+        with transaction.atomic():
+            BlockerTerm.objects.all().delete()
+            for report_id, period_id, supervisor_id, *texts in reports.iterator(chunk_size=BATCH_SIZE):
+                pending.extend(
+                    BlockerTerm(report_id=report_id, period_id=period_id, supervisor_id=supervisor_id, term=term)
+                    for term in sorted(extract_terms(*texts))
+                )
+                indexed += 1
+                if len(pending) >= BATCH_SIZE:
+                    BlockerTerm.objects.bulk_create(pending)
+                    pending = []
+            BlockerTerm.objects.bulk_create(pending)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Indexed {BlockerTerm.objects.count()} terms from {indexed} reports"
+        ))
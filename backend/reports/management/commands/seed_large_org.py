@@ -0,0 +1,204 @@
+import random
+from datetime import datetime, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.models import AuditLog, User
+from notifications.models import Notification
+from reports.models import Comment, Report, ReportingPeriod
+
+WORDS = (
+    "deployed migrated reviewed pipeline staging customer release dashboard database "
+    "latency incident vendor contract onboarding sprint backlog blocked waiting access "
+    "approval budget hiring outage refactor testing documentation"
+).split()
+
+# Share of reports in the open period per status; closed periods are all reviewed or late drafts
+OPEN_PERIOD_STATUSES = [
+    (Report.Status.NOT_STARTED, 0.25),
+    (Report.Status.DRAFT, 0.25),
+    (Report.Status.SUBMITTED, 0.35),
+    (Report.Status.REVISION_REQUESTED, 0.05),
+    (Report.Status.REVIEWED, 0.10),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a synthetic organisation for benchmarks (see benchmarks/api_endpoints.py). "
+        "Intended for a throwaway database; every seeded user has an address at --domain."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--employees', type=int, default=1000)
+        parser.add_argument('--supervisors', type=int, default=50)
+        parser.add_argument('--admins', type=int, default=2)
+        parser.add_argument('--periods', type=int, default=12, help="Weekly periods, the newest one open")
+        parser.add_argument('--comments-per-report', type=int, default=2)
+        parser.add_argument('--notifications-per-user', type=int, default=30)
+        parser.add_argument('--audit-rows', type=int, default=20000)
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--password', default='benchpass123', help="Password for every seeded user")
+        parser.add_argument('--domain', default='bench.gridlog.test')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--flush', action='store_true', help="Delete previously seeded users first")
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        domain = options['domain']
+
+        seeded = User.objects.filter(email__endswith=f'@{domain}')
+        if seeded.exists():
+            if not options['flush']:
+                raise CommandError(f"Users @{domain} already exist; pass --flush to replace them")
+            # Reports, comments and notifications cascade from their users;
+            # audit rows would only lose their actor
+            deleted = AuditLog.objects.filter(actor__in=seeded).delete()[0] + seeded.delete()[0]
+            self.stdout.write(f"Deleted {deleted} previously seeded rows")
+
+        with transaction.atomic():
+            password = make_password(options['password'])
+            admins = self.create_users(User.Role.ADMIN, options['admins'], domain, password)
+            supervisors = self.create_users(User.Role.SUPERVISOR, options['supervisors'], domain, password)
+            employees = self.create_users(User.Role.EMPLOYEE, options['employees'], domain, password, supervisors)
+            periods = self.create_periods(options['periods'])
+            reports = self.create_reports(employees, periods)
+            comments = self.create_comments(reports, options['comments_per_report'])
+            notifications = self.create_notifications(
+                employees + supervisors, reports, options['notifications_per_user']
+            )
+            audit_rows = self.create_audit_rows(admins + supervisors + employees, reports, options['audit_rows'])
+
+        call_command('rebuild_blocker_index', stdout=self.stdout)
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {len(admins)} admins, {len(supervisors)} supervisors, {len(employees)} employees, "
+            f"{len(periods)} periods, {len(reports)} reports, {comments} comments, "
+            f"{notifications} notifications, {audit_rows} audit rows"
+        ))
+
+    def bulk_create(self, model, objects):
+        return model.objects.bulk_create(objects, batch_size=self.batch_size)
+
+    def text(self, words=12):
+        return ' '.join(self.rng.choices(WORDS, k=words))
+
+    def create_users(self, role, count, domain, password, supervisors=None):
+        users = [
+            User(
+                email=f'{role}{i}@{domain}',
+                full_name=f'{role.title()} {i}',
+                role=role,
+                password=password,
+                password_reset_required=False,
+                is_staff=role == User.Role.ADMIN,
+                supervisor=supervisors[i % len(supervisors)] if supervisors else None,
+            )
+            for i in range(count)
+        ]
+        self.bulk_create(User, users)
+        # bulk_create only returns primary keys on some backends
+        return list(User.objects.filter(role=role, email__endswith=f'@{domain}').order_by('id'))
+
+    def create_periods(self, count):
+        monday = timezone.localdate() - timedelta(days=timezone.localdate().weekday())
+        periods = []
+        for weeks_ago in range(count - 1, -1, -1):
+            start = monday - timedelta(weeks=weeks_ago)
+            friday = datetime.combine(start + timedelta(days=4), datetime.min.time())
+            period, _ = ReportingPeriod.objects.get_or_create(
+                start_date=start,
+                end_date=start + timedelta(days=6),
+                defaults={
+                    'deadline': timezone.make_aware(friday + timedelta(hours=23, minutes=59, seconds=59)),
+                    'is_closed': weeks_ago > 0,
+                }
+            )
+            periods.append(period)
+        return periods
+
+    def create_reports(self, employees, periods):
+        statuses, weights = zip(*OPEN_PERIOD_STATUSES)
+        now = timezone.now()
+        reports = []
+        for period in periods:
+            for employee in employees:
+                if period.is_closed:
+                    status = Report.Status.REVIEWED if self.rng.random() < 0.9 else Report.Status.DRAFT
+                else:
+                    status = self.rng.choices(statuses, weights)[0]
+                written = status != Report.Status.NOT_STARTED
+                submitted = status in (Report.Status.SUBMITTED, Report.Status.REVIEWED)
+                reports.append(Report(
+                    employee=employee,
+                    period=period,
+                    status=status,
+                    accomplishments=self.text(30) if written else '',
+                    goals_next_week=self.text(20) if written else '',
+                    blockers=self.text(8) if written and self.rng.random() < 0.4 else '',
+                    progress_rating=self.rng.choice(Report.ProgressRating.values) if written else '',
+                    is_late=submitted and self.rng.random() < 0.1,
+                    submitted_at=now if submitted else None,
+                    reviewed_at=now if status == Report.Status.REVIEWED else None,
+                ))
+        self.bulk_create(Report, reports)
+        return list(
+            Report.objects.filter(employee__in=employees).select_related('employee').order_by('id')
+        )
+
+    def create_comments(self, reports, per_report):
+        written = [r for r in reports if r.status != Report.Status.NOT_STARTED]
+        comments = [
+            Comment(
+                report=report,
+                author=report.employee.supervisor if i % 2 == 0 else report.employee,
+                body=self.text(15)
+            )
+            for report in written
+            for i in range(per_report)
+        ]
+        self.bulk_create(Comment, comments)
+        return len(comments)
+
+    def create_notifications(self, users, reports, per_user):
+        reports_by_employee = {}
+        for report in reports:
+            reports_by_employee.setdefault(report.employee_id, []).append(report)
+        types = Notification.NotificationType.values
+        notifications = []
+        for user in users:
+            own = reports_by_employee.get(user.id)
+            for _ in range(per_user):
+                notifications.append(Notification(
+                    recipient=user,
+                    type=self.rng.choice(types),
+                    message=self.text(6),
+                    is_read=self.rng.random() < 0.7,
+                    related_report=self.rng.choice(own) if own else None,
+                ))
+        self.bulk_create(Notification, notifications)
+        return len(notifications)
+
+    def create_audit_rows(self, users, reports, count):
+        actions = [
+            AuditLog.Action.LOGIN, AuditLog.Action.REPORT_SUBMIT,
+            AuditLog.Action.REPORT_REVIEW, AuditLog.Action.COMMENT_ADD,
+        ]
+        now = timezone.now()
+        rows = []
+        for i in range(count):
+            report = self.rng.choice(reports)
+            rows.append(AuditLog(
+                actor=self.rng.choice(users),
+                action=self.rng.choice(actions),
+                target_model='report',
+                target_id=str(report.id),
+                metadata={"message": "Seeded"},
+                timestamp=now - timedelta(minutes=i),
+            ))
+        self.bulk_create(AuditLog, rows)
+        return len(rows)
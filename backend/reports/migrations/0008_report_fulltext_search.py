@@ -0,0 +1,73 @@
+from django.db import migrations
+
+# MySQL: native FULLTEXT indexes, maintained by InnoDB
+MYSQL_FORWARD = [
+    "ALTER TABLE reports_report ADD FULLTEXT INDEX reports_report_fulltext "
+    "(accomplishments, goals_next_week, blockers)",
+    "ALTER TABLE reports_comment ADD FULLTEXT INDEX reports_comment_body_fulltext (body)",
+]
+MYSQL_REVERSE = [
+    "ALTER TABLE reports_comment DROP INDEX reports_comment_body_fulltext",
+    "ALTER TABLE reports_report DROP INDEX reports_report_fulltext",
+]
+
+# SQLite: one FTS5 row per report (rowid = report id) holding the report text
+# and its concatenated comments, kept in sync by triggers
+SQLITE_COMMENTS = (
+    "(SELECT COALESCE(group_concat(body, ' '), '') FROM reports_comment WHERE report_id = {report})"
+)
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE reports_report_fts USING fts5("
+    "accomplishments, goals_next_week, blockers, comments, tokenize='porter unicode61')",
+    "INSERT INTO reports_report_fts (rowid, accomplishments, goals_next_week, blockers, comments) "
+    "SELECT id, accomplishments, goals_next_week, blockers, " + SQLITE_COMMENTS.format(report='reports_report.id') + " "
+    "FROM reports_report",
+    "CREATE TRIGGER reports_report_fts_insert AFTER INSERT ON reports_report BEGIN "
+    "INSERT INTO reports_report_fts (rowid, accomplishments, goals_next_week, blockers, comments) "
+    "VALUES (new.id, new.accomplishments, new.goals_next_week, new.blockers, ''); END",
+    "CREATE TRIGGER reports_report_fts_update AFTER UPDATE OF accomplishments, goals_next_week, blockers "
+    "ON reports_report BEGIN "
+    "UPDATE reports_report_fts SET accomplishments = new.accomplishments, "
+    "goals_next_week = new.goals_next_week, blockers = new.blockers WHERE rowid = new.id; END",
+    "CREATE TRIGGER reports_report_fts_delete AFTER DELETE ON reports_report BEGIN "
+    "DELETE FROM reports_report_fts WHERE rowid = old.id; END",
+    "CREATE TRIGGER reports_comment_fts_insert AFTER INSERT ON reports_comment BEGIN "
+    "UPDATE reports_report_fts SET comments = " + SQLITE_COMMENTS.format(report='new.report_id') + " "
+    "WHERE rowid = new.report_id; END",
+    "CREATE TRIGGER reports_comment_fts_update AFTER UPDATE OF body ON reports_comment BEGIN "
+    "UPDATE reports_report_fts SET comments = " + SQLITE_COMMENTS.format(report='new.report_id') + " "
+    "WHERE rowid = new.report_id; END",
+    "CREATE TRIGGER reports_comment_fts_delete AFTER DELETE ON reports_comment BEGIN "
+    "UPDATE reports_report_fts SET comments = " + SQLITE_COMMENTS.format(report='old.report_id') + " "
+    "WHERE rowid = old.report_id; END",
+]
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS reports_comment_fts_delete",
+    "DROP TRIGGER IF EXISTS reports_comment_fts_update",
+    "DROP TRIGGER IF EXISTS reports_comment_fts_insert",
+    "DROP TRIGGER IF EXISTS reports_report_fts_delete",
+    "DROP TRIGGER IF EXISTS reports_report_fts_update",
+    "DROP TRIGGER IF EXISTS reports_report_fts_insert",
+    "DROP TABLE IF EXISTS reports_report_fts",
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        for sql in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0007_alter_reportingperiod_deadline'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({'mysql': MYSQL_FORWARD, 'sqlite': SQLITE_FORWARD}),
+            _run({'mysql': MYSQL_REVERSE, 'sqlite': SQLITE_REVERSE}),
+        ),
+    ]
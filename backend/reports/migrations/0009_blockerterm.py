@@ -0,0 +1,38 @@
+# Generated by Django 4.2.28 on 2026-10-19 15:04
+
+import datetime
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('reports', '0008_report_fulltext_search'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='reportingperiod',
+            name='deadline',
+            field=models.DateTimeField(default=datetime.datetime(2026, 10, 19, 23, 59, 59, tzinfo=datetime.timezone.utc), help_text='Submission deadline (Friday 11:59 PM)'),
+        ),
+        migrations.CreateModel(
+            name='BlockerTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(help_text='Normalized blocker term', max_length=64)),
+                ('period', models.ForeignKey(help_text='Reporting period of the report', on_delete=django.db.models.deletion.CASCADE, related_name='blocker_terms', to='reports.reportingperiod')),
+                ('report', models.ForeignKey(help_text='The submitted report the term was extracted from', on_delete=django.db.models.deletion.CASCADE, related_name='blocker_terms', to='reports.report')),
+                ('supervisor', models.ForeignKey(blank=True, help_text='Team (supervisor) the employee belonged to when the report was submitted', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Blocker Term',
+                'verbose_name_plural': 'Blocker Terms',
+                'indexes': [models.Index(fields=['supervisor', 'period', 'term'], name='reports_blo_supervi_bd63f8_idx')],
+                'unique_together': {('report', 'term')},
+            },
+        ),
+    ]
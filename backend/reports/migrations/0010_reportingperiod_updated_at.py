@@ -0,0 +1,18 @@
+# Generated by Django 4.2.28 on 2026-10-19 17:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0009_blockerterm'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reportingperiod',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, help_text='Timestamp of the last save; part of report list ETags, which show the period'),
+        ),
+    ]
@@ -39,6 +39,10 @@ class ReportingPeriod(models.Model):
         blank=True,
         help_text="Scheduled datetime to automatically close the period"
     )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="Timestamp of the last save; part of report list ETags, which show the period"
+    )
     
     objects = ReportingPeriodManager()
     
@@ -277,4 +281,48 @@ class Comment(models.Model):
         """Ensure we only allow one level of threading (PRD section 13 - Out of Scope)"""
         if self.parent and self.parent.parent:
             raise ValidationError("Reply threading beyond one level is not supported in v1")
-        super().clean()
\ No newline at end of file
+        super().clean()
+
+class BlockerTerm(models.Model):
+    """
+    Inverted index over report blockers: one row per normalized term found in
+    a submitted report's `blockers` or `support_needed`. Period and team are
+    copied from the report at submission time so trend queries never join
+    back to report text.
+    """
+
+    report = models.ForeignKey(
+        'reports.Report',
+        on_delete=models.CASCADE,
+        related_name='blocker_terms',
+        help_text="The submitted report the term was extracted from"
+    )
+    period = models.ForeignKey(
+        'reports.ReportingPeriod',
+        on_delete=models.CASCADE,
+        related_name='blocker_terms',
+        help_text="Reporting period of the report"
+    )
+    supervisor = models.ForeignKey(
+        'accounts.User',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text="Team (supervisor) the employee belonged to when the report was submitted"
+    )
+    term = models.CharField(
+        max_length=64,
+        help_text="Normalized blocker term"
+    )
+
+    class Meta:
+        unique_together = ['report', 'term']
+        verbose_name = "Blocker Term"
+        verbose_name_plural = "Blocker Terms"
+        indexes = [
+            models.Index(fields=['supervisor', 'period', 'term']),
+        ]
+
+    def __str__(self):
+        return f"{self.term} ({self.period})"
@@ -0,0 +1,57 @@
+"""
+Pre-provisioning of NOT_STARTED reports.
+
+Every active employee gets a report row as soon as a reporting period
+exists, so "who hasn't started" is an indexed (period, status) filter
+rather than a subtraction against the user table.
+"""
+from accounts.models import User
+from .models import Report, ReportingPeriod
+
+PROVISION_BATCH_SIZE = 1000
+
+
+def provision_period_reports(period, batch_size=PROVISION_BATCH_SIZE):
+    """
+    Bulk-create a NOT_STARTED report for each active employee who has no
+    report in `period` yet. Safe to run repeatedly or concurrently: existing
+    rows are skipped and the (employee, period) unique constraint absorbs
+    races. Returns the number of employees that were missing a report.
+    """
+    employee_ids = list(
+        User.objects.filter(role=User.Role.EMPLOYEE, is_active=True)
+        # Backfilled past periods only count employees who had joined by then
+        .filter(created_at__date__lte=period.end_date)
+        .exclude(reports__period=period)
+        .order_by('id')
+        .values_list('id', flat=True)
+    )
+    for start in range(0, len(employee_ids), batch_size):
+        Report.objects.bulk_create(
+            [
+                Report(employee_id=pk, period=period, status=Report.Status.NOT_STARTED)
+                for pk in employee_ids[start:start + batch_size]
+            ],
+            ignore_conflicts=True
+        )
+    return len(employee_ids)
+
+
+def provision_employee_reports(employee_ids):
+    """
+    Bulk-create a NOT_STARTED report in every open period for the given
+    users, for employees who are created, reactivated or made employees
+    mid-period. Users who are not active employees and existing reports
+    are skipped. Returns the number of reports requested.
+    """
+    employee_ids = list(
+        User.objects.filter(id__in=list(employee_ids), role=User.Role.EMPLOYEE, is_active=True)
+        .values_list('id', flat=True)
+    )
+    period_ids = list(ReportingPeriod.objects.filter(is_closed=False).values_list('id', flat=True))
+    reports = [
+        Report(employee_id=employee_id, period_id=period_id, status=Report.Status.NOT_STARTED)
+        for period_id in period_ids for employee_id in employee_ids
+    ]
+    Report.objects.bulk_create(reports, batch_size=PROVISION_BATCH_SIZE, ignore_conflicts=True)
+    return len(reports)
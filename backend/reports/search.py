@@ -0,0 +1,91 @@
+"""
+Full-text search over report content and comment bodies.
+
+MySQL uses the FULLTEXT indexes on reports_report and reports_comment;
+SQLite (local development and tests) uses the reports_report_fts FTS5 table,
+which triggers keep in sync with reports and their comments. Both are
+created by migration 0008_report_fulltext_search.
+"""
+import re
+
+from django.db import connection
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+SEARCH_FIELDS = ('accomplishments', 'goals_next_week', 'blockers')
+
+# InnoDB ignores shorter tokens by default (innodb_ft_min_token_size);
+# drop them on SQLite too so both backends rank the same words.
+MIN_TOKEN_LENGTH = 3
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+_MYSQL_REPORT_MATCH = (
+    "MATCH (reports_report.accomplishments, reports_report.goals_next_week, reports_report.blockers) "
+    "AGAINST (%s IN NATURAL LANGUAGE MODE)"
+)
+_MYSQL_COMMENT_MATCH = (
+    "(SELECT COALESCE(SUM(MATCH (c.body) AGAINST (%s IN NATURAL LANGUAGE MODE)), 0) "
+    "FROM reports_comment c "
+    "WHERE c.report_id = reports_report.id AND MATCH (c.body) AGAINST (%s IN NATURAL LANGUAGE MODE))"
+)
+# Matching ids, each from a MATCH ... AGAINST in a WHERE clause so MySQL
+# answers it from the FULLTEXT index; the rank above is only for ordering
+_MYSQL_REPORT_MATCHES = (
+    "SELECT r.id FROM reports_report r "
+    "WHERE MATCH (r.accomplishments, r.goals_next_week, r.blockers) AGAINST (%s IN NATURAL LANGUAGE MODE)"
+)
+_MYSQL_COMMENT_MATCHES = (
+    "SELECT c.report_id FROM reports_comment c "
+    "WHERE MATCH (c.body) AGAINST (%s IN NATURAL LANGUAGE MODE)"
+)
+_SQLITE_RANK = (
+    "(SELECT -bm25(reports_report_fts) FROM reports_report_fts "
+    "WHERE reports_report_fts MATCH %s AND reports_report_fts.rowid = reports_report.id)"
+)
+_SQLITE_MATCHES = "SELECT rowid FROM reports_report_fts WHERE reports_report_fts MATCH %s"
+
+
+def search_terms(query):
+    """Split a free-text query into the words both backends index"""
+    return [t for t in _TOKEN_RE.findall(query.lower()) if len(t) >= MIN_TOKEN_LENGTH]
+
+
+def search_reports(queryset, query):
+    """
+    Filter a Report queryset to reports whose content or comments match
+    `query` and annotate each with `search_rank` (higher is better).
+    The queryset's existing filters, such as role scoping, are kept.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return queryset.none()
+
+    if connection.vendor == 'mysql':
+        text = ' '.join(terms)
+        rank = (
+            RawSQL(_MYSQL_REPORT_MATCH, [text], output_field=FloatField())
+            + RawSQL(_MYSQL_COMMENT_MATCH, [text, text], output_field=FloatField())
+        )
+        return queryset.filter(
+            Q(id__in=RawSQL(_MYSQL_REPORT_MATCHES, [text]))
+            | Q(id__in=RawSQL(_MYSQL_COMMENT_MATCHES, [text]))
+        ).annotate(search_rank=rank)
+
+    if connection.vendor == 'sqlite':
+        # Quote each term so user input can't inject FTS5 query syntax;
+        # OR mirrors MySQL's natural language mode, bm25 does the ranking.
+        match = ' OR '.join(f'"{t}"' for t in terms)
+        return queryset.filter(
+            id__in=RawSQL(_SQLITE_MATCHES, [match])
+        ).annotate(search_rank=RawSQL(_SQLITE_RANK, [match], output_field=FloatField()))
+
+    # Other backends: unranked substring match
+    condition = Q()
+    for term in terms:
+        for field in SEARCH_FIELDS:
+            condition |= Q(**{f'{field}__icontains': term})
+        condition |= Q(comments__body__icontains=term)
+    return queryset.filter(
+        id__in=queryset.model.objects.filter(condition).values('id')
+    ).annotate(search_rank=Value(0.0, output_field=FloatField()))
@@ -1,7 +1,10 @@
+from django.db.models import F
+from django.utils import timezone
 from rest_framework import serializers
 from .models import ReportingPeriod, Report, Comment
 from accounts.models import User
 from .utils import sanitize_html
+from config.middleware import serializer_timed
 
 class ReportingPeriodSerializer(serializers.ModelSerializer):
     """
@@ -27,7 +30,9 @@ class ReportingPeriodSerializer(serializers.ModelSerializer):
 class ReportSerializer(serializers.ModelSerializer):
     """
     PRD section 6.1 - Report Fields
-    Basic report serializer for list views and creating new reports
+    Basic report serializer for list views and creating new reports.
+    The list actions render it through report_list_data(), which must
+    produce the same fields.
     """
     period = ReportingPeriodSerializer(read_only=True)
     employee_name = serializers.CharField(source='employee.full_name', read_only=True)
@@ -83,6 +88,109 @@ class ReportSerializer(serializers.ModelSerializer):
                 data[field] = sanitize_html(data[field])
         return data
 
+# Read-only fast path for report lists. Building each row through
+# ReportSerializer's field machinery (attribute lookups per field, the nested
+# period serializer, the employee.full_name source) dominates list requests
+# of hundreds of reports; report_list_data() builds the same dicts directly
+# from the .values() rows of one joined query.
+
+def report_list_rows(queryset):
+    """`queryset` as the .values() rows report_list_data() needs, still lazy and paginatable"""
+    return queryset.values(
+        'id',
+        'employee_id',
+        'status',
+        'accomplishments',
+        'goals_next_week',
+        'progress_rating',
+        'blockers',
+        'support_needed',
+        'additional_notes',
+        'is_late',
+        'submitted_at',
+        'created_at',
+        'updated_at',
+        'period_id',
+        employee_name=F('employee__full_name'),
+        period_start_date=F('period__start_date'),
+        period_end_date=F('period__end_date'),
+        period_deadline=F('period__deadline'),
+        period_closes_at=F('period__closes_at'),
+        period_is_closed=F('period__is_closed'),
+    )
+
+
+def _datetime(value, tz):
+    """DateTimeField.to_representation for an aware datetime, ISO 8601 in `tz`"""
+    if not value:
+        return None
+    value = value.astimezone(tz).isoformat()
+    return value[:-6] + 'Z' if value.endswith('+00:00') else value
+
+
+@serializer_timed
+def report_list_data(rows):
+    """ReportSerializer(many=True).data for report_list_rows() rows; serializes to identical JSON"""
+    tz = timezone.get_current_timezone()
+    return [
+        {
+            'id': row['id'],
+            'employee': row['employee_id'],
+            'employee_name': row['employee_name'],
+            'period': {
+                'id': row['period_id'],
+                'start_date': row['period_start_date'].isoformat(),
+                'end_date': row['period_end_date'].isoformat(),
+                'deadline': _datetime(row['period_deadline'], tz),
+                'closes_at': _datetime(row['period_closes_at'], tz),
+                'is_closed': row['period_is_closed'],
+            },
+            'status': row['status'],
+            'accomplishments': row['accomplishments'],
+            'goals_next_week': row['goals_next_week'],
+            'progress_rating': row['progress_rating'],
+            'blockers': row['blockers'],
+            'support_needed': row['support_needed'],
+            'additional_notes': row['additional_notes'],
+            'is_late': row['is_late'],
+            'submitted_at': _datetime(row['submitted_at'], tz),
+            'created_at': _datetime(row['created_at'], tz),
+            'updated_at': _datetime(row['updated_at'], tz),
+        }
+        for row in rows
+    ]
+
+
+class ReportAutosaveSerializer(ReportSerializer):
+    """
+    PRD section 6.2 - Report Status Lifecycle
+    Validates a draft autosave: only the fields that changed, plus the
+    report's `updated_at` as last seen by the client (`version`).
+    """
+    version = serializers.DateTimeField(write_only=True)
+
+    class Meta(ReportSerializer.Meta):
+        fields = ['version'] + [
+            'accomplishments',
+            'goals_next_week',
+            'progress_rating',
+            'blockers',
+            'support_needed',
+            'additional_notes'
+        ]
+        read_only_fields = []
+
+    def validate(self, data):
+        unknown = set(self.initial_data) - set(self.fields)
+        if unknown:
+            raise serializers.ValidationError(
+                f"Fields cannot be autosaved: {', '.join(sorted(unknown))}"
+            )
+        if 'progress_rating' in data and data['progress_rating'] is None:
+            data['progress_rating'] = ''
+        return super().validate(data)
+
+
 class ReportDetailSerializer(ReportSerializer):
     """
     PRD section 6.1 - Report Fields
@@ -105,6 +213,22 @@ class RejectReportSerializer(serializers.Serializer):
         }
     )
 
+class BatchReportActionSerializer(serializers.Serializer):
+    """
+    Serializer for supervisor batch workflow actions (review, request revision)
+    """
+    MAX_REPORTS = 200
+
+    report_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        min_length=1,
+        max_length=MAX_REPORTS
+    )
+    comment = serializers.CharField(max_length=2000, required=False)
+
+    def validate_report_ids(self, value):
+        return list(dict.fromkeys(value))
+
 class CommentSerializer(serializers.ModelSerializer):
     """
     PRD section 7 - Notification System
@@ -134,6 +258,9 @@ class CommentSerializer(serializers.ModelSerializer):
         PRD section 13 - Out of Scope: "Reply threading beyond one level is not supported in v1"
         Only return direct replies (one level of threading)
         """
+        if obj.parent_id:
+            # A reply has no replies of its own; skip the query
+            return []
         replies = obj.replies.all()
         return CommentSerializer(replies, many=True).data
     
@@ -5,9 +5,53 @@ from django.db import transaction
 from .models import ReportingPeriod, Report
 from notifications.models import Notification
 from accounts.models import AuditLog, User
+from config.locks import cache_lock
+from config.task_telemetry import record_items
+from . import dashboard_cache
+from .provisioning import provision_period_reports
 
-@shared_task
-@transaction.atomic
+# Upper bound on a period task run; the lock expires after this even if the
+# worker holding it dies. Both period tasks are idempotent, so they are
+# acknowledged late and redelivered if a worker is lost mid-run.
+PERIOD_TASK_LOCK_TIMEOUT = 10 * 60
+
+
+def close_periods(message, **filters):
+    """
+    Close the open reporting periods matching `filters` with one UPDATE and
+    one bulk audit insert. The candidate rows are locked first, so a run
+    that races past the task lock blocks here and then finds nothing left
+    to close: every period is closed and logged exactly once.
+    """
+    with transaction.atomic():
+        period_ids = list(
+            ReportingPeriod.objects.select_for_update()
+            .filter(is_closed=False, **filters)
+            .values_list('id', flat=True)
+        )
+        if not period_ids:
+            return []
+
+        closed_at = str(timezone.now())
+        ReportingPeriod.objects.filter(id__in=period_ids).update(is_closed=True, updated_at=timezone.now())
+        dashboard_cache.invalidate_all()
+        AuditLog.objects.bulk_create([
+            AuditLog(
+                actor=None,  # System action
+                action=AuditLog.Action.REPORT_PERIOD_CLOSE,
+                target_model='reportingperiod',
+                target_id=str(pk),
+                metadata={
+                    "message": message,
+                    "period_id": str(pk),
+                    "closed_at": closed_at
+                }
+            )
+            for pk in period_ids
+        ])
+    return period_ids
+
+@shared_task(acks_late=True, reject_on_worker_lost=True)
 def create_new_reporting_period():
     """
     PRD section 6.3 - Reporting Period Rules
@@ -26,91 +70,66 @@ def create_new_reporting_period():
         start_date = today
     
     end_date = start_date + timedelta(days=6)  # Sunday
-    
-    # Create the new period
-    period, created = ReportingPeriod.objects.get_or_create(
-        start_date=start_date,
-        end_date=end_date,
-        defaults={
-            'deadline': timezone.make_aware(
-                datetime.combine(start_date + timedelta(days=4), datetime.min.time()) + 
-                timedelta(hours=23, minutes=59, seconds=59)
-            ),
-            'is_closed': False
-        }
-    )
-    
-    if created:
-        # Log the creation in audit log
-        AuditLog.log(
-            actor=None,  # System action
-            action=AuditLog.Action.REPORT_PERIOD_CREATE,
-            target=period,
-            metadata={
-                "message": "New reporting period auto-created",
-                "start_date": str(start_date),
-                "end_date": str(end_date),
-                "deadline": str(period.deadline)
-            }
-        )
-    
-    # Close previous periods if they exist and aren't already closed
-    # Using .update() is more efficient, but we fetch them first to log them
-    previous_periods_list = list(ReportingPeriod.objects.filter(
-        end_date__lt=start_date,
-        is_closed=False
-    ))
-    
-    count = len(previous_periods_list)
-    if count > 0:
-        # Perform mass update
-        ReportingPeriod.objects.filter(
-            id__in=[p.id for p in previous_periods_list]
-        ).update(is_closed=True)
-        
-        # Log the closing in audit log
-        for p in previous_periods_list:
-            AuditLog.log(
-                actor=None,  # System action
-                action=AuditLog.Action.REPORT_PERIOD_CLOSE,
-                target=p,
-                metadata={
-                    "message": "Previous reporting period closed",
-                    "period_id": str(p.id)
+
+    with cache_lock('reports:create-period', PERIOD_TASK_LOCK_TIMEOUT) as acquired:
+        if not acquired:
+            return "Skipped: reporting period creation already in progress"
+
+        with transaction.atomic():
+            # Create the new period
+            period, created = ReportingPeriod.objects.get_or_create(
+                start_date=start_date,
+                end_date=end_date,
+                defaults={
+                    'deadline': timezone.make_aware(
+                        datetime.combine(start_date + timedelta(days=4), datetime.min.time()) + 
+                        timedelta(hours=23, minutes=59, seconds=59)
+                    ),
+                    'is_closed': False
                 }
             )
-    
-    return f"Created new reporting period ({start_date} to {end_date}) and closed {count} old periods."
 
-@shared_task
-@transaction.atomic
+            if created:
+                # Log the creation in audit log
+                AuditLog.log(
+                    actor=None,  # System action
+                    action=AuditLog.Action.REPORT_PERIOD_CREATE,
+                    target=period,
+                    metadata={
+                        "message": "New reporting period auto-created",
+                        "start_date": str(start_date),
+                        "end_date": str(end_date),
+                        "deadline": str(period.deadline)
+                    }
+                )
+
+        # Give every active employee a Not Started report for the new week
+        provisioned = provision_period_reports(period)
+        dashboard_cache.invalidate_all()
+
+        # Close previous periods if they exist and aren't already closed
+        closed = close_periods("Previous reporting period closed", end_date__lt=start_date)
+
+    record_items(provisioned + len(closed))
+    return (
+        f"Created new reporting period ({start_date} to {end_date}), provisioned {provisioned} reports "
+        f"and closed {len(closed)} old periods."
+    )
+
+@shared_task(acks_late=True, reject_on_worker_lost=True)
 def auto_close_reporting_periods():
     """
     Finds reporting periods that have passed their 'closes_at' time
     but are still marked as open, and closes them.
     """
-    now = timezone.now()
-    periods_to_close = ReportingPeriod.objects.filter(
-        is_closed=False,
-        closes_at__lte=now
-    )
-    
-    count = periods_to_close.count()
-    if count > 0:
-        for period in periods_to_close:
-            period.is_closed = True
-            period.save()
-            
-            # Log the closing in audit log
-            AuditLog.log(
-                actor=None,  # System action
-                action=AuditLog.Action.PERIOD_CLOSE,
-                target=period,
-                metadata={
-                    "message": "Reporting period automatically closed by scheduled timeline",
-                    "period_id": period.id,
-                    "closed_at": str(now)
-                }
-            )
-            
-    return f"Automatically closed {count} reporting periods based on schedule."
\ No newline at end of file
+    with cache_lock('reports:auto-close-periods', PERIOD_TASK_LOCK_TIMEOUT) as acquired:
+        if not acquired:
+            return "Skipped: another auto-close run is in progress"
+
+        closed = close_periods(
+            "Reporting period automatically closed by scheduled timeline",
+            closes_at__lte=timezone.now()
+        )
+
+    record_items(len(closed))
+    return f"Automatically closed {len(closed)} reporting periods based on schedule."
@@ -1,8 +1,31 @@
-from django.test import TestCase
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from unittest import mock
+from django.test import TestCase, override_settings
 from rest_framework.test import APIClient
 from rest_framework import status
-from accounts.models import User
-from reports.models import Report, ReportingPeriod
+from accounts.models import User, AuditLog
+from reports.models import Report, ReportingPeriod, Comment, BlockerTerm
+from reports import utils
+from accounts.utils import import_users_from_csv
+from notifications.models import Notification
+from reports.tasks import auto_close_reporting_periods, create_new_reporting_period
+from config.locks import cache_lock
+from config.query_budget import QueryBudgetMixin
+from config.middleware import RequestTimings, _current, serializer_timed
+from rest_framework.serializers import BaseSerializer
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from datetime import timedelta
 
@@ -390,3 +413,1834 @@ class CommentTests(TestCase):
 
         response = self.client.get('/api/v1/reports/comments/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class ReportSearchTests(TestCase):
+    """Test cases for full-text report search"""
+
+    def setUp(self):
+        self.client = APIClient()
+
+        self.supervisor = User.objects.create_user(
+            email='supervisor@example.com',
+            password='supervisorpass123',
+            full_name='Supervisor User',
+            role=User.Role.SUPERVISOR
+        )
+        self.other_supervisor = User.objects.create_user(
+            email='other@example.com',
+            password='otherpass123',
+            full_name='Other Supervisor',
+            role=User.Role.SUPERVISOR
+        )
+        self.alice = User.objects.create_user(
+            email='alice@example.com',
+            password='alicepass123',
+            full_name='Alice',
+            role=User.Role.EMPLOYEE,
+            supervisor=self.supervisor
+        )
+        self.bob = User.objects.create_user(
+            email='bob@example.com',
+            password='bobpass123',
+            full_name='Bob',
+            role=User.Role.EMPLOYEE,
+            supervisor=self.supervisor
+        )
+        self.carol = User.objects.create_user(
+            email='carol@example.com',
+            password='carolpass123',
+            full_name='Carol',
+            role=User.Role.EMPLOYEE,
+            supervisor=self.other_supervisor
+        )
+
+        self.period = ReportingPeriod.objects.create(
+            start_date=timezone.now().date(),
+            end_date=timezone.now().date() + timedelta(days=7),
+            deadline=timezone.now() + timedelta(days=5)
+        )
+        self.alice_report = Report.objects.create(
+            employee=self.alice,
+            period=self.period,
+            accomplishments='Shipped the billing export',
+            blockers='Blocked on vendor Acme: vendor API keys still missing'
+        )
+        self.bob_report = Report.objects.create(
+            employee=self.bob,
+            period=self.period,
+            accomplishments='Refactored the login page',
+            blockers='Waiting on design review'
+        )
+        self.carol_report = Report.objects.create(
+            employee=self.carol,
+            period=self.period,
+            blockers='Blocked on vendor Acme contract'
+        )
+
+    def authenticate(self, user):
+        """Helper to authenticate as a user"""
+        response = self.client.post('/api/v1/auth/login/', {
+            'email': user.email,
+            'password': f'{user.email.split("@")[0]}pass123'
+        })
+        if response.status_code == 200:
+            self.client.credentials(
+                HTTP_AUTHORIZATION=f"Bearer {response.data['access']}"
+            )
+
+    def test_search_is_scoped_and_ranked(self):
+        """Test supervisors only find their team's reports, best match first"""
+        self.authenticate(self.supervisor)
+
+        response = self.client.get('/api/v1/reports/search/', {'q': 'blocked on vendor acme'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids = [r['id'] for r in response.data['results']]
+        self.assertEqual(ids, [self.alice_report.id])
+        self.assertGreater(response.data['results'][0]['search_rank'], 0)
+
+    def test_search_matches_comment_bodies(self):
+        """Test comments added after the report are searchable"""
+        Comment.objects.create(
+            report=self.bob_report,
+            author=self.supervisor,
+            body='Escalated the vendor contract with procurement'
+        )
+        self.authenticate(self.supervisor)
+
+        response = self.client.get('/api/v1/reports/search/', {'q': 'procurement'})
+
+        self.assertEqual([r['id'] for r in response.data['results']], [self.bob_report.id])
+
+    def test_search_reflects_report_updates(self):
+        """Test edited report content is re-indexed"""
+        self.bob_report.blockers = 'Staging database is down'
+        self.bob_report.save()
+        self.authenticate(self.bob)
+
+        response = self.client.get('/api/v1/reports/search/', {'q': 'staging database'})
+        self.assertEqual([r['id'] for r in response.data['results']], [self.bob_report.id])
+
+        response = self.client.get('/api/v1/reports/search/', {'q': 'design review'})
+        self.assertEqual(response.data['count'], 0)
+
+    def test_search_requires_query(self):
+        """Test a missing query is rejected"""
+        self.authenticate(self.supervisor)
+
+        response = self.client.get('/api/v1/reports/search/')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_mysql_filters_with_indexed_matches(self):
+        """Test MySQL matches are filtered by MATCH in WHERE clauses, not by the computed rank"""
+        from reports import search
+
+        with mock.patch.object(search.connection, 'vendor', 'mysql'):
+            sql = str(search.search_reports(Report.objects.filter(employee=self.alice), 'vendor contract').query)
+
+        self.assertIn('IN (SELECT r.id FROM reports_report r WHERE MATCH', sql)
+        self.assertIn('IN (SELECT c.report_id FROM reports_comment c WHERE MATCH', sql)
+        self.assertNotIn('> 0', sql)
+
+
+class BlockerTrendTests(TestCase):
+    """Test cases for the blocker term index and trend endpoint"""
+
+    def setUp(self):
+        self.client = APIClient()
+
+        self.supervisor = User.objects.create_user(
+            email='supervisor@example.com',
+            password='supervisorpass123',
+            full_name='Supervisor User',
+            role=User.Role.SUPERVISOR
+        )
+        self.other_supervisor = User.objects.create_user(
+            email='other@example.com',
+            password='otherpass123',
+            full_name='Other Supervisor',
+            role=User.Role.SUPERVISOR
+        )
+        self.employee = User.objects.create_user(
+            email='employee@example.com',
+            password='employeepass123',
+            full_name='Employee User',
+            role=User.Role.EMPLOYEE,
+            supervisor=self.supervisor
+        )
+        self.outsider = User.objects.create_user(
+            email='outsider@example.com',
+            password='outsiderpass123',
+            full_name='Outsider',
+            role=User.Role.EMPLOYEE,
+            supervisor=self.other_supervisor
+        )
+
+        today = timezone.now().date()
+        self.periods = [
+            ReportingPeriod.objects.create(
+                start_date=today - timedelta(days=7 * weeks),
+                end_date=today - timedelta(days=7 * weeks - 6),
+                deadline=timezone.now() - timedelta(days=7 * weeks - 4),
+                is_closed=True
+            )
+            for weeks in (3, 2, 1)
+        ]
+        blockers = [
+            '<p>Blocked on <strong>vendor</strong> API access</p>',
+            'Still waiting on vendor; flaky staging environment',
+            'Staging environment down again, vendor escalated',
+        ]
+        self.reports = [
+            Report.objects.create(
+                employee=self.employee,
+                period=period,
+                accomplishments='Work',
+                goals_next_week='More work',
+                progress_rating='on_track',
+                blockers=text
+            )
+            for period, text in zip(self.periods, blockers)
+        ]
+        Report.objects.create(
+            employee=self.outsider,
+            period=self.periods[0],
+            accomplishments='Work',
+            goals_next_week='More work',
+            progress_rating='on_track',
+            blockers='Laptop broken',
+            status=Report.Status.SUBMITTED
+        )
+
+    def authenticate(self, user):
+        """Helper to authenticate as a user"""
+        response = self.client.post('/api/v1/auth/login/', {
+            'email': user.email,
+            'password': f'{user.email.split("@")[0]}pass123'
+        })
+        if response.status_code == 200:
+            self.client.credentials(
+                HTTP_AUTHORIZATION=f"Bearer {response.data['access']}"
+            )
+
+    def test_submit_indexes_blocker_terms(self):
+        """Test submitting a report adds its normalized terms to the index"""
+        self.authenticate(self.employee)
+
+        response = self.client.post(f'/api/v1/reports/{self.reports[0].id}/submit/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        terms = set(BlockerTerm.objects.filter(report=self.reports[0]).values_list('term', flat=True))
+        self.assertEqual(terms, {'vendor', 'api', 'access'})
+        self.assertTrue(
+            BlockerTerm.objects.filter(report=self.reports[0], period=self.periods[0], supervisor=self.supervisor).exists()
+        )
+
+    def test_supervisor_sees_recurring_team_blockers(self):
+        """Test trends rank terms by recurrence and are scoped to the team"""
+        self.authenticate(self.employee)
+        for report in self.reports:
+            self.client.post(f'/api/v1/reports/{report.id}/submit/')
+        call_command('rebuild_blocker_index', stdout=io.StringIO())
+
+        self.client.credentials()
+        self.authenticate(self.supervisor)
+        response = self.client.get('/api/v1/reports/blocker-trends/', {'periods': 3, 'limit': 3})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['teams']), 1)
+        blockers = response.data['teams'][0]['blockers']
+        self.assertEqual(blockers[0], {'term': 'vendor', 'periods': 3, 'reports': 3})
+        self.assertEqual(blockers[1]['term'], 'environment')
+        self.assertNotIn('laptop', [b['term'] for b in blockers])
+
+    def test_employee_cannot_view_trends(self):
+        """Test employees cannot view blocker trends"""
+        self.authenticate(self.employee)
+
+        response = self.client.get('/api/v1/reports/blocker-trends/')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class ReportAutosaveTests(TestCase):
+    """Test cases for the delta autosave endpoint"""
+
+    def setUp(self):
+        self.client = APIClient()
+
+        self.employee = User.objects.create_user(
+            email='employee@example.com',
+            password='employeepass123',
+            full_name='Employee User',
+            role=User.Role.EMPLOYEE
+        )
+        self.period = ReportingPeriod.objects.create(
+            start_date=timezone.now().date(),
+            end_date=timezone.now().date() + timedelta(days=7),
+            deadline=timezone.now() + timedelta(days=5)
+        )
+        self.report = Report.objects.create(
+            employee=self.employee,
+            period=self.period,
+            accomplishments='<p>Started the migration</p>',
+            goals_next_week='Finish the migration'
+        )
+        self.url = f'/api/v1/reports/{self.report.id}/autosave/'
+
+    def authenticate(self, user):
+        """Helper to authenticate as a user"""
+        response = self.client.post('/api/v1/auth/login/', {
+            'email': user.email,
+            'password': f'{user.email.split("@")[0]}pass123'
+        })
+        if response.status_code == 200:
+            self.client.credentials(
+                HTTP_AUTHORIZATION=f"Bearer {response.data['access']}"
+            )
+
+    def version(self):
+        return self.client.get(f'/api/v1/reports/{self.report.id}/').data['updated_at']
+
+    def test_autosave_writes_only_changed_fields(self):
+        """Test only the sent fields are sanitized and written"""
+        self.authenticate(self.employee)
+        version = self.version()
+
+        with mock.patch('reports.serializers.sanitize_html', side_effect=lambda v: v) as sanitize, \
+                CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(self.url, {
+                'version': version,
+                'blockers': 'Waiting on access',
+                'goals_next_week': 'Finish the migration'
+            }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['saved_fields'], ['blockers'])
+        self.assertNotEqual(response.data['version'], version)
+        sanitize.assert_has_calls([mock.call('Waiting on access'), mock.call('Finish the migration')], any_order=True)
+        self.assertEqual(sanitize.call_count, 2)
+
+        update = [q['sql'] for q in queries.captured_queries if q['sql'].startswith('UPDATE "reports_report"')]
+        self.assertEqual(len(update), 1)
+        self.assertIn('"blockers"', update[0])
+        self.assertNotIn('"accomplishments"', update[0])
+
+        self.report.refresh_from_db()
+        self.assertEqual(self.report.blockers, 'Waiting on access')
+        self.assertEqual(self.report.accomplishments, '<p>Started the migration</p>')
+
+    def test_stale_version_is_rejected(self):
+        """Test a write based on an outdated version returns 409"""
+        self.authenticate(self.employee)
+        version = self.version()
+
+        first = self.client.patch(self.url, {'version': version, 'blockers': 'First tab'}, format='json')
+        second = self.client.patch(self.url, {'version': version, 'blockers': 'Second tab'}, format='json')
+
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(second.data['version'], first.data['version'])
+        self.report.refresh_from_db()
+        self.assertEqual(self.report.blockers, 'First tab')
+
+    def test_autosave_rejects_non_editable_fields(self):
+        """Test fields outside the report content cannot be autosaved"""
+        self.authenticate(self.employee)
+
+        response = self.client.patch(self.url, {
+            'version': self.version(),
+            'status': Report.Status.REVIEWED
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.report.refresh_from_db()
+        self.assertEqual(self.report.status, Report.Status.DRAFT)
+
+    def test_submitted_report_cannot_be_autosaved(self):
+        """Test autosave is limited to drafts"""
+        self.authenticate(self.employee)
+        version = self.version()
+        Report.objects.filter(pk=self.report.pk).update(status=Report.Status.SUBMITTED)
+
+        response = self.client.patch(self.url, {'version': version, 'blockers': 'Late edit'}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ReportConditionalRequestTests(TestCase):
+    """Test cases for ETag / Last-Modified handling on reports"""
+
+    def setUp(self):
+        self.client = APIClient()
+
+        self.supervisor = User.objects.create_user(
+            email='supervisor@example.com',
+            password='supervisorpass123',
+            full_name='Supervisor User',
+            role=User.Role.SUPERVISOR
+        )
+        self.employee = User.objects.create_user(
+            email='employee@example.com',
+            password='employeepass123',
+            full_name='Employee User',
+            role=User.Role.EMPLOYEE,
+            supervisor=self.supervisor
+        )
+        self.period = ReportingPeriod.objects.create(
+            start_date=timezone.now().date(),
+            end_date=timezone.now().date() + timedelta(days=7),
+            deadline=timezone.now() + timedelta(days=5)
+        )
+        self.report = Report.objects.create(
+            employee=self.employee,
+            period=self.period,
+            accomplishments='Shipped the release',
+            goals_next_week='Plan the next one',
+            progress_rating='on_track'
+        )
+        self.url = f'/api/v1/reports/{self.report.id}/'
+
+    def authenticate(self, user):
+        """Helper to authenticate as a user"""
+        response = self.client.post('/api/v1/auth/login/', {
+            'email': user.email,
+            'password': f'{user.email.split("@")[0]}pass123'
+        })
+        if response.status_code == 200:
+            self.client.credentials(
+                HTTP_AUTHORIZATION=f"Bearer {response.data['access']}"
+            )
+
+    def test_retrieve_revalidates_with_etag(self):
+        """Test an unchanged report returns 304, a changed one 200"""
+        self.authenticate(self.employee)
+
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertIn('ETag', first)
+        self.assertIn('Last-Modified', first)
+
+        cached = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(cached['ETag'], first['ETag'])
+
+        self.report.blockers = 'New blocker'
+        self.report.save()
+        changed = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(changed['ETag'], first['ETag'])
+
+    def test_pending_approval_list_revalidates(self):
+        """Test the supervisor queue returns 304 until a report is submitted"""
+        self.authenticate(self.supervisor)
+        url = '/api/v1/reports/pending-approval/'
+
+        first = self.client.get(url)
+        self.assertEqual(first.data, [])
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag']).status_code,
+            status.HTTP_304_NOT_MODIFIED
+        )
+
+        self.report.status = Report.Status.SUBMITTED
+        self.report.submitted_at = timezone.now()
+        self.report.save()
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(changed.data), 1)
+
+    def test_list_etag_changes_when_period_closes(self):
+        """Test closing a period invalidates the list even though reports are untouched"""
+        self.authenticate(self.employee)
+
+        first = self.client.get('/api/v1/reports/')
+        ReportingPeriod.objects.filter(pk=self.period.pk).update(is_closed=True)
+        second = self.client.get('/api/v1/reports/', HTTP_IF_NONE_MATCH=first['ETag'])
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+
+    def test_period_and_employee_edits_revalidate(self):
+        """Test editing the period or renaming the employee changes the ETags though the report is untouched"""
+        admin = User.objects.create_user(
+            email='admin@example.com', password='x', full_name='Admin User', role=User.Role.ADMIN
+        )
+        admin_client = APIClient()
+        admin_client.force_authenticate(user=admin)
+        self.authenticate(self.employee)
+        edits = [
+            lambda: admin_client.patch(
+                f'/api/v1/reports/periods/{self.period.id}/',
+                {'deadline': (timezone.now() + timedelta(days=6)).isoformat()}, format='json'
+            ),
+            lambda: admin_client.patch(
+                f'/api/v1/reports/periods/{self.period.id}/',
+                {'closes_at': (timezone.now() + timedelta(days=8)).isoformat()}, format='json'
+            ),
+            lambda: admin_client.patch(f'/api/v1/auth/{self.employee.id}/', {'full_name': 'Renamed'}),
+        ]
+        for edit in edits:
+            detail = self.client.get(self.url)
+            listing = self.client.get('/api/v1/reports/')
+            self.assertEqual(edit().status_code, status.HTTP_200_OK)
+
+            detail_again = self.client.get(self.url, HTTP_IF_NONE_MATCH=detail['ETag'])
+            listing_again = self.client.get('/api/v1/reports/', HTTP_IF_NONE_MATCH=listing['ETag'])
+            self.assertEqual(detail_again.status_code, status.HTTP_200_OK)
+            self.assertEqual(listing_again.status_code, status.HTTP_200_OK)
+        self.assertEqual(detail_again.data['employee_name'], 'Renamed')
+
+    def test_if_match_prevents_lost_update(self):
+        """Test a write with an outdated ETag is rejected with 412"""
+        self.authenticate(self.employee)
+        etag = self.client.get(self.url)['ETag']
+        payload = {
+            'accomplishments': 'Shipped the release',
+            'goals_next_week': 'Plan the next one',
+            'progress_rating': 'on_track',
+            'blockers': 'From tab one'
+        }
+
+        first = self.client.put(self.url, payload, format='json', HTTP_IF_MATCH=etag)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(first['ETag'], etag)
+
+        payload['blockers'] = 'From tab two'
+        second = self.client.put(self.url, payload, format='json', HTTP_IF_MATCH=etag)
+        self.assertEqual(second.status_code, status.HTTP_412_PRECONDITION_FAILED)
+
+        third = self.client.put(self.url, payload, format='json', HTTP_IF_MATCH=first['ETag'])
+        self.assertEqual(third.status_code, status.HTTP_200_OK)
+        self.report.refresh_from_db()
+        self.assertEqual(self.report.blockers, 'From tab two')
+
+
+class BatchWorkflowTests(TestCase):
+    """Test cases for the supervisor batch review / revision endpoints"""
+
+    def setUp(self):
+        self.client = APIClient()
+
+        self.supervisor = User.objects.create_user(
+            email='supervisor@example.com',
+            password='supervisorpass123',
+            full_name='Supervisor User',
+            role=User.Role.SUPERVISOR
+        )
+        self.other_supervisor = User.objects.create_user(
+            email='other@example.com',
+            password='otherpass123',
+            full_name='Other Supervisor',
+            role=User.Role.SUPERVISOR
+        )
+        self.period = ReportingPeriod.objects.create(
+            start_date=timezone.now().date(),
+            end_date=timezone.now().date() + timedelta(days=7),
+            deadline=timezone.now() + timedelta(days=5)
+        )
+
+        def make_report(email, supervisor, report_status=Report.Status.SUBMITTED):
+            employee = User.objects.create_user(
+                email=email,
+                password='x',
+                full_name=email.split('@')[0].title(),
+                role=User.Role.EMPLOYEE,
+                supervisor=supervisor
+            )
+            return Report.objects.create(
+                employee=employee,
+                period=self.period,
+                accomplishments='Work',
+                goals_next_week='More work',
+                progress_rating='on_track',
+                status=report_status,
+                submitted_at=timezone.now() if report_status == Report.Status.SUBMITTED else None
+            )
+
+        self.team_reports = [make_report(f'member{i}@example.com', self.supervisor) for i in range(3)]
+        self.draft = make_report('drafter@example.com', self.supervisor, Report.Status.DRAFT)
+        self.outsider = make_report('outsider@example.com', self.other_supervisor)
+
+    def authenticate(self, user):
+        """Helper to authenticate as a user"""
+        response = self.client.post('/api/v1/auth/login/', {
+            'email': user.email,
+            'password': f'{user.email.split("@")[0]}pass123'
+        })
+        if response.status_code == 200:
+            self.client.credentials(
+                HTTP_AUTHORIZATION=f"Bearer {response.data['access']}"
+            )
+
+    def test_batch_review_updates_team_reports_only(self):
+        """Test submitted team reports are reviewed and the rest are reported as skipped"""
+        self.authenticate(self.supervisor)
+        team_ids = [r.id for r in self.team_reports]
+
+        with mock.patch('notifications.tasks.send_batch_workflow_notifications.delay') as delay, \
+                self.captureOnCommitCallbacks(execute=True) as callbacks:
+            response = self.client.post('/api/v1/reports/batch-review/', {
+                'report_ids': team_ids + [self.draft.id, self.outsider.id, 999999]
+            }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated'], team_ids)
+        self.assertEqual(
+            [item['id'] for item in response.data['skipped']],
+            [self.draft.id, self.outsider.id, 999999]
+        )
+        self.assertEqual(
+            Report.objects.filter(id__in=team_ids, status=Report.Status.REVIEWED, reviewed_at__isnull=False).count(),
+            3
+        )
+        self.outsider.refresh_from_db()
+        self.assertEqual(self.outsider.status, Report.Status.SUBMITTED)
+        self.assertEqual(
+            AuditLog.objects.filter(action=AuditLog.Action.REPORT_REVIEW, target_id__in=[str(pk) for pk in team_ids]).count(),
+            3
+        )
+        # One notification dispatch and one dashboard cache invalidation for the batch
+        self.assertEqual(len(callbacks), 2)
+        delay.assert_called_once_with(team_ids, 'reviewed')
+
+    def test_batch_request_revision_adds_comments(self):
+        """Test each report gets the supervisor's comment and moves to revision requested"""
+        self.authenticate(self.supervisor)
+        team_ids = [r.id for r in self.team_reports]
+
+        with mock.patch('notifications.tasks.send_batch_workflow_notifications.delay'):
+            response = self.client.post('/api/v1/reports/batch-request-revision/', {
+                'report_ids': team_ids,
+                'comment': 'Please add metrics'
+            }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            Report.objects.filter(id__in=team_ids, status=Report.Status.REVISION_REQUESTED).count(),
+            3
+        )
+        self.assertEqual(
+            Comment.objects.filter(report_id__in=team_ids, body__endswith='Please add metrics').count(),
+            3
+        )
+
+    def test_batch_with_no_eligible_reports_fails(self):
+        """Test a batch where nothing can be processed returns 400"""
+        self.authenticate(self.supervisor)
+
+        response = self.client.post('/api/v1/reports/batch-review/', {
+            'report_ids': [self.outsider.id]
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(len(response.data['skipped']), 1)
+
+    def test_employee_cannot_batch_review(self):
+        """Test only supervisors can use batch actions"""
+        employee = User.objects.create_user(
+            email='employee@example.com',
+            password='employeepass123',
+            full_name='Employee User',
+            role=User.Role.EMPLOYEE
+        )
+        self.authenticate(employee)
+
+        response = self.client.post('/api/v1/reports/batch-review/', {
+            'report_ids': [self.team_reports[0].id]
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class PeriodCloseTaskTests(TestCase):
+    """Test cases for the scheduled period closing tasks"""
+
+    def setUp(self):
+        cache.clear()
+        today = timezone.now().date()
+        self.overdue = [
+            ReportingPeriod.objects.create(
+                start_date=today - timedelta(days=7 * weeks),
+                end_date=today - timedelta(days=7 * weeks - 6),
+                deadline=timezone.now() - timedelta(days=7 * weeks - 4),
+                closes_at=timezone.now() - timedelta(hours=weeks)
+            )
+            for weeks in (3, 2, 1)
+        ]
+        self.open_period = ReportingPeriod.objects.create(
+            start_date=today,
+            end_date=today + timedelta(days=6),
+            deadline=timezone.now() + timedelta(days=4),
+            closes_at=timezone.now() + timedelta(days=7)
+        )
+
+    def close_logs(self):
+        return AuditLog.objects.filter(action=AuditLog.Action.REPORT_PERIOD_CLOSE)
+
+    def test_auto_close_is_bulk_and_idempotent(self):
+        """Test overdue periods are closed and logged once, however often the task runs"""
+        auto_close_reporting_periods()
+        auto_close_reporting_periods()
+
+        self.assertEqual(ReportingPeriod.objects.filter(is_closed=True).count(), 3)
+        self.open_period.refresh_from_db()
+        self.assertFalse(self.open_period.is_closed)
+        self.assertEqual(
+            sorted(self.close_logs().values_list('target_id', flat=True)),
+            sorted(str(p.id) for p in self.overdue)
+        )
+
+    def test_overlapping_run_is_skipped(self):
+        """Test a run that finds the lock held leaves the periods alone"""
+        with cache_lock('reports:auto-close-periods') as acquired:
+            self.assertTrue(acquired)
+            result = auto_close_reporting_periods()
+
+        self.assertIn('Skipped', result)
+        self.assertFalse(ReportingPeriod.objects.filter(is_closed=True).exists())
+
+    def test_new_period_closes_previous_periods(self):
+        """Test creating the weekly period closes every earlier open period with one audit row each"""
+        create_new_reporting_period()
+        create_new_reporting_period()
+
+        self.assertEqual(ReportingPeriod.objects.filter(is_closed=True).count(), 3)
+        self.assertEqual(self.close_logs().count(), 3)
+
+
+class ReportProvisioningTests(TestCase):
+    """Test cases for pre-provisioned Not Started reports"""
+
+    def setUp(self):
+        self.client = APIClient()
+
+        self.supervisor = User.objects.create_user(
+            email='supervisor@example.com',
+            password='supervisorpass123',
+            full_name='Supervisor User',
+            role=User.Role.SUPERVISOR
+        )
+        self.employee = User.objects.create_user(
+            email='employee@example.com',
+            password='employeepass123',
+            full_name='Employee User',
+            role=User.Role.EMPLOYEE,
+            supervisor=self.supervisor
+        )
+        self.inactive = User.objects.create_user(
+            email='inactive@example.com',
+            password='inactivepass123',
+            full_name='Inactive User',
+            role=User.Role.EMPLOYEE,
+            is_active=False
+        )
+
+    def authenticate(self, user):
+        """Helper to authenticate as a user"""
+        response = self.client.post('/api/v1/auth/login/', {
+            'email': user.email,
+            'password': f'{user.email.split("@")[0]}pass123'
+        })
+        if response.status_code == 200:
+            self.client.credentials(
+                HTTP_AUTHORIZATION=f"Bearer {response.data['access']}"
+            )
+
+    def test_new_period_provisions_active_employees(self):
+        """Test the weekly task creates one Not Started report per active employee, once"""
+        create_new_reporting_period()
+        create_new_reporting_period()
+
+        reports = Report.objects.all()
+        self.assertEqual(reports.count(), 1)
+        self.assertEqual(reports[0].employee, self.employee)
+        self.assertEqual(reports[0].status, Report.Status.NOT_STARTED)
+
+    def test_create_fills_in_provisioned_report(self):
+        """Test an employee's first save turns the placeholder into a draft"""
+        period = ReportingPeriod.objects.create(
+            start_date=timezone.now().date(),
+            end_date=timezone.now().date() + timedelta(days=6),
+            deadline=timezone.now() + timedelta(days=4)
+        )
+        call_command('provision_reports', stdout=io.StringIO())
+        placeholder = Report.objects.get(employee=self.employee, period=period)
+        self.authenticate(self.employee)
+
+        response = self.client.post('/api/v1/reports/', {
+            'accomplishments': 'Completed task A',
+            'goals_next_week': 'Work on task B'
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['id'], placeholder.id)
+        self.assertEqual(response.data['status'], Report.Status.DRAFT)
+        self.assertEqual(Report.objects.filter(employee=self.employee).count(), 1)
+
+    def test_backfill_command_skips_closed_periods_by_default(self):
+        """Test the backfill covers open periods unless --all is given"""
+        today = timezone.now().date()
+        User.objects.filter(pk=self.employee.pk).update(created_at=timezone.now() - timedelta(days=60))
+        closed = ReportingPeriod.objects.create(
+            start_date=today - timedelta(days=14),
+            end_date=today - timedelta(days=8),
+            deadline=timezone.now() - timedelta(days=10),
+            is_closed=True
+        )
+        ReportingPeriod.objects.create(
+            start_date=today,
+            end_date=today + timedelta(days=6),
+            deadline=timezone.now() + timedelta(days=4)
+        )
+
+        call_command('provision_reports', stdout=io.StringIO())
+        self.assertFalse(Report.objects.filter(period=closed).exists())
+
+        call_command('provision_reports', '--all', stdout=io.StringIO())
+        self.assertEqual(Report.objects.filter(period=closed, status=Report.Status.NOT_STARTED).count(), 1)
+        self.assertEqual(Report.objects.count(), 2)
+
+    def test_team_oversight_reads_provisioned_status(self):
+        """Test team oversight reports a provisioned member as Not Started"""
+        create_new_reporting_period()
+        ReportingPeriod.objects.exclude(
+            pk=Report.objects.get(employee=self.employee).period_id
+        ).update(is_closed=True)
+        self.authenticate(self.supervisor)
+
+        response = self.client.get('/api/v1/reports/team-oversight/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        member = response.data['members'][0]
+        self.assertEqual(member['current_status'], 'Not Started')
+        self.assertEqual(member['total_reports'], 0)
+
+    def test_organization_stats_count_mid_period_changes(self):
+        """Test employees added, reactivated or deactivated mid-period keep the stats consistent"""
+        admin = User.objects.create_user(
+            email='admin@example.com',
+            password='adminpass123',
+            full_name='Admin User',
+            role=User.Role.ADMIN
+        )
+        leaver = User.objects.create_user(
+            email='leaver@example.com',
+            password='leaverpass123',
+            full_name='Leaver User',
+            role=User.Role.EMPLOYEE
+        )
+        create_new_reporting_period()
+        self.authenticate(admin)
+
+        import_users_from_csv(io.StringIO(
+            "email,full_name,role,password\nnewhire@example.com,New Hire,employee,Str0ng!Pass\n"
+        ))
+        for user, is_active in [(self.inactive, True), (leaver, False)]:
+            response = self.client.patch(f'/api/v1/auth/{user.id}/', {'is_active': is_active}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertTrue(Report.objects.filter(employee__email='newhire@example.com').exists())
+        self.assertTrue(Report.objects.filter(employee=self.inactive).exists())
+        stats = self.client.get('/api/v1/reports/organization-stats/').data
+        self.assertEqual(stats['totalEmployees'], 3)
+        self.assertEqual(stats['notStartedCount'], 3)
+        self.assertEqual(stats['submittedCount'] + stats['draftCount'] + stats['notStartedCount'], 3)
+
+
+class SanitizeHtmlTests(TestCase):
+    """Test cases for the cached rich text sanitizer"""
+
+    def setUp(self):
+        utils._clean.cache_clear()
+
+    def reference(self, value):
+        import bleach
+        return bleach.clean(
+            value,
+            tags=utils.ALLOWED_TAGS,
+            attributes=utils.ALLOWED_ATTRIBUTES,
+            strip=True,
+            strip_comments=True
+        )
+
+    def test_matches_bleach_clean(self):
+        """Fast path and memoized cleaner give the same output as bleach.clean"""
+        samples = [
+            'Plain text with "quotes", tabs\tand\nnewlines',
+            'a > b',
+            'Tom & Jerry',
+            'windows\r\nline endings',
+            'null\x00 and form feed\x0c',
+            '<p>Hello <strong>team</strong></p><script>alert(1)</script>',
+            '<a href="https://example.com" onclick="x()">link</a><!-- note -->',
+            '<span class="tag" style="color:red">tagged</span>',
+        ]
+        for value in samples:
+            self.assertEqual(utils.sanitize_html(value), self.reference(value), value)
+
+    def test_plain_text_skips_parser(self):
+        """Text without markup never reaches the cleaner"""
+        utils.sanitize_html('Finished the migration plan')
+        self.assertEqual(utils._clean.cache_info().currsize, 0)
+
+    def test_unchanged_html_is_memoized(self):
+        """Sanitizing the same HTML twice parses it once"""
+        value = '<p>Shipped <em>v2</em></p><img src=x>'
+        first = utils.sanitize_html(value)
+        second = utils.sanitize_html(value)
+        self.assertEqual(first, '<p>Shipped <em>v2</em></p>')
+        self.assertEqual(second, first)
+        info = utils._clean.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 1))
+
+
+class SeedLargeOrgCommandTests(TestCase):
+    """Test cases for the benchmark fixture seeding command"""
+
+    def seed(self, *args):
+        call_command(
+            'seed_large_org', '--employees', '6', '--supervisors', '2', '--admins', '1', '--periods', '3',
+            '--notifications-per-user', '2', '--audit-rows', '10', *args, stdout=io.StringIO()
+        )
+
+    def test_seeds_org_with_one_report_per_employee_and_period(self):
+        """Test every seeded employee has a supervisor and a report in each period, only the last open"""
+        self.seed()
+
+        employees = User.objects.filter(role=User.Role.EMPLOYEE, email__endswith='@bench.gridlog.test')
+        self.assertEqual(employees.count(), 6)
+        self.assertFalse(employees.filter(supervisor__isnull=True).exists())
+        self.assertEqual(Report.objects.filter(employee__in=employees).count(), 18)
+        self.assertEqual(ReportingPeriod.objects.filter(is_closed=False).count(), 1)
+        self.assertEqual(Notification.objects.count(), 16)
+
+    def test_reseeding_requires_flush(self):
+        """Test a second run refuses to mix with existing seeded users unless --flush is given"""
+        self.seed()
+        with self.assertRaises(CommandError):
+            self.seed()
+
+        self.seed('--flush')
+        self.assertEqual(User.objects.filter(email__endswith='@bench.gridlog.test').count(), 9)
+        self.assertEqual(AuditLog.objects.count(), 10)
+
+
+class ReportQueryBudgetTests(QueryBudgetMixin, TestCase):
+    """Query budgets for every ReportViewSet and CommentViewSet action"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = User.objects.create_user(
+            email='admin@example.com', password='x', full_name='Admin User', role=User.Role.ADMIN
+        )
+        self.supervisor = User.objects.create_user(
+            email='supervisor@example.com', password='x', full_name='Supervisor User', role=User.Role.SUPERVISOR
+        )
+        self.employee = User.objects.create_user(
+            email='employee@example.com', password='x', full_name='Employee User',
+            role=User.Role.EMPLOYEE, supervisor=self.supervisor
+        )
+        self.period = ReportingPeriod.objects.create(
+            start_date=timezone.now().date(),
+            end_date=timezone.now().date() + timedelta(days=6),
+            deadline=timezone.now() + timedelta(days=4)
+        )
+        self.report = Report.objects.create(
+            employee=self.employee, period=self.period, status=Report.Status.DRAFT,
+            accomplishments='Shipped the importer', goals_next_week='Polish', progress_rating='on_track'
+        )
+        self.members = 0
+        self.weeks = 0
+
+    def as_user(self, user):
+        # Forced authentication keeps the JWT user lookup out of the counts
+        self.client.force_authenticate(user)
+
+    def member_report(self, status=Report.Status.SUBMITTED, **fields):
+        """A report in the open period for a new member of the supervisor's team"""
+        self.members += 1
+        member = User.objects.create_user(
+            email=f'member{self.members}@example.com', password='x', full_name=f'Member {self.members}',
+            role=User.Role.EMPLOYEE, supervisor=self.supervisor
+        )
+        fields = {'submitted_at': timezone.now(), **fields}
+        report = Report.objects.create(
+            employee=member, period=self.period, status=status,
+            accomplishments='Fixed the database timeout', goals_next_week='Ship', progress_rating='on_track',
+            blockers='waiting on vendor access', **fields
+        )
+        comment = Comment.objects.create(report=report, author=self.supervisor, body='Looks good')
+        Comment.objects.create(report=report, author=member, body='Thanks', parent=comment)
+        AuditLog.log(actor=member, action=AuditLog.Action.REPORT_SUBMIT, target=report)
+        return report
+
+    def team(self, n, status=Report.Status.SUBMITTED):
+        return [self.member_report(status) for _ in range(n)]
+
+    def own_history(self, n):
+        """n more closed past periods with a report from self.employee"""
+        for _ in range(n):
+            self.weeks += 1
+            start = self.period.start_date - timedelta(weeks=self.weeks)
+            period = ReportingPeriod.objects.create(
+                start_date=start, end_date=start + timedelta(days=6), is_closed=True,
+                deadline=timezone.now() - timedelta(weeks=self.weeks)
+            )
+            report = Report.objects.create(
+                employee=self.employee, period=period, status=Report.Status.REVIEWED,
+                accomplishments='Earlier work', goals_next_week='More', progress_rating='on_track'
+            )
+            Comment.objects.create(report=report, author=self.supervisor, body='Noted')
+
+    def get(self, user, path):
+        self.as_user(user)
+        return lambda _: self.client.get(path)
+
+    def committed(self, request):
+        """Count on-commit work (notifications) along with the request"""
+        with self.captureOnCommitCallbacks(execute=True):
+            return request()
+
+    # Report reads
+
+    def test_employee_list(self):
+        self.assertQueryBudget(3, self.own_history, self.get(self.employee, '/api/v1/reports/'))
+
+    def test_supervisor_list(self):
+        self.assertQueryBudget(3, self.team, self.get(self.supervisor, '/api/v1/reports/'))
+
+    def test_retrieve(self):
+        self.assertQueryBudget(1, self.own_history, self.get(self.employee, f'/api/v1/reports/{self.report.id}/'))
+
+    def test_my_reports(self):
+        self.assertQueryBudget(2, self.own_history, self.get(self.employee, '/api/v1/reports/my-reports/'))
+
+    def test_pending_approval(self):
+        self.assertQueryBudget(2, self.team, self.get(self.supervisor, '/api/v1/reports/pending-approval/'))
+
+    def test_team_reports(self):
+        self.assertQueryBudget(2, self.team, self.get(self.supervisor, '/api/v1/reports/team-reports/'))
+
+    def test_all_reports(self):
+        self.assertQueryBudget(1, self.team, self.get(self.admin, '/api/v1/reports/all-reports/'))
+
+    def test_search(self):
+        self.assertQueryBudget(2, self.team, self.get(self.supervisor, '/api/v1/reports/search/?q=database'))
+
+    def test_dashboard_stats(self):
+        for user in [self.employee, self.supervisor, self.admin]:
+            with self.subTest(role=user.role):
+                self.assertQueryBudget(1, self.team, self.get(user, '/api/v1/reports/dashboard-stats/'))
+
+    def test_recent_activity(self):
+        self.assertQueryBudget(1, self.team, self.get(self.supervisor, '/api/v1/reports/recent-activity/'))
+
+    def test_team_oversight(self):
+        self.assertQueryBudget(4, self.team, self.get(self.supervisor, '/api/v1/reports/team-oversight/'))
+
+    def test_blocker_trends(self):
+        self.assertQueryBudget(1, self.team, self.get(self.supervisor, '/api/v1/reports/blocker-trends/'))
+
+    def test_organization_stats(self):
+        self.assertQueryBudget(5, self.team, self.get(self.admin, '/api/v1/reports/organization-stats/'))
+
+    def test_export_csv(self):
+        self.assertQueryBudget(1, self.team, self.get(self.admin, '/api/v1/reports/export-csv/'))
+
+    def test_export_pdf(self):
+        self.assertQueryBudget(2, self.team, self.get(self.admin, '/api/v1/reports/export-pdf/'))
+
+    # Report writes by the employee
+
+    def fresh_draft(self, n):
+        self.team(n)
+        return self.member_report(Report.Status.DRAFT, submitted_at=None)
+
+    def write(self, method, path, data=None):
+        def request(report):
+            self.as_user(report.employee)
+            return self.committed(
+                lambda: getattr(self.client, method)(path.format(id=report.id), data, format='json')
+            )
+        return request
+
+    def test_create(self):
+        def fresh_employee(n):
+            self.team(n)
+            self.members += 1
+            return User.objects.create_user(
+                email=f'new{self.members}@example.com', password='x', full_name='New',
+                role=User.Role.EMPLOYEE, supervisor=self.supervisor
+            )
+
+        def request(employee):
+            self.as_user(employee)
+            return self.client.post('/api/v1/reports/', {'accomplishments': 'Started'}, format='json')
+
+        self.assertQueryBudget(3, fresh_employee, request)
+
+    def test_update(self):
+        self.assertQueryBudget(2, self.fresh_draft, self.write('put', '/api/v1/reports/{id}/', {
+            'accomplishments': 'Updated', 'goals_next_week': 'More', 'progress_rating': 'on_track'
+        }))
+
+    def test_partial_update(self):
+        self.assertQueryBudget(2, self.fresh_draft, self.write('patch', '/api/v1/reports/{id}/', {
+            'accomplishments': 'Updated'
+        }))
+
+    def test_autosave(self):
+        def request(report):
+            self.as_user(report.employee)
+            return self.client.patch(f'/api/v1/reports/{report.id}/autosave/', {
+                'version': report.updated_at.isoformat(), 'accomplishments': 'Typed more'
+            }, format='json')
+
+        self.assertQueryBudget(5, self.fresh_draft, request)
+
+    def test_destroy(self):
+        self.assertQueryBudget(8, self.fresh_draft, self.write('delete', '/api/v1/reports/{id}/'))
+
+    def test_submit(self):
+        self.assertQueryBudget(17, self.fresh_draft, self.write('post', '/api/v1/reports/{id}/submit/'))
+
+    # Report writes by the supervisor and admin
+
+    def act_on(self, user, path, data=None):
+        def request(report):
+            self.as_user(user)
+            return self.committed(lambda: self.client.post(path.format(id=report.id), data, format='json'))
+        return request
+
+    def fresh_submitted(self, n):
+        self.team(n)
+        return self.member_report()
+
+    def test_review(self):
+        self.assertQueryBudget(15, self.fresh_submitted, self.act_on(self.supervisor, '/api/v1/reports/{id}/review/'))
+
+    def test_request_revision(self):
+        self.assertQueryBudget(7, self.fresh_submitted, self.act_on(
+            self.supervisor, '/api/v1/reports/{id}/request-revision/', {'comment': 'Add numbers'}
+        ))
+
+    def test_reset_to_draft(self):
+        self.assertQueryBudget(8, self.fresh_submitted, self.act_on(self.admin, '/api/v1/reports/{id}/reset-to-draft/'))
+
+    def batch(self, path):
+        def request(reports):
+            self.as_user(self.supervisor)
+            with mock.patch('notifications.tasks.send_batch_workflow_notifications.delay'):
+                return self.committed(lambda: self.client.post(
+                    path, {'report_ids': [r.id for r in reports], 'comment': 'Please add detail'}, format='json'
+                ))
+        return request
+
+    def test_batch_review(self):
+        self.assertQueryBudget(6, self.team, self.batch('/api/v1/reports/batch-review/'))
+
+    def test_batch_request_revision(self):
+        self.assertQueryBudget(7, self.team, self.batch('/api/v1/reports/batch-request-revision/'))
+
+    # Comments
+
+    def test_comment_list(self):
+        self.assertQueryBudget(2, self.team, self.get(self.supervisor, '/api/v1/reports/comments/'))
+
+    def fresh_comment(self, n):
+        report = self.fresh_submitted(n)
+        return Comment.objects.create(report=report, author=self.supervisor, body='Please expand')
+
+    def comment_request(self, method, data=None):
+        def request(comment):
+            self.as_user(self.supervisor)
+            return getattr(self.client, method)(f'/api/v1/reports/comments/{comment.id}/', data, format='json')
+        return request
+
+    def test_comment_retrieve(self):
+        self.assertQueryBudget(2, self.fresh_comment, self.comment_request('get'))
+
+    def test_comment_update(self):
+        self.assertQueryBudget(4, self.fresh_comment, self.comment_request('put', {'body': 'Edited'}))
+
+    def test_comment_partial_update(self):
+        self.assertQueryBudget(4, self.fresh_comment, self.comment_request('patch', {'body': 'Edited'}))
+
+    def test_comment_destroy(self):
+        self.assertQueryBudget(5, self.fresh_comment, self.comment_request('delete'))
+
+    def test_comment_create(self):
+        def request(report):
+            self.as_user(self.supervisor)
+            return self.committed(lambda: self.client.post(
+                '/api/v1/reports/comments/', {'report': report.id, 'body': 'Nice work'}, format='json'
+            ))
+
+        self.assertQueryBudget(15, self.fresh_submitted, request)
+
+
+class RequestInstrumentationTests(TestCase):
+    """Test cases for the per-request Server-Timing header and perf log line"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.employee = User.objects.create_user(
+            email='employee@example.com', password='x', full_name='Employee User', role=User.Role.EMPLOYEE
+        )
+        period = ReportingPeriod.objects.create(
+            start_date=timezone.now().date(),
+            end_date=timezone.now().date() + timedelta(days=6),
+            deadline=timezone.now() + timedelta(days=4)
+        )
+        Report.objects.create(employee=self.employee, period=period)
+        self.client.force_authenticate(self.employee)
+
+    def test_response_carries_server_timing(self):
+        """Test db, serializer and total timings are reported in the header"""
+        with self.assertLogs('config.perf', level='INFO') as logs:
+            response = self.client.get('/api/v1/reports/my-reports/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        timing = response['Server-Timing']
+        self.assertRegex(timing, r'db;dur=[\d.]+;desc="\d+ queries"')
+        self.assertIn('serialize;dur=', timing)
+        self.assertIn('total;dur=', timing)
+
+        entry = json.loads(logs.records[0].getMessage())
+        self.assertEqual(logs.records[0].levelname, 'INFO')
+        self.assertEqual(entry['path'], '/api/v1/reports/my-reports/')
+        self.assertEqual(entry['user_id'], self.employee.id)
+        self.assertEqual(entry['response_bytes'], len(response.content))
+        self.assertGreater(entry['db_queries'], 0)
+        self.assertNotIn('sql', entry)
+
+    @override_settings(PERF_SLOW_REQUEST_MS=0.001)
+    def test_slow_request_logs_its_sql(self):
+        """Test requests over the threshold are logged at WARNING with their queries"""
+        with self.assertLogs('config.perf', level='WARNING') as logs:
+            self.client.get('/api/v1/reports/my-reports/')
+
+        entry = json.loads(logs.records[0].getMessage())
+        self.assertTrue(entry['slow'])
+        self.assertEqual(len(entry['sql']), entry['db_queries'])
+        self.assertTrue(any('reports_report' in q['sql'] for q in entry['sql']))
+
+    def test_nested_timed_spans_count_once(self):
+        """Test a timed span inside another adds nothing to serializer time"""
+        timings = RequestTimings(capture_sql=False)
+        inner = serializer_timed(lambda: None)
+        outer = serializer_timed(lambda: inner())
+        token = _current.set(timings)
+        try:
+            # Two readings: a counted inner span would need two more
+            with mock.patch('config.middleware.time.perf_counter', side_effect=[1.0, 3.5]):
+                outer()
+        finally:
+            _current.reset(token)
+        self.assertEqual(timings.serializer_seconds, 2.5)
+        self.assertFalse(timings.serializing)
+
+    def test_serializers_are_left_unpatched(self):
+        """Test the middleware times rendering without patching DRF's serializer classes"""
+        self.client.get('/api/v1/reports/my-reports/')
+        self.assertEqual(BaseSerializer.data.fget.__module__, 'rest_framework.serializers')
+
+    @override_settings(PERF_INSTRUMENTATION_ENABLED=False)
+    def test_disabled(self):
+        """Test the middleware drops out of the stack when disabled"""
+        response = self.client.get('/api/v1/reports/my-reports/')
+        self.assertNotIn('Server-Timing', response)
+
+
+@override_settings(
+    PROFILING_ENABLED=True,
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+)
+class ProfilingTests(TestCase):
+    """Test cases for admin request profiling and the profile_endpoint command"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.admin = User.objects.create_user(
+            email='admin@example.com', password='x', full_name='Admin User', role=User.Role.ADMIN
+        )
+        self.supervisor = User.objects.create_user(
+            email='supervisor@example.com', password='x', full_name='Supervisor User', role=User.Role.SUPERVISOR
+        )
+
+    def bearer(self, user):
+        from rest_framework_simplejwt.tokens import RefreshToken
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(user).access_token}')
+
+    def slow_my_reports(self):
+        """Patch my-reports to spend long enough in a known frame to be sampled"""
+        from reports.views import ReportViewSet
+        original = ReportViewSet.my_reports
+
+        def held_in_my_reports(viewset, request):
+            time.sleep(0.05)
+            return original(viewset, request)
+
+        return mock.patch.object(ReportViewSet, 'my_reports', held_in_my_reports)
+
+    def test_admin_can_profile_a_request(self):
+        """Test a flagged admin request is sampled and downloadable as collapsed stacks"""
+        self.bearer(self.admin)
+        with self.slow_my_reports():
+            response = self.client.get('/api/v1/reports/my-reports/', HTTP_X_PROFILE='1')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        profile_id = response['X-Profile-Id']
+
+        download = self.client.get(f'/api/v1/auth/profiles/{profile_id}/')
+        self.assertEqual(download.status_code, status.HTTP_200_OK)
+        self.assertEqual(download['X-Profile-Path'], '/api/v1/reports/my-reports/')
+        lines = download.content.decode().splitlines()
+        self.assertTrue(lines)
+        self.assertTrue(all(line.rsplit(' ', 1)[1].isdigit() for line in lines))
+        self.assertIn('held_in_my_reports', download.content.decode())
+
+    async def test_unflagged_requests_stay_async(self):
+        """Test under ASGI the middleware awaits the chain on the event loop thread for unflagged requests"""
+        import threading
+        from asgiref.sync import iscoroutinefunction
+        from django.http import HttpResponse
+        from django.test import RequestFactory
+        from config.profiling import ProfilingMiddleware
+
+        async def get_response(request):
+            return HttpResponse(str(threading.get_ident()))
+
+        middleware = ProfilingMiddleware(get_response)
+        self.assertTrue(iscoroutinefunction(middleware))
+        response = await middleware(RequestFactory().get('/api/v1/notifications/'))
+        self.assertEqual(response.content.decode(), str(threading.get_ident()))
+
+    async def test_admin_can_profile_under_asgi(self):
+        """Test a flagged admin request through the async handler is sampled on the thread running the view"""
+        from rest_framework_simplejwt.tokens import AccessToken
+        headers = {'Authorization': f'Bearer {AccessToken.for_user(self.admin)}', 'X-Profile': '1'}
+        with self.slow_my_reports():
+            response = await self.async_client.get('/api/v1/reports/my-reports/', headers=headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        profile = cache.get(f"profile:{response['X-Profile-Id']}")
+        self.assertIn('held_in_my_reports', profile['collapsed'])
+
+    def test_non_admin_flag_is_ignored(self):
+        """Test the profile flag does nothing for non-admins"""
+        self.bearer(self.supervisor)
+        response = self.client.get('/api/v1/reports/my-reports/?profile=1')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('X-Profile-Id', response)
+
+    def test_browser_may_send_profile_header(self):
+        """Test the CORS preflight allows the frontend to send X-Profile"""
+        response = self.client.options(
+            '/api/v1/reports/my-reports/',
+            HTTP_ORIGIN='http://localhost:9000',
+            HTTP_ACCESS_CONTROL_REQUEST_METHOD='GET',
+            HTTP_ACCESS_CONTROL_REQUEST_HEADERS='x-profile'
+        )
+
+        self.assertIn('x-profile', response['Access-Control-Allow-Headers'])
+
+    def test_profile_download_requires_admin(self):
+        """Test non-admins cannot download profiles"""
+        self.bearer(self.supervisor)
+        response = self.client.get('/api/v1/auth/profiles/abc/')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_profile_endpoint_command(self):
+        """Test the command profiles a report action as the given user"""
+        output = os.path.join(tempfile.mkdtemp(), 'my-reports.folded')
+        stdout = io.StringIO()
+        with self.slow_my_reports():
+            call_command(
+                'profile_endpoint', 'my-reports', user=self.supervisor.email,
+                iterations=2, warmup=0, output=output, stdout=stdout
+            )
+
+        self.assertIn('GET /api/v1/reports/my-reports/ as supervisor@example.com', stdout.getvalue())
+        with open(output) as f:
+            self.assertIn('held_in_my_reports', f.read())
+
+
+class ExportImportTests(TestCase):
+    """Test cases for keeping ReportLab off the worker startup path"""
+
+    def test_boot_does_not_import_reportlab(self):
+        """Test loading settings, apps and every URL route leaves reportlab unimported"""
+        script = (
+            "import sys, django; django.setup(); "
+            "from django.urls import get_resolver; get_resolver().url_patterns; "
+            "print('reportlab' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', script], cwd=settings.BASE_DIR, capture_output=True, text=True,
+            env={**os.environ, 'DJANGO_SETTINGS_MODULE': 'config.settings'}
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), 'False')
+
+    def test_exports_render(self):
+        """Test the lazily imported export builders produce CSV and PDF"""
+        from reports.exports import reports_csv, reports_pdf
+        employee = User.objects.create_user(
+            email='employee@example.com', password='x', full_name='Employee User', role=User.Role.EMPLOYEE
+        )
+        period = ReportingPeriod.objects.create(
+            start_date=timezone.now().date(),
+            end_date=timezone.now().date() + timedelta(days=6),
+            deadline=timezone.now() + timedelta(days=4)
+        )
+        Report.objects.create(employee=employee, period=period, accomplishments='x' * 150)
+        reports = Report.objects.select_related('period', 'employee')
+
+        rows = reports_csv(reports).splitlines()
+        self.assertEqual(len(rows), 2)
+        self.assertIn('x' * 100 + '...', rows[1])
+        self.assertTrue(reports_pdf(reports, start_date='2026-01-01').startswith(b'%PDF'))
+
+
+class AsyncReadEndpointTests(TestCase):
+    """Test cases for the async dashboard-stats and current period views"""
+
+    def setUp(self):
+        self.supervisor = User.objects.create_user(
+            email='supervisor@example.com', password='x', full_name='Supervisor User', role=User.Role.SUPERVISOR
+        )
+        self.employee = User.objects.create_user(
+            email='employee@example.com', password='x', full_name='Employee User',
+            role=User.Role.EMPLOYEE, supervisor=self.supervisor
+        )
+        teammate = User.objects.create_user(
+            email='teammate@example.com', password='x', full_name='Team Mate',
+            role=User.Role.EMPLOYEE, supervisor=self.supervisor
+        )
+        self.period = ReportingPeriod.objects.create(
+            start_date=timezone.now().date(),
+            end_date=timezone.now().date() + timedelta(days=6),
+            deadline=timezone.now() + timedelta(days=4)
+        )
+        last_week = ReportingPeriod.objects.create(
+            start_date=timezone.now().date() - timedelta(days=7),
+            end_date=timezone.now().date() - timedelta(days=1),
+            deadline=timezone.now() - timedelta(days=3),
+            is_closed=True
+        )
+        content = {'accomplishments': 'Shipped', 'goals_next_week': 'Polish', 'progress_rating': 'on_track'}
+        Report.objects.create(employee=self.employee, period=self.period, status=Report.Status.DRAFT)
+        Report.objects.create(employee=self.employee, period=last_week, status=Report.Status.REVIEWED, **content)
+        Report.objects.create(employee=teammate, period=self.period, status=Report.Status.SUBMITTED, **content)
+        Report.objects.create(employee=teammate, period=last_week, status=Report.Status.NOT_STARTED)
+
+    def auth(self, user):
+        # An access token alone; RefreshToken.for_user would write to the token blacklist
+        from rest_framework_simplejwt.tokens import AccessToken
+        return {'Authorization': f'Bearer {AccessToken.for_user(user)}'}
+
+    async def test_dashboard_stats_by_role(self):
+        """Test counts are scoped to the employee's own or the supervisor's team reports"""
+        response = await self.async_client.get('/api/v1/reports/dashboard-stats/', headers=self.auth(self.employee))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {'myReports': 2, 'pendingReview': 0, 'reviewed': 1, 'draft': 1})
+
+        response = await self.async_client.get('/api/v1/reports/dashboard-stats/', headers=self.auth(self.supervisor))
+        self.assertEqual(response.json(), {'myReports': 3, 'pendingReview': 1, 'reviewed': 1, 'draft': 1})
+
+    async def test_dashboard_stats_filters(self):
+        """Test the report list's start_date and employee filters apply"""
+        response = await self.async_client.get(
+            '/api/v1/reports/dashboard-stats/',
+            {'start_date': self.period.start_date.isoformat(), 'employee': 'Team'},
+            headers=self.auth(self.supervisor)
+        )
+        self.assertEqual(response.json(), {'myReports': 1, 'pendingReview': 1, 'reviewed': 0, 'draft': 0})
+
+    async def test_current_period(self):
+        """Test the open period is returned, and 404 once it is closed"""
+        response = await self.async_client.get('/api/v1/reports/periods/current/', headers=self.auth(self.employee))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['id'], self.period.id)
+
+        await ReportingPeriod.objects.filter(pk=self.period.pk).aupdate(is_closed=True)
+        response = await self.async_client.get('/api/v1/reports/periods/current/', headers=self.auth(self.employee))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.json()['error'], 'No active reporting period')
+
+    async def test_requires_valid_token(self):
+        """Test missing and invalid tokens are rejected in the API error format"""
+        for headers in [{}, {'Authorization': 'Bearer not-a-token'}]:
+            with self.subTest(headers=headers):
+                response = await self.async_client.get('/api/v1/reports/dashboard-stats/', headers=headers)
+                self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+                self.assertEqual(response.json()['code'], 'AUTHENTICATION_FAILED')
+                self.assertIn('Bearer', response['WWW-Authenticate'])
+
+    async def test_read_only(self):
+        """Test other methods than GET are refused"""
+        response = await self.async_client.post('/api/v1/reports/dashboard-stats/', headers=self.auth(self.employee))
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+        self.assertEqual(response['Allow'], 'GET, HEAD')
+
+    async def test_instrumented(self):
+        """Test the async path of the instrumentation middleware counts the view's queries"""
+        # The ORM calls run on the test thread, whose connection was opened
+        # before the middleware could hook new connections
+        from config.middleware import _install_execute_wrapper
+        await sync_to_async(_install_execute_wrapper)(connection=connection)
+        response = await self.async_client.get('/api/v1/reports/dashboard-stats/', headers=self.auth(self.employee))
+        # The JWT user lookup and the aggregate
+        self.assertIn('desc="2 queries"', response['Server-Timing'])
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class DashboardCacheTests(TestCase):
+    """Test cases for the cached dashboard endpoints and their invalidation"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.supervisor = User.objects.create_user(
+            email='supervisor@example.com', password='x', full_name='Supervisor User', role=User.Role.SUPERVISOR
+        )
+        self.other_supervisor = User.objects.create_user(
+            email='other@example.com', password='x', full_name='Other Supervisor', role=User.Role.SUPERVISOR
+        )
+        self.admin = User.objects.create_user(
+            email='admin@example.com', password='x', full_name='Admin User', role=User.Role.ADMIN
+        )
+        self.employee = User.objects.create_user(
+            email='employee@example.com', password='x', full_name='Employee User',
+            role=User.Role.EMPLOYEE, supervisor=self.supervisor
+        )
+        self.other_employee = User.objects.create_user(
+            email='other.employee@example.com', password='x', full_name='Other Employee',
+            role=User.Role.EMPLOYEE, supervisor=self.other_supervisor
+        )
+        self.period = ReportingPeriod.objects.create(
+            start_date=timezone.now().date(),
+            end_date=timezone.now().date() + timedelta(days=6),
+            deadline=timezone.now() + timedelta(days=4)
+        )
+        self.report = Report.objects.create(
+            employee=self.employee, period=self.period, status=Report.Status.SUBMITTED,
+            accomplishments='Shipped', goals_next_week='Polish', progress_rating='on_track'
+        )
+        Report.objects.create(employee=self.other_employee, period=self.period, status=Report.Status.DRAFT)
+
+    def get(self, user, path):
+        self.client.force_authenticate(user=user)
+        return self.client.get(f'/api/v1/reports/{path}/')
+
+    def test_repeat_request_is_served_from_cache(self):
+        """Test a second dashboard request runs no queries and returns the same payload"""
+        for user, path in [
+            (self.employee, 'dashboard-stats'),
+            (self.supervisor, 'team-oversight'),
+            (self.admin, 'organization-stats'),
+        ]:
+            with self.subTest(path=path):
+                first = self.get(user, path)
+                self.assertEqual(first.status_code, status.HTTP_200_OK)
+                with self.assertNumQueries(0):
+                    second = self.get(user, path)
+                self.assertEqual(second.json(), first.json())
+
+    def test_review_invalidates_team_and_employee(self):
+        """Test reviewing a report refreshes the employee's and the supervisor's dashboards"""
+        self.assertEqual(self.get(self.employee, 'dashboard-stats').json()['reviewed'], 0)
+        self.assertEqual(self.get(self.supervisor, 'team-oversight').json()['members'][0]['pending_review'], 1)
+
+        self.client.force_authenticate(user=self.supervisor)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f'/api/v1/reports/{self.report.id}/review/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(self.get(self.employee, 'dashboard-stats').json()['reviewed'], 1)
+        member = self.get(self.supervisor, 'team-oversight').json()['members'][0]
+        self.assertEqual((member['pending_review'], member['reviewed']), (0, 1))
+
+    def test_other_teams_stay_cached(self):
+        """Test a status change only invalidates the dashboards that show the report"""
+        self.get(self.other_supervisor, 'team-oversight')
+        self.get(self.other_employee, 'dashboard-stats')
+
+        self.client.force_authenticate(user=self.supervisor)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f'/api/v1/reports/{self.report.id}/review/')
+
+        with self.assertNumQueries(0):
+            self.get(self.other_supervisor, 'team-oversight')
+            self.get(self.other_employee, 'dashboard-stats')
+
+    def test_period_close_invalidates_everything(self):
+        """Test closing the period refreshes every cached dashboard"""
+        self.assertEqual(self.get(self.admin, 'organization-stats').status_code, status.HTTP_200_OK)
+
+        self.client.force_authenticate(user=self.admin)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f'/api/v1/reports/periods/{self.period.id}/close/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(self.get(self.admin, 'organization-stats').status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_period_edit_and_delete_invalidate_everything(self):
+        """Test editing or deleting the period refreshes every cached dashboard"""
+        self.assertEqual(self.get(self.admin, 'organization-stats').status_code, status.HTTP_200_OK)
+        for is_closed, expected in [(True, status.HTTP_404_NOT_FOUND), (False, status.HTTP_200_OK)]:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.patch(
+                    f'/api/v1/reports/periods/{self.period.id}/', {'is_closed': is_closed}, format='json'
+                )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(self.get(self.admin, 'organization-stats').status_code, expected)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(f'/api/v1/reports/periods/{self.period.id}/')
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.get(self.admin, 'organization-stats').status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_user_create_and_delete_invalidate_team(self):
+        """Test adding or removing a team member refreshes the team and admin dashboards"""
+        from accounts.serializers import UserCreationSerializer
+        from accounts.views import UserViewSet
+
+        self.assertEqual(len(self.get(self.supervisor, 'team-oversight').json()['members']), 1)
+        self.assertEqual(self.get(self.admin, 'organization-stats').json()['totalEmployees'], 2)
+
+        serializer = UserCreationSerializer(data={
+            'email': 'new.hire@example.com', 'full_name': 'New Hire', 'role': User.Role.EMPLOYEE,
+            'supervisor': self.supervisor.id, 'password': 'Str0ng!Pass', 'confirm_password': 'Str0ng!Pass'
+        })
+        serializer.is_valid(raise_exception=True)
+        with self.captureOnCommitCallbacks(execute=True):
+            UserViewSet().perform_create(serializer)
+
+        self.assertEqual(len(self.get(self.supervisor, 'team-oversight').json()['members']), 2)
+        self.assertEqual(self.get(self.admin, 'organization-stats').json()['totalEmployees'], 3)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            UserViewSet().perform_destroy(serializer.instance)
+
+        self.assertEqual(len(self.get(self.supervisor, 'team-oversight').json()['members']), 1)
+        self.assertEqual(self.get(self.admin, 'organization-stats').json()['totalEmployees'], 2)
+
+    def test_filtered_dashboard_stats_are_not_cached(self):
+        """Test date-filtered counts are computed on every request"""
+        self.client.force_authenticate(user=self.employee)
+        path = f'/api/v1/reports/dashboard-stats/?start_date={self.period.start_date}'
+        self.client.get(path)
+        with self.assertNumQueries(1):
+            self.client.get(path)
+
+    def test_hit_rate_stats(self):
+        """Test admins read the hit and miss counts per endpoint"""
+        self.get(self.supervisor, 'team-oversight')
+        self.get(self.supervisor, 'team-oversight')
+        self.get(self.supervisor, 'team-oversight')
+
+        response = self.get(self.admin, 'dashboard-cache-stats')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()['endpoints']['team-oversight'], {'hits': 2, 'misses': 1, 'hit_rate': 0.667}
+        )
+        self.assertEqual(self.get(self.supervisor, 'dashboard-cache-stats').status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get('/api/v1/reports/dashboard-cache-stats/?hours=week')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class RendererTests(TestCase):
+    """Test cases for the orjson and MessagePack response renderers"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.supervisor = User.objects.create_user(
+            email='supervisor@example.com', password='x', full_name='Supervisor User', role=User.Role.SUPERVISOR
+        )
+        self.employee = User.objects.create_user(
+            email='employee@example.com', password='x', full_name='Employée Üser',
+            role=User.Role.EMPLOYEE, supervisor=self.supervisor
+        )
+        self.period = ReportingPeriod.objects.create(
+            start_date=timezone.now().date(),
+            end_date=timezone.now().date() + timedelta(days=6),
+            deadline=timezone.now() + timedelta(days=4)
+        )
+        self.report = Report.objects.create(
+            employee=self.employee, period=self.period, status=Report.Status.SUBMITTED,
+            submitted_at=timezone.now(), accomplishments='Shipped   the ☃ release',
+            goals_next_week='Plan', progress_rating='on_track'
+        )
+        self.client.force_authenticate(user=self.employee)
+
+    def test_json_identical_to_drf(self):
+        """Test the orjson renderer writes the same bytes as DRF's JSONRenderer"""
+        from decimal import Decimal
+        from django.utils.translation import gettext_lazy
+        from rest_framework.renderers import JSONRenderer
+        from reports.serializers import ReportSerializer
+        from config.renderers import ORJSONRenderer
+
+        now = timezone.now()
+        payloads = [
+            ReportSerializer(Report.objects.all(), many=True).data,
+            {
+                'at': now, 'utc_z': now.replace(microsecond=0), 'day': now.date(), 'time': now.time(),
+                'amount': Decimal('12.50'), 'label': gettext_lazy('Draft'), 'ids': {1: 'one'},
+                'nested': [{'rate': 66.7, 'none': None, 'flag': True}], 'text': 'line\u2028 and \u2029 separators',
+            },
+            {'big': 2 ** 70},
+        ]
+        for data in payloads:
+            with self.subTest(data=data):
+                self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+    def test_json_floats_parse_identically(self):
+        """Test floats orjson writes in another form still parse to DRF's values"""
+        from rest_framework.renderers import JSONRenderer
+        from config.renderers import ORJSONRenderer
+
+        data = {'rates': [1e-07, 2.5e-05, 1e16, 66.7, 1.7976931348623157e308, -0.0]}
+        self.assertEqual(json.loads(ORJSONRenderer().render(data)), json.loads(JSONRenderer().render(data)))
+
+    def test_json_by_default(self):
+        """Test JSON is served when the client does not ask for MessagePack"""
+        response = self.client.get(f'/api/v1/reports/{self.report.id}/')
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response.json()['accomplishments'], self.report.accomplishments)
+
+    def test_msgpack_negotiated(self):
+        """Test Accept: application/msgpack gets the same data in MessagePack"""
+        import msgpack
+
+        for path in [f'/api/v1/reports/{self.report.id}/', '/api/v1/reports/my-reports/']:
+            with self.subTest(path=path):
+                as_json = self.client.get(path).json()
+                response = self.client.get(path, HTTP_ACCEPT='application/msgpack')
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response['Content-Type'], 'application/msgpack')
+                self.assertIn('Accept', response['Vary'])
+                self.assertEqual(msgpack.unpackb(response.content), as_json)
+
+        response = self.client.get('/api/v1/reports/999999/', HTTP_ACCEPT='application/msgpack')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(msgpack.unpackb(response.content)['code'], 'NOT_FOUND')
+
+    def test_etag_differs_per_format(self):
+        """Test JSON and MessagePack bodies carry different ETags and revalidate separately"""
+        for path in [f'/api/v1/reports/{self.report.id}/', '/api/v1/reports/my-reports/']:
+            with self.subTest(path=path):
+                json_etag = self.client.get(path)['ETag']
+                msgpack_etag = self.client.get(f'{path}?format=msgpack')['ETag']
+                self.assertNotEqual(json_etag, msgpack_etag)
+
+                response = self.client.get(path, HTTP_ACCEPT='application/msgpack', HTTP_IF_NONE_MATCH=json_etag)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                response = self.client.get(path, HTTP_ACCEPT='application/msgpack', HTTP_IF_NONE_MATCH=msgpack_etag)
+                self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+class ReportListFastPathTests(TestCase):
+    """Test cases for the read-only report list fast path"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.supervisor = User.objects.create_user(
+            email='supervisor@example.com', password='x', full_name='Supervisor User', role=User.Role.SUPERVISOR
+        )
+        self.employee = User.objects.create_user(
+            email='employee@example.com', password='x', full_name='Zoë "Quoted" Ünicode',
+            role=User.Role.EMPLOYEE, supervisor=self.supervisor
+        )
+        teammate = User.objects.create_user(
+            email='teammate@example.com', password='x', full_name='Team Mate',
+            role=User.Role.EMPLOYEE, supervisor=self.supervisor
+        )
+        self.admin = User.objects.create_user(
+            email='admin@example.com', password='x', full_name='Admin User', role=User.Role.ADMIN
+        )
+        now = timezone.now()
+        current = ReportingPeriod.objects.create(
+            start_date=now.date(),
+            end_date=now.date() + timedelta(days=6),
+            deadline=now + timedelta(days=4),
+            closes_at=now + timedelta(days=7)
+        )
+        last_week = ReportingPeriod.objects.create(
+            start_date=now.date() - timedelta(days=7),
+            end_date=now.date() - timedelta(days=1),
+            deadline=(now - timedelta(days=3)).replace(microsecond=0),
+            is_closed=True
+        )
+        content = {
+            'accomplishments': '<p>Shipped <strong>the</strong> release</p>',
+            'goals_next_week': 'Polish\nand\tdocument',
+            'progress_rating': 'on_track',
+            'blockers': 'Waiting on the ☃ vendor',
+        }
+        Report.objects.create(employee=self.employee, period=current, status=Report.Status.DRAFT)
+        Report.objects.create(
+            employee=self.employee, period=last_week, status=Report.Status.REVIEWED,
+            submitted_at=now - timedelta(days=2), is_late=True, additional_notes='Late', **content
+        )
+        Report.objects.create(
+            employee=teammate, period=current, status=Report.Status.SUBMITTED,
+            submitted_at=now.replace(microsecond=0), support_needed='Budget', **content
+        )
+        Report.objects.create(employee=teammate, period=last_week, status=Report.Status.NOT_STARTED)
+
+    def reports(self):
+        return Report.objects.select_related('period', 'employee')
+
+    def test_identical_json(self):
+        """Test the fast path serializes to the same bytes as ReportSerializer, in any time zone"""
+        from rest_framework.renderers import JSONRenderer
+        from reports.serializers import ReportSerializer, report_list_data, report_list_rows
+
+        for zone in ['UTC', 'Asia/Kolkata', 'America/New_York']:
+            with self.subTest(zone=zone), timezone.override(zone):
+                expected = JSONRenderer().render(ReportSerializer(self.reports(), many=True).data)
+                self.assertEqual(JSONRenderer().render(report_list_data(report_list_rows(self.reports()))), expected)
+
+    def test_single_query(self):
+        """Test the rows, with employee and period, come from one query"""
+        from reports.serializers import report_list_data, report_list_rows
+
+        with self.assertNumQueries(1):
+            data = report_list_data(report_list_rows(Report.objects.all()))
+        self.assertEqual(len(data), 4)
+
+    def test_list_endpoints_unchanged(self):
+        """Test the list endpoints return what ReportSerializer produces for the same reports"""
+        from reports.serializers import ReportSerializer
+
+        def expected(**filters):
+            return json.loads(json.dumps(ReportSerializer(self.reports().filter(**filters), many=True).data))
+
+        cases = [
+            (self.employee, '/api/v1/reports/my-reports/', expected(employee=self.employee)),
+            (self.supervisor, '/api/v1/reports/team-reports/', expected(employee__supervisor=self.supervisor)),
+            (self.supervisor, '/api/v1/reports/pending-approval/', expected(status=Report.Status.SUBMITTED)),
+            (self.admin, '/api/v1/reports/all-reports/', expected()),
+        ]
+        for user, path, data in cases:
+            with self.subTest(path=path):
+                self.client.force_authenticate(user=user)
+                response = self.client.get(path)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.json(), data)
+
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get('/api/v1/reports/?page_size=3')
+        self.assertEqual(response.json()['count'], 4)
+        self.assertEqual(len(response.json()['results']), 3)
+        for item in response.json()['results']:
+            self.assertIn(item, expected())
@@ -8,6 +8,12 @@ router.register(r'periods', views.ReportingPeriodViewSet, basename='period')
 router.register(r'', views.ReportViewSet, basename='report')
 
 urlpatterns = [
+    # Async read endpoints; ahead of the router, whose detail routes would match them
+    path('periods/current/', views.current_period, name='period-current'),
+    path('dashboard-stats/', views.dashboard_stats, name='report-dashboard-stats'),
+    # Comments; ahead of the router, whose report detail route would match 'comments/'
+    path('comments/', views.CommentViewSet.as_view({'get': 'list', 'post': 'create'}), name='comment-list'),
+    path('comments/<int:pk>/', views.CommentViewSet.as_view({'get': 'retrieve', 'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'}), name='comment-detail'),
     path('', include(router.urls)),
     # Report actions
     path('<int:pk>/submit/', views.ReportViewSet.as_view({'post': 'submit'}), name='report-submit'),
@@ -17,9 +23,5 @@ urlpatterns = [
     path('pending-approval/', views.ReportViewSet.as_view({'get': 'pending_approval'}), name='report-pending-approval'),
     path('team-reports/', views.ReportViewSet.as_view({'get': 'team_reports'}), name='report-team-reports'),
     path('all-reports/', views.ReportViewSet.as_view({'get': 'all_reports'}), name='report-all-reports'),
-    path('dashboard-stats/', views.ReportViewSet.as_view({'get': 'dashboard_stats'}), name='report-dashboard-stats'),
     path('recent-activity/', views.ReportViewSet.as_view({'get': 'recent_activity'}), name='report-recent-activity'),
-    # Comments
-    path('comments/', views.CommentViewSet.as_view({'get': 'list', 'post': 'create'}), name='comment-list'),
-    path('comments/<int:pk>/', views.CommentViewSet.as_view({'get': 'retrieve', 'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'}), name='comment-detail'),
 ]
\ No newline at end of file
@@ -1,7 +1,11 @@
 """
 Utility functions for the reports app.
 """
-import bleach
+import re
+import threading
+from functools import lru_cache
+
+from bleach.sanitizer import Cleaner
 
 # Allowed HTML tags for rich text fields (PRD section 6.1)
 ALLOWED_TAGS = [
@@ -16,18 +20,45 @@ ALLOWED_ATTRIBUTES = {
 }
 
 
+# Distinct field values kept by the sanitize memo, per process. Rich text
+# fields are capped at a few thousand characters, so this stays small.
+SANITIZE_CACHE_SIZE = 2048
+
+# Characters the HTML parser may rewrite. Text with none of them comes back
+# from bleach unchanged, so parsing it can be skipped.
+_NEEDS_PARSING = re.compile(r'[<>&\x00-\x08\x0b-\x1f]')
+
+# Cleaner builds its tag/attribute filters once, but its parser is not
+# thread-safe, so each thread gets its own instance.
+_local = threading.local()
+
+
+def _get_cleaner():
+    cleaner = getattr(_local, 'cleaner', None)
+    if cleaner is None:
+        cleaner = _local.cleaner = Cleaner(
+            tags=ALLOWED_TAGS,
+            attributes=ALLOWED_ATTRIBUTES,
+            strip=True,
+            strip_comments=True
+        )
+    return cleaner
+
+
+@lru_cache(maxsize=SANITIZE_CACHE_SIZE)
+def _clean(value):
+    return _get_cleaner().clean(value)
+
+
 def sanitize_html(value: str) -> str:
     """
     Strip disallowed HTML tags and attributes from rich text fields.
     Per PRD section 6.1: rich text output 'stored as sanitized HTML
     and sanitized server-side before persistence.'
+
+    Plain text is returned as is; HTML is memoized on its content, so
+    re-saving an unchanged field does not parse it again.
     """
-    if not value:
+    if not value or not _NEEDS_PARSING.search(value):
         return value
-    return bleach.clean(
-        value,
-        tags=ALLOWED_TAGS,
-        attributes=ALLOWED_ATTRIBUTES,
-        strip=True,
-        strip_comments=True
-    )
+    return _clean(value)
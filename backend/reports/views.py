@@ -1,28 +1,70 @@
 from rest_framework import viewsets, status, permissions, serializers
-import csv
-import io
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied
 from rest_framework.pagination import PageNumberPagination
 from django.utils import timezone
 from datetime import timedelta, datetime
 from .models import ReportingPeriod, Report, Comment
+from .search import search_reports
+from .conditional import (
+    PreconditionFailed,
+    conditional_response,
+    queryset_validators,
+    report_validators,
+    response_format,
+    set_validators
+)
+from . import dashboard_cache
+from .blockers import index_report_blockers, top_blockers
+from .provisioning import provision_period_reports
 from .serializers import (
     ReportingPeriodSerializer,
     ReportSerializer,
     ReportDetailSerializer,
-    CommentSerializer
+    ReportAutosaveSerializer,
+    BatchReportActionSerializer,
+    CommentSerializer,
+    report_list_data,
+    report_list_rows
 )
 from accounts.models import User, AuditLog
+from config.async_api import async_api_view, error_response
+from config.throttling import UserRateThrottle, ReportSubmitRateThrottle
+from asgiref.sync import sync_to_async
 from django.http import HttpResponse
-from django.db.models import Count, Q
+from django.db.models import Count, Prefetch, Q
 from django.db import transaction
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-import io
+
+
+def scoped_reports(user, query_params):
+    """
+    The reports the user may see (their own, their team's, or all for
+    admins), narrowed by the start_date, end_date and employee filters
+    """
+    if user.role == User.Role.EMPLOYEE:
+        qs = Report.objects.filter(employee=user)
+    elif user.role == User.Role.SUPERVISOR:
+        qs = Report.objects.filter(employee__supervisor=user)
+    else:
+        qs = Report.objects.all()
+
+    # Add filters for Phase 3
+    start_date = query_params.get('start_date')
+    end_date = query_params.get('end_date')
+    employee_search = query_params.get('employee')
+
+    if start_date:
+        qs = qs.filter(period__start_date__gte=start_date)
+    if end_date:
+        qs = qs.filter(period__end_date__lte=end_date)
+    if employee_search:
+        if employee_search.isdigit():
+            qs = qs.filter(employee_id=employee_search)
+        else:
+            qs = qs.filter(employee__full_name__icontains=employee_search)
+
+    return qs.select_related('period', 'employee').order_by('-period__start_date')
 
 
 class ReportPagination(PageNumberPagination):
@@ -56,6 +98,22 @@ class ReportingPeriodViewSet(viewsets.ModelViewSet):
             return ReportingPeriod.objects.filter(is_closed=False)
         return super().get_queryset()
 
+    def perform_create(self, serializer):
+        period = serializer.save()
+        provision_period_reports(period)
+        dashboard_cache.invalidate_all()
+
+    def perform_update(self, serializer):
+        # Period names, dates and deadlines appear on every dashboard
+        with transaction.atomic():
+            serializer.save()
+            dashboard_cache.invalidate_all()
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            instance.delete()
+            dashboard_cache.invalidate_all()
+
     @action(detail=True, methods=['post'], url_path='close')
     def close_period(self, request, pk=None):
         """Transition the period to closed status"""
@@ -68,11 +126,13 @@ class ReportingPeriodViewSet(viewsets.ModelViewSet):
             period = ReportingPeriod.objects.select_for_update().get(pk=period.pk)
             period.is_closed = True
             period.save()
+            dashboard_cache.invalidate_all()
             
             # Log the action
             AuditLog.log(
                 actor=request.user,
-                action=AuditLog.Action.PERIOD_CLOSE,
+                action=AuditLog.Action.REPORT_PERIOD_CLOSE,
+                target=period,
                 metadata={"message": f"Closed reporting period {period}", "period_id": period.id}
             )
         
@@ -90,11 +150,13 @@ class ReportingPeriodViewSet(viewsets.ModelViewSet):
             period = ReportingPeriod.objects.select_for_update().get(pk=period.pk)
             period.is_closed = False
             period.save()
+            dashboard_cache.invalidate_all()
 
             # Log the action
             AuditLog.log(
                 actor=request.user,
-                action=AuditLog.Action.PERIOD_REOPEN,
+                action=AuditLog.Action.REPORT_PERIOD_REOPEN,
+                target=period,
                 metadata={"message": f"Reopened reporting period {period}", "period_id": period.id}
             )
 
@@ -110,36 +172,53 @@ class ReportViewSet(viewsets.ModelViewSet):
     pagination_class = ReportPagination
     
     def get_queryset(self):
-        user = self.request.user
-        if user.role == User.Role.EMPLOYEE:
-            qs = Report.objects.filter(employee=user)
-        elif user.role == User.Role.SUPERVISOR:
-            qs = Report.objects.filter(employee__supervisor=user)
-        else:
-            qs = Report.objects.all()
-
-        # Add filters for Phase 3
-        start_date = self.request.query_params.get('start_date')
-        end_date = self.request.query_params.get('end_date')
-        employee_search = self.request.query_params.get('employee')
-
-        if start_date:
-            qs = qs.filter(period__start_date__gte=start_date)
-        if end_date:
-            qs = qs.filter(period__end_date__lte=end_date)
-        if employee_search:
-            if employee_search.isdigit():
-                qs = qs.filter(employee_id=employee_search)
-            else:
-                qs = qs.filter(employee__full_name__icontains=employee_search)
-
-        return qs.select_related('period', 'employee').order_by('-period__start_date')
+        return scoped_reports(self.request.user, self.request.query_params)
     
     def get_serializer_class(self):
         if self.action in ['retrieve', 'update', 'partial_update']:
             return ReportDetailSerializer
         return super().get_serializer_class()
 
+    def get_object(self):
+        """Honor If-Match / If-Unmodified-Since on every write to a report"""
+        report = super().get_object()
+        if self.request.method not in permissions.SAFE_METHODS:
+            if conditional_response(self.request, *report_validators(report, response_format(self.request))) is not None:
+                raise PreconditionFailed()
+        return report
+
+    def conditional_list(self, request, queryset, respond):
+        """
+        Answer a list request with 304 when nothing in the user's scope
+        changed since the client's copy, otherwise call `respond()`.
+        """
+        validators = queryset_validators(queryset, response_format(request), request.user.pk, request.user.role)
+        response = conditional_response(request, *validators) or respond()
+        return set_validators(response, *validators)
+
+    def list(self, request, *args, **kwargs):
+        reports = self.filter_queryset(self.get_queryset())
+
+        def respond():
+            rows = report_list_rows(reports)
+            page = self.paginate_queryset(rows)
+            if page is None:
+                return Response(report_list_data(rows))
+            return self.get_paginated_response(report_list_data(page))
+        return self.conditional_list(request, reports, respond)
+
+    def report_list_response(self, reports):
+        """ReportSerializer's output for `reports`, through the read-only fast path"""
+        return Response(report_list_data(report_list_rows(reports)))
+
+    def retrieve(self, request, *args, **kwargs):
+        report = self.get_object()
+        validators = report_validators(report, response_format(request))
+        response = conditional_response(request, *validators)
+        if response is None:
+            response = Response(self.get_serializer(report).data)
+        return set_validators(response, *validators)
+
     def create(self, request, *args, **kwargs):
         """Only employees can create reports"""
         if request.user.role != User.Role.EMPLOYEE:
@@ -156,7 +235,15 @@ class ReportViewSet(viewsets.ModelViewSet):
                 {"error": "Only employees can update reports"},
                 status=status.HTTP_403_FORBIDDEN
             )
-        return super().update(request, *args, **kwargs)
+        response = super().update(request, *args, **kwargs)
+        return set_validators(response, *report_validators(self.updated_report, response_format(request)))
+
+    def perform_update(self, serializer):
+        if serializer.instance.status == Report.Status.NOT_STARTED:
+            self.updated_report = serializer.save(status=Report.Status.DRAFT)
+            self.invalidate_dashboards()
+        else:
+            self.updated_report = serializer.save()
 
     def destroy(self, request, *args, **kwargs):
         """Only employees can delete their own draft reports"""
@@ -167,19 +254,34 @@ class ReportViewSet(viewsets.ModelViewSet):
             )
         return super().destroy(request, *args, **kwargs)
 
+    def perform_destroy(self, instance):
+        instance.delete()
+        self.invalidate_dashboards()
+
+    def invalidate_dashboards(self):
+        """After the requesting employee's report was created, deleted or changed status"""
+        user = self.request.user
+        dashboard_cache.invalidate([user.pk], [user.supervisor_id])
+
     def perform_create(self, serializer):
         # Ensure employee can only create report for current period
         current_period = ReportingPeriod.objects.filter(is_closed=False).first()
         if not current_period:
             raise serializers.ValidationError("No active reporting period available")
         
-        # Check if report already exists for this period
-        if Report.objects.filter(employee=self.request.user, period=current_period).exists():
+        # Check if report already exists for this period; a pre-provisioned
+        # Not Started report is filled in instead of creating a second one
+        existing = Report.objects.filter(employee=self.request.user, period=current_period).first()
+        if existing and existing.status != Report.Status.NOT_STARTED:
             raise serializers.ValidationError("Report already exists for this period")
-        
-        serializer.save(employee=self.request.user, period=current_period)
+        if existing:
+            serializer.instance = existing
+            serializer.save(status=Report.Status.DRAFT)
+        else:
+            serializer.save(employee=self.request.user, period=current_period)
+        self.invalidate_dashboards()
     
-    @action(detail=True, methods=['post'])
+    @action(detail=True, methods=['post'], throttle_classes=[UserRateThrottle, ReportSubmitRateThrottle])
     def submit(self, request, pk=None):
         """
         PRD section 6.2 - Report Status Lifecycle
@@ -215,7 +317,11 @@ class ReportViewSet(viewsets.ModelViewSet):
             report.status = Report.Status.SUBMITTED
             report.submitted_at = timezone.now()
             report.save()
+            self.invalidate_dashboards()
             
+            # Update the blocker trend index (PRD section 5.3)
+            index_report_blockers(report)
+
             # Log the submission in audit log
             AuditLog.log(
                 actor=request.user,
@@ -224,12 +330,78 @@ class ReportViewSet(viewsets.ModelViewSet):
                 metadata={"message": "Report submitted to supervisor"}
             )
             
-            # Send notification to supervisor after transaction commits
-            from notifications.tasks import send_report_submitted_notification
-            transaction.on_commit(lambda: send_report_submitted_notification.delay(report.id))
+            # Notify the supervisor after the transaction commits; the email
+            # is coalesced into their next digest (PRD section 7)
+            from notifications.dispatch import notify_report_submitted
+            transaction.on_commit(lambda: notify_report_submitted(report), robust=True)
         
         return Response(ReportDetailSerializer(report).data)
     
+    @action(detail=True, methods=['patch'])
+    def autosave(self, request, pk=None):
+        """
+        PRD section 6.2 - Report Status Lifecycle
+        Save a draft with only the fields that changed. The client sends the
+        `version` (updated_at) it last saw; an older version means the report
+        was saved elsewhere in the meantime and the write is rejected.
+        """
+        if request.user.role != User.Role.EMPLOYEE:
+            return Response(
+                {"error": "Only employees can update reports"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        report = self.get_object()
+        serializer = ReportAutosaveSerializer(data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        changes = dict(serializer.validated_data)
+        if 'version' not in changes:
+            return Response(
+                {"error": "version is required"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        version = changes.pop('version')
+
+        with transaction.atomic():
+            report = Report.objects.select_for_update().select_related('period', 'employee').get(pk=report.pk)
+
+            if report.status not in [Report.Status.NOT_STARTED, Report.Status.DRAFT,
+                                     Report.Status.REVISION_REQUESTED]:
+                return Response(
+                    {"error": "Only draft reports can be autosaved"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if report.period.is_actually_closed:
+                return Response(
+                    {"error": "The reporting period is closed"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            if report.updated_at != version:
+                return Response(
+                    {
+                        "error": "Report was changed since it was loaded",
+                        "version": serializers.DateTimeField().to_representation(report.updated_at)
+                    },
+                    status=status.HTTP_409_CONFLICT
+                )
+
+            update_fields = [field for field, value in changes.items() if getattr(report, field) != value]
+            for field in update_fields:
+                setattr(report, field, changes[field])
+            if report.status == Report.Status.NOT_STARTED:
+                report.status = Report.Status.DRAFT
+                update_fields.append('status')
+                self.invalidate_dashboards()
+            if update_fields:
+                report.save(update_fields=update_fields + ['updated_at'])
+
+        return set_validators(Response({
+            "id": report.id,
+            "status": report.status,
+            "saved_fields": update_fields,
+            "version": serializers.DateTimeField().to_representation(report.updated_at)
+        }), *report_validators(report, response_format(request)))
+
     @action(detail=True, methods=['post'])
     def review(self, request, pk=None):
         """
@@ -266,6 +438,7 @@ class ReportViewSet(viewsets.ModelViewSet):
             report.status = Report.Status.REVIEWED
             report.reviewed_at = timezone.now()
             report.save()
+            dashboard_cache.invalidate([report.employee_id], [request.user.pk])
 
             # Log the review in audit log
             AuditLog.log(
@@ -275,9 +448,9 @@ class ReportViewSet(viewsets.ModelViewSet):
                 metadata={"message": "Report marked as reviewed"}
             )
 
-            # Send notification to employee after transaction commits
-            from notifications.tasks import send_report_reviewed_notification
-            transaction.on_commit(lambda: send_report_reviewed_notification.delay(report.id))
+            # Notify the employee after the transaction commits
+            from notifications.dispatch import notify_report_reviewed
+            transaction.on_commit(lambda: notify_report_reviewed(report), robust=True)
 
         return Response(ReportDetailSerializer(report).data)
 
@@ -313,6 +486,7 @@ class ReportViewSet(viewsets.ModelViewSet):
             # Transition status
             report.status = Report.Status.REVISION_REQUESTED
             report.save()
+            dashboard_cache.invalidate([report.employee_id], [request.user.pk])
 
             # Create a comment automatically
             from .models import Comment
@@ -336,6 +510,119 @@ class ReportViewSet(viewsets.ModelViewSet):
 
         return Response(ReportDetailSerializer(report).data)
 
+    def lock_team_batch(self, request, report_ids):
+        """
+        Lock the requesting supervisor's submitted reports among `report_ids`
+        with a single SELECT ... FOR UPDATE. Returns (ids, skipped) where
+        skipped lists the reports that cannot be transitioned and why, and
+        keeps the employees of `ids` in self.batch_employee_ids.
+        """
+        team_ids = User.objects.filter(supervisor=request.user).values_list('id', flat=True)
+        rows = {
+            pk: (report_status, employee_id)
+            for pk, report_status, employee_id in Report.objects.select_for_update()
+            .filter(pk__in=report_ids, employee_id__in=list(team_ids))
+            .values_list('id', 'status', 'employee_id')
+        }
+        ids, skipped = [], []
+        for pk in report_ids:
+            if pk not in rows:
+                skipped.append({"id": pk, "error": "Report not found or not from your team members"})
+            elif rows[pk][0] != Report.Status.SUBMITTED:
+                skipped.append({"id": pk, "error": "Only submitted reports can be processed"})
+            else:
+                ids.append(pk)
+        self.batch_employee_ids = [rows[pk][1] for pk in ids]
+        return ids, skipped
+
+    def apply_batch(self, request, transition, audit_action, message, event, system_comment=False):
+        """
+        Shared body of the batch workflow actions: one locking query, one
+        UPDATE, bulk audit (and comment) inserts and one notification task.
+        """
+        serializer = BatchReportActionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        comment_body = None
+        if system_comment:
+            comment_body = serializer.validated_data.get('comment') or 'Supervisor requested a revision.'
+
+        with transaction.atomic():
+            ids, skipped = self.lock_team_batch(request, serializer.validated_data['report_ids'])
+            if not ids:
+                return Response(
+                    {"error": "None of the selected reports can be processed", "skipped": skipped},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            now = timezone.now()
+            # update() bypasses auto_now, so updated_at (the ETag source) is set explicitly
+            Report.objects.filter(pk__in=ids).update(updated_at=now, **transition(now))
+            dashboard_cache.invalidate(self.batch_employee_ids, [request.user.pk])
+
+            if comment_body is not None:
+                Comment.objects.bulk_create([
+                    Comment(report_id=pk, author=request.user, body=f"[SYSTEM: Revision Requested] {comment_body}")
+                    for pk in ids
+                ])
+
+            metadata = {"message": message, "batch_size": len(ids)}
+            if comment_body is not None:
+                metadata["comment"] = comment_body
+            AuditLog.objects.bulk_create([
+                AuditLog(
+                    actor=request.user,
+                    action=audit_action,
+                    target_model='report',
+                    target_id=str(pk),
+                    metadata=metadata
+                )
+                for pk in ids
+            ])
+
+            from notifications.tasks import send_batch_workflow_notifications
+            transaction.on_commit(lambda: send_batch_workflow_notifications.delay(ids, event))
+
+        return Response({"updated": ids, "skipped": skipped})
+
+    @action(detail=False, methods=['post'], url_path='batch-review')
+    def batch_review(self, request):
+        """
+        PRD section 5.3 - Supervisor Dashboard & section 6.2 - Report Status Lifecycle
+        Mark several submitted reports from the supervisor's team as Reviewed
+        """
+        if request.user.role != User.Role.SUPERVISOR:
+            return Response(
+                {"error": "Only supervisors can review reports. Admins manage the platform only."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        return self.apply_batch(
+            request,
+            transition=lambda now: {"status": Report.Status.REVIEWED, "reviewed_at": now},
+            audit_action=AuditLog.Action.REPORT_REVIEW,
+            message="Report marked as reviewed",
+            event='reviewed'
+        )
+
+    @action(detail=False, methods=['post'], url_path='batch-request-revision')
+    def batch_request_revision(self, request):
+        """
+        Request revisions on several submitted reports at once; every report
+        gets the same system comment.
+        """
+        if request.user.role != User.Role.SUPERVISOR:
+            return Response(
+                {"error": "Only supervisors can request revisions"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        return self.apply_batch(
+            request,
+            transition=lambda now: {"status": Report.Status.REVISION_REQUESTED},
+            audit_action=AuditLog.Action.REPORT_REVISION_REQUESTED,
+            message="Supervisor requested a revision",
+            event='revision_requested',
+            system_comment=True
+        )
+
     @action(detail=True, methods=['post'], url_path='reset-to-draft')
     def reset_to_draft(self, request, pk=None):
         """
@@ -362,42 +649,23 @@ class ReportViewSet(viewsets.ModelViewSet):
             report.submitted_at = None
             report.reviewed_at = None
             report.save()
+            dashboard_cache.invalidate([report.employee_id], [report.employee.supervisor_id])
 
             AuditLog.log(
                 actor=request.user,
-                action=AuditLog.Action.REPORT_UPDATE,
+                action=AuditLog.Action.REPORT_RESET,
                 target=report,
                 metadata={"message": "Admin reset report to Draft status"}
             )
 
         return Response(ReportDetailSerializer(report).data)
 
-    @action(detail=False, methods=['get'], url_path='dashboard-stats')
-    def dashboard_stats(self, request):
-        """Returns counts for reports by status for the current user's scope"""
-        queryset = self.get_queryset()
-        
-        # Determine what "myReports" (or "Team Reports") should count
-        if request.user.role == User.Role.EMPLOYEE:
-            my_reports_count = queryset.filter(employee=request.user).count()
-        else:
-            # For supervisors, this represents their entire team's reports
-            my_reports_count = queryset.count()
-            
-        stats = {
-            'myReports': my_reports_count,
-            'pendingReview': queryset.filter(status=Report.Status.SUBMITTED).count(),
-            'reviewed': queryset.filter(status=Report.Status.REVIEWED).count(),
-            'draft': queryset.filter(status=Report.Status.DRAFT).count()
-        }
-        return Response(stats)
-
     @action(detail=False, methods=['get'], url_path='recent-activity')
     def recent_activity(self, request):
         """Returns the last 10 audit logs relevant to the user"""
         logs = AuditLog.objects.filter(
             target_model='report'
-        ).order_by('-timestamp')[:10]
+        ).select_related('actor').order_by('-timestamp')[:10]
         
         activity = []
         for log in logs:
@@ -411,24 +679,41 @@ class ReportViewSet(viewsets.ModelViewSet):
             })
         return Response(activity)
 
+    @action(detail=False, methods=['get'], url_path='search')
+    def search(self, request):
+        """
+        Full-text search over accomplishments, goals, blockers and comments.
+        Results are ranked by relevance, paginated, and limited to the
+        reports the user can already see.
+        """
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({"error": "Search query 'q' is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        reports = search_reports(self.get_queryset(), query).order_by('-search_rank', '-period__start_date')
+        page = self.paginate_queryset(reports)
+
+        data = self.get_serializer(page, many=True).data
+        for item, report in zip(data, page):
+            item['search_rank'] = report.search_rank
+        return self.get_paginated_response(data)
+
     @action(detail=False, methods=['get'], url_path='my-reports')
     def my_reports(self, request):
         reports = self.get_queryset().filter(employee=request.user)
-        return Response(self.get_serializer(reports, many=True).data)
+        return self.conditional_list(request, reports, lambda: self.report_list_response(reports))
 
     @action(detail=False, methods=['get'], url_path='pending-approval')
     def pending_approval(self, request):
-        reports = self.get_queryset().filter(
-            status=Report.Status.SUBMITTED
-        ).select_related('period', 'employee')
-        return Response(self.get_serializer(reports, many=True).data)
+        reports = self.get_queryset().filter(status=Report.Status.SUBMITTED)
+        return self.conditional_list(request, reports, lambda: self.report_list_response(reports))
 
     @action(detail=False, methods=['get'], url_path='team-reports')
     def team_reports(self, request):
         if request.user.role != User.Role.SUPERVISOR:
             return Response({"error": "Only supervisors can view team reports"}, status=status.HTTP_403_FORBIDDEN)
         reports = self.get_queryset()
-        return Response(self.get_serializer(reports, many=True).data)
+        return self.conditional_list(request, reports, lambda: self.report_list_response(reports))
 
     @action(detail=False, methods=['get'], url_path='team-oversight')
     def team_oversight(self, request):
@@ -438,40 +723,74 @@ class ReportViewSet(viewsets.ModelViewSet):
         """
         if request.user.role != User.Role.SUPERVISOR:
             return Response({"error": "Only supervisors can view team oversight metrics"}, status=status.HTTP_403_FORBIDDEN)
+        return Response(
+            dashboard_cache.cached('team-oversight', request.user, lambda: self.team_oversight_payload(request.user))
+        )
 
+    def team_oversight_payload(self, supervisor):
         current_period = ReportingPeriod.objects.filter(is_closed=False).first()
-        team_members = User.objects.filter(role=User.Role.EMPLOYEE, supervisor=request.user)
-        
+        team_members = list(User.objects.filter(role=User.Role.EMPLOYEE, supervisor=supervisor))
+
+        # One grouped query for the per-member counts; Not Started placeholders
+        # are not reports the member has written
+        counts = {
+            row['employee']: row
+            for row in Report.objects.filter(employee__supervisor=supervisor)
+            .exclude(status=Report.Status.NOT_STARTED)
+            .values('employee')
+            .annotate(
+                total_reports=Count('id'),
+                pending_review=Count('id', filter=Q(status=Report.Status.SUBMITTED)),
+                reviewed=Count('id', filter=Q(status=Report.Status.REVIEWED))
+            )
+        }
+        current_statuses = {}
+        if current_period:
+            current_statuses = dict(
+                Report.objects.filter(period=current_period, employee__supervisor=supervisor)
+                .values_list('employee', 'status')
+            )
+
         member_stats = []
         for member in team_members:
-            # Query all reports for this member
-            member_reports = Report.objects.filter(employee=member)
-            
-            # Extract basic metrics
-            total_reports = member_reports.count()
-            pending_review = member_reports.filter(status=Report.Status.SUBMITTED).count()
-            reviewed = member_reports.filter(status=Report.Status.REVIEWED).count()
-
-            # Determine current period status
-            current_status = 'Not Started'
-            if current_period:
-                current_report = member_reports.filter(period=current_period).first()
-                if current_report:
-                    current_status = current_report.get_status_display()
-
+            member_counts = counts.get(member.id, {})
             member_stats.append({
                 'id': member.id,
                 'name': member.full_name,
                 'email': member.email,
-                'total_reports': total_reports,
-                'pending_review': pending_review,
-                'reviewed': reviewed,
-                'current_status': current_status
+                'total_reports': member_counts.get('total_reports', 0),
+                'pending_review': member_counts.get('pending_review', 0),
+                'reviewed': member_counts.get('reviewed', 0),
+                'current_status': Report.Status(
+                    current_statuses.get(member.id, Report.Status.NOT_STARTED)
+                ).label
             })
 
-        return Response({
-            'total_members': team_members.count(),
+        return {
+            'total_members': len(team_members),
             'members': member_stats
+        }
+
+    @action(detail=False, methods=['get'], url_path='blocker-trends')
+    def blocker_trends(self, request):
+        """
+        Top recurring blockers per team over the last N closed periods,
+        answered from the blocker term index.
+        Supervisors see their own team; admins see every team.
+        """
+        if request.user.role == User.Role.EMPLOYEE:
+            return Response({"error": "Only supervisors and admins can view blocker trends"}, status=status.HTTP_403_FORBIDDEN)
+
+        try:
+            periods = min(max(int(request.query_params.get('periods', 4)), 1), 52)
+            limit = min(max(int(request.query_params.get('limit', 10)), 1), 50)
+        except ValueError:
+            return Response({"error": "periods and limit must be integers"}, status=status.HTTP_400_BAD_REQUEST)
+
+        supervisor = request.user if request.user.role == User.Role.SUPERVISOR else None
+        return Response({
+            'periods': periods,
+            'teams': top_blockers(periods=periods, limit=limit, supervisor=supervisor)
         })
 
     @action(detail=False, methods=['get'], url_path='all-reports')
@@ -479,8 +798,7 @@ class ReportViewSet(viewsets.ModelViewSet):
         """Returns all reports (admin only)"""
         if request.user.role != User.Role.ADMIN:
             return Response({"error": "Only admins can view all reports"}, status=status.HTTP_403_FORBIDDEN)
-        reports = Report.objects.all().select_related('period', 'employee')
-        return Response(self.get_serializer(reports, many=True).data)
+        return self.report_list_response(Report.objects.all())
 
     @action(detail=False, methods=['get'], url_path='export-pdf')
     def export_pdf(self, request):
@@ -506,73 +824,9 @@ class ReportViewSet(viewsets.ModelViewSet):
         if supervisor_id:
             queryset = queryset.filter(employee__supervisor_id=supervisor_id)
 
-        # Generate PDF
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18)
-        elements = []
-        styles = getSampleStyleSheet()
-
-        # Custom styles
-        title_style = ParagraphStyle('CustomTitle', parent=styles['Heading1'], fontSize=18, spaceAfter=20)
-        heading_style = ParagraphStyle('CustomHeading', parent=styles['Heading2'], fontSize=12, spaceBefore=15, spaceAfter=10)
-        normal_style = styles['Normal']
-
-        # Title
-        elements.append(Paragraph("Gridlog Weekly Reports Export", title_style))
-        elements.append(Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}", normal_style))
-        elements.append(Spacer(1, 20))
-
-        # Filter info
-        filter_info = []
-        if start_date:
-            filter_info.append(f"From: {start_date}")
-        if end_date:
-            filter_info.append(f"To: {end_date}")
-        if filter_info:
-            elements.append(Paragraph(f"Filters: {', '.join(filter_info)}", normal_style))
-            elements.append(Spacer(1, 10))
-
-        elements.append(Paragraph(f"Total Reports: {queryset.count()}", normal_style))
-        elements.append(Spacer(1, 20))
-
-        # Table data
-        table_data = [['Employee', 'Period', 'Status', 'Rating', 'Submitted']]
-
-        for report in queryset[:500]:  # Limit to 500 for performance
-            period_str = f"{report.period.start_date} - {report.period.end_date}"
-            status_str = report.get_status_display()
-            rating_str = report.get_progress_rating_display() or 'N/A'
-            submitted_str = report.submitted_at.strftime('%Y-%m-%d %H:%M') if report.submitted_at else 'Not submitted'
-
-            table_data.append([
-                report.employee.full_name,
-                period_str,
-                status_str,
-                rating_str,
-                submitted_str
-            ])
-
-        # Create table
-        table = Table(table_data, colWidths=[2*inch, 1.5*inch, 1*inch, 1*inch, 1.2*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a237e')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f5')]),
-        ]))
-
-        elements.append(table)
-        doc.build(elements)
-
-        # Return PDF response
-        buffer.seek(0)
-        response = HttpResponse(buffer.getvalue(), content_type='application/pdf')
+        # ReportLab is loaded on first export, not by every worker at startup
+        from .exports import reports_pdf
+        response = HttpResponse(reports_pdf(queryset, start_date, end_date), content_type='application/pdf')
         response['Content-Disposition'] = f'attachment; filename="gridlog_reports_{datetime.now().strftime("%Y%m%d")}.pdf"'
         return response
 
@@ -600,25 +854,8 @@ class ReportViewSet(viewsets.ModelViewSet):
         if supervisor_id:
             queryset = queryset.filter(employee__supervisor_id=supervisor_id)
 
-        # Generate CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(['Employee', 'Email', 'Reporting Period', 'Status', 'Rating', 'Submitted At', 'Accomplishments', 'Goals Next Week', 'Blockers'])
-
-        for report in queryset[:1000]:  # Limit for stability
-            writer.writerow([
-                report.employee.full_name,
-                report.employee.email,
-                f"{report.period.start_date} to {report.period.end_date}",
-                report.get_status_display(),
-                report.get_progress_rating_display() or 'N/A',
-                report.submitted_at.strftime('%Y-%m-%d %H:%M') if report.submitted_at else 'N/A',
-                report.accomplishments[:100] + '...' if len(report.accomplishments) > 100 else report.accomplishments,
-                report.goals_next_week[:100] + '...' if len(report.goals_next_week) > 100 else report.goals_next_week,
-                report.blockers[:100] + '...' if len(report.blockers) > 100 else report.blockers
-            ])
-
-        response = HttpResponse(output.getvalue(), content_type='text/csv')
+        from .exports import reports_csv
+        response = HttpResponse(reports_csv(queryset), content_type='text/csv')
         response['Content-Disposition'] = f'attachment; filename="gridlog_reports_{datetime.now().strftime("%Y%m%d")}.csv"'
         return response
 
@@ -631,38 +868,79 @@ class ReportViewSet(viewsets.ModelViewSet):
         if request.user.role != User.Role.ADMIN:
             return Response({"error": "Only admins can view organization stats"}, status=status.HTTP_403_FORBIDDEN)
 
+        stats = dashboard_cache.cached('organization-stats', request.user, self.organization_stats_payload)
+        if stats is None:
+            return Response({"error": "No active reporting period"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(stats)
+
+    def organization_stats_payload(self):
+        """None while no period is open"""
         current_period = ReportingPeriod.objects.filter(is_closed=False).first()
         if not current_period:
-            return Response({"error": "No active reporting period"}, status=status.HTTP_404_NOT_FOUND)
+            return None
 
         total_employees = User.objects.filter(role=User.Role.EMPLOYEE, is_active=True).count()
-        submitted_count = Report.objects.filter(period=current_period, status__in=[Report.Status.SUBMITTED, Report.Status.REVIEWED]).count()
-        draft_count = Report.objects.filter(period=current_period, status=Report.Status.DRAFT).count()
-        not_started_count = total_employees - (submitted_count + draft_count)
+        # Every active employee has a report row per period (Not Started
+        # until they write it), so each count is a (period, status) filter;
+        # rows of deactivated employees stay behind and are left out
+        counts = Report.objects.filter(
+            period=current_period, employee__role=User.Role.EMPLOYEE, employee__is_active=True
+        ).aggregate(
+            submitted=Count('id', filter=Q(status__in=[Report.Status.SUBMITTED, Report.Status.REVIEWED])),
+            draft=Count('id', filter=Q(status=Report.Status.DRAFT)),
+            not_started=Count('id', filter=Q(status=Report.Status.NOT_STARTED))
+        )
+        submitted_count = counts['submitted']
+        draft_count = counts['draft']
+        not_started_count = counts['not_started']
 
         submission_rate = (submitted_count / total_employees * 100) if total_employees > 0 else 0
 
         # Weekly trend for last 4 periods
+        last_4_periods = list(ReportingPeriod.objects.all().order_by('-start_date')[:4])
+        submitted_by_period = dict(
+            Report.objects.filter(
+                period__in=last_4_periods,
+                status__in=[Report.Status.SUBMITTED, Report.Status.REVIEWED]
+            ).values('period').annotate(n=Count('id')).values_list('period', 'n')
+        )
         trend = []
-        last_4_periods = ReportingPeriod.objects.all().order_by('-start_date')[:4]
         for p in reversed(last_4_periods):
-            p_submitted = Report.objects.filter(period=p, status__in=[Report.Status.SUBMITTED, Report.Status.REVIEWED]).count()
+            p_submitted = submitted_by_period.get(p.id, 0)
             p_rate = (p_submitted / total_employees * 100) if total_employees > 0 else 0
             trend.append({
                 'period': str(p),
                 'rate': round(p_rate, 1)
             })
 
-        return Response({
+        return {
             'totalEmployees': total_employees,
             'submittedCount': submitted_count,
             'submissionRate': round(submission_rate, 2),
             'draftCount': draft_count,
-            'notStartedCount': max(0, not_started_count),
+            'notStartedCount': not_started_count,
             'trend': trend,
             'period': str(current_period)
-        })
-    
+        }
+
+    @action(detail=False, methods=['get'], url_path='dashboard-cache-stats')
+    def dashboard_cache_stats(self, request):
+        """
+        Hit rate of the dashboard response cache per endpoint over the last
+        `hours` hours (default 24), across all web processes
+        """
+        if request.user.role != User.Role.ADMIN:
+            return Response({"error": "Only admins can view dashboard cache stats"}, status=status.HTTP_403_FORBIDDEN)
+        try:
+            hours = int(request.query_params.get('hours', 24))
+        except ValueError:
+            return Response({"error": "hours must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+        if not 1 <= hours <= 24 * 7:
+            return Response({"error": "hours must be between 1 and 168"}, status=status.HTTP_400_BAD_REQUEST)
+
+        dashboard_cache.flush_stats()
+        return Response({'hours': hours, 'endpoints': dashboard_cache.hit_rates(hours)})
+
 
 
 class CommentViewSet(viewsets.ModelViewSet):
@@ -677,13 +955,15 @@ class CommentViewSet(viewsets.ModelViewSet):
         user = self.request.user
         if user.role == User.Role.EMPLOYEE:
             # Employees can see comments on their own reports
-            return Comment.objects.filter(report__employee=user).select_related('author', 'report')
+            qs = Comment.objects.filter(report__employee=user)
         elif user.role == User.Role.SUPERVISOR:
             # Supervisors can see comments on reports from their team members
-            return Comment.objects.filter(
-                report__employee__supervisor=user
-            ).select_related('author', 'report')
-        return Comment.objects.all().select_related('author', 'report')
+            qs = Comment.objects.filter(report__employee__supervisor=user)
+        else:
+            qs = Comment.objects.all()
+        return qs.select_related('author', 'report').prefetch_related(
+            Prefetch('replies', queryset=Comment.objects.select_related('author'))
+        )
     
     def perform_create(self, serializer):
         report_id = self.request.data.get('report')
@@ -695,10 +975,10 @@ class CommentViewSet(viewsets.ModelViewSet):
         # Check if user can comment on this report
         if self.request.user.role == User.Role.EMPLOYEE:
             if report.employee != self.request.user:
-                raise permissions.PermissionDenied("You can only comment on your own reports")
+                raise PermissionDenied("You can only comment on your own reports")
         elif self.request.user.role == User.Role.SUPERVISOR:
             if report.employee.supervisor != self.request.user:
-                raise permissions.PermissionDenied("You can only comment on reports from your team members")
+                raise PermissionDenied("You can only comment on reports from your team members")
         
         # Check parent comment if provided
         parent_id = self.request.data.get('parent')
@@ -712,7 +992,7 @@ class CommentViewSet(viewsets.ModelViewSet):
                 raise serializers.ValidationError({"parent": "Parent comment not found"})
         
         with transaction.atomic():
-            serializer.save(author=self.request.user)
+            serializer.save(author=self.request.user, report=report)
             comment = serializer.instance
             
             # Log the comment in audit log
@@ -726,8 +1006,56 @@ class CommentViewSet(viewsets.ModelViewSet):
                 }
             )
             
-            # Trigger notification after transaction commits
-            from notifications.tasks import send_comment_notification
-            transaction.on_commit(lambda: send_comment_notification.delay(comment.id))
+            # Notify after the transaction commits; comments in quick
+            # succession share one notification and one email
+            from notifications.dispatch import notify_comment_added
+            transaction.on_commit(lambda: notify_comment_added(comment), robust=True)
         
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
\ No newline at end of file
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+# Polled by every dashboard, so served by async views (config/async_api.py)
+# that don't hold a worker thread under ASGI; routed ahead of the viewsets
+
+@async_api_view
+async def dashboard_stats(request):
+    """
+    PRD section 5.2 - Employee Portal & section 5.3 - Supervisor Dashboard
+    Returns counts for reports by status for the current user's scope
+    """
+    # Only the unfiltered counts every dashboard loads are cached
+    filtered = any(request.GET.get(param) for param in ('start_date', 'end_date', 'employee'))
+    if not filtered:
+        key, stats = await sync_to_async(dashboard_cache.lookup)('dashboard-stats', request.user)
+        if stats is not dashboard_cache.MISSING:
+            return stats
+
+    queryset = scoped_reports(request.user, request.GET).order_by()
+
+    # "myReports" is the user's own reports for employees and, for
+    # supervisors and admins, every report in scope
+    started = ~Q(status=Report.Status.NOT_STARTED)
+    if request.user.role == User.Role.EMPLOYEE:
+        started &= Q(employee=request.user)
+
+    stats = await queryset.aaggregate(
+        myReports=Count('id', filter=started),
+        pendingReview=Count('id', filter=Q(status=Report.Status.SUBMITTED)),
+        reviewed=Count('id', filter=Q(status=Report.Status.REVIEWED)),
+        draft=Count('id', filter=Q(status=Report.Status.DRAFT)),
+    )
+    if not filtered:
+        await sync_to_async(dashboard_cache.store)(key, stats)
+    return stats
+
+
+@async_api_view
+async def current_period(request):
+    """
+    PRD section 6.3 - Reporting Period Rules
+    Returns the open reporting period reports are currently written for
+    """
+    period = await ReportingPeriod.objects.filter(is_closed=False).afirst()
+    if period is None:
+        return error_response("No active reporting period", status.HTTP_404_NOT_FOUND)
+    return ReportingPeriodSerializer(period).data
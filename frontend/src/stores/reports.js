@@ -128,6 +128,23 @@ export const useReportsStore = defineStore('reports', {
       }
     },
 
+    async autosaveReport(id, changes, version) {
+      try {
+        const response = await api.patch(`/reports/${id}/autosave/`, { ...changes, version })
+        const index = this.reports.findIndex(r => r.id === id)
+        if (index !== -1) {
+          Object.assign(this.reports[index], changes, {
+            status: response.data.status,
+            updated_at: response.data.version
+          })
+        }
+        return response.data
+      } catch (error) {
+        this.error = error.response?.data || 'Failed to autosave report'
+        throw error
+      }
+    },
+
     async deleteReport(id) {
       try {
         await api.delete(`/reports/${id}/`)
@@ -173,6 +190,28 @@ export const useReportsStore = defineStore('reports', {
       }
     },
 
+    async batchReview(ids) {
+      try {
+        const response = await api.post('/reports/batch-review/', { report_ids: ids })
+        this.fetchPendingApproval() // Refresh pending reports after review
+        return response.data
+      } catch (error) {
+        this.error = error.response?.data?.error || 'Failed to review reports'
+        throw error
+      }
+    },
+
+    async batchRequestRevision(ids, comment) {
+      try {
+        const response = await api.post('/reports/batch-request-revision/', { report_ids: ids, comment })
+        this.fetchPendingApproval() // Refresh pending reports
+        return response.data
+      } catch (error) {
+        this.error = error.response?.data?.error || 'Failed to request revisions'
+        throw error
+      }
+    },
+
     async resetToDraft(id) {
       try {
         const response = await api.post(`/reports/${id}/reset-to-draft/`)
@@ -8,6 +8,7 @@ const { mockApi } = vi.hoisted(() => {
       get: vi.fn(),
       post: vi.fn(),
       put: vi.fn(),
+      patch: vi.fn(),
       delete: vi.fn()
     }
   }
@@ -201,6 +202,35 @@ describe('Reports Store', () => {
       expect(store.reports[0].title).toBe('New Title')
     })
 
+    it('should autosave only the changed fields', async () => {
+      const store = useReportsStore()
+      store.reports = [{ id: 1, blockers: '', status: 'draft', updated_at: 'v1' }]
+
+      mockApi.patch.mockResolvedValue({
+        data: { id: 1, status: 'draft', saved_fields: ['blockers'], version: 'v2' }
+      })
+
+      await store.autosaveReport(1, { blockers: 'Waiting on access' }, 'v1')
+
+      expect(mockApi.patch).toHaveBeenCalledWith('/reports/1/autosave/', {
+        blockers: 'Waiting on access',
+        version: 'v1'
+      })
+      expect(store.reports[0].blockers).toBe('Waiting on access')
+      expect(store.reports[0].updated_at).toBe('v2')
+    })
+
+    it('should review several reports in one request', async () => {
+      const store = useReportsStore()
+      mockApi.post.mockResolvedValue({ data: { updated: [1, 2], skipped: [] } })
+      mockApi.get.mockResolvedValue({ data: [] })
+
+      const result = await store.batchReview([1, 2])
+
+      expect(mockApi.post).toHaveBeenCalledWith('/reports/batch-review/', { report_ids: [1, 2] })
+      expect(result.updated).toEqual([1, 2])
+    })
+
     it('should delete a report', async () => {
       const store = useReportsStore()
       store.reports = [
@@ -22,7 +22,7 @@ Start-Process powershell -ArgumentList "-NoExit", "-Command", "cd $backendPath;
 
 # Start Celery Worker
 Write-Host "Starting Celery worker..." -ForegroundColor Cyan
-Start-Process powershell -ArgumentList "-NoExit", "-Command", "cd $backendPath; .\.venv\Scripts\python.exe -m celery -A config worker -l INFO -Q default,periodic -P solo"
+Start-Process powershell -ArgumentList "-NoExit", "-Command", "cd $backendPath; .\.venv\Scripts\python.exe -m celery -A config worker -l INFO -Q interactive,default,periodic -P solo"
 
 # Start Celery Beat
 Write-Host "Starting Celery beat scheduler..." -ForegroundColor Cyan
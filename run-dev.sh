@@ -13,7 +13,7 @@ celery -A config beat -l INFO --scheduler django_celery_beat.schedulers:Database
 
 # Start Celery worker
 echo "Starting Celery worker..."
-celery -A config worker -l INFO -Q default,periodic &
+celery -A config worker -l INFO -Q interactive,default,periodic &
 
 # Run Django development server
 echo "Starting Django development server..."